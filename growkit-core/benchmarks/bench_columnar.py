@@ -0,0 +1,65 @@
+"""
+Benchmark for the columnar planting storage.
+
+Compares memory and validation time of a dense bed held as a list of Planting
+models against the same bed as a ColumnarBed, once for a well-spaced bed and
+once for a crowded one where most plantings conflict (the vectorized path
+still has to build a Planting for every planting it reports). Run with:
+
+    uv run --extra columnar python benchmarks/bench_columnar.py
+"""
+
+import time
+import tracemalloc
+
+from bench_spacing import make_dense_bed
+
+from growkit_core.columnar import ColumnarBed
+from growkit_core.validators import validate_bed_boundaries, validate_spacing_conflicts
+
+SIZES = [1000, 10000, 50000]
+
+
+def measure(build):
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def validate(bed) -> None:
+    validate_spacing_conflicts(bed)
+    validate_bed_boundaries(bed)
+
+
+def main() -> None:
+    print(
+        f"{'bed':>8} {'plantings':>10} {'models (MB)':>12} {'columnar (MB)':>14} "
+        f"{'models (ms)':>12} {'columnar (ms)':>14}"
+    )
+    for label, spacing in (("spaced", 0.08), ("crowded", 0.1)):
+        for n in SIZES:
+            run(label, n, spacing)
+
+
+def run(label: str, n: int, spacing: float) -> None:
+    bed, bed_size = measure(lambda: make_dense_bed(n))
+    for p in bed.plantings:
+        p.spacing = spacing
+    columnar, columnar_size = measure(lambda: ColumnarBed.from_bed(bed))
+    print(
+        f"{label:>8} {n:>10} {bed_size / 2**20:12.1f} "
+        f"{columnar_size / 2**20:14.1f} {timed(validate, bed) * 1e3:12.1f} "
+        f"{timed(validate, columnar) * 1e3:14.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark for the on-disk garden formats.
+
+Compares encode/decode time and size of the indented JSON written by
+save_garden against the compressed format (compact JSON, raw or
+zlib-compressed at a few levels). Run with:
+
+    uv run python benchmarks/bench_io.py
+"""
+
+import random
+import time
+from datetime import date, timedelta
+
+from growkit_core.io import decode_compressed, encode_compressed
+from growkit_core.models import (
+    AgentCommentary,
+    Bed,
+    Dimensions,
+    Garden,
+    GardenTask,
+    Planting,
+)
+
+SPECIES = ["Lettuce", "Carrot", "Radish", "Kale", "Beet", "Onion", "Spinach"]
+REPEATS = 5
+
+
+def make_garden(beds: int, plantings_per_bed: int, tasks: int, seed: int = 0) -> Garden:
+    rng = random.Random(seed)
+    start = date(2025, 3, 1)
+    return Garden(
+        name="Bulk Garden",
+        beds=[
+            Bed(
+                name=f"Bed {b}",
+                position=(b * 2.0, 0.0),
+                dimensions=Dimensions(width=1.2, length=10.0),
+                plantings=[
+                    Planting(
+                        species=rng.choice(SPECIES),
+                        position=(rng.uniform(0, 1.2), rng.uniform(0, 10)),
+                        spacing=0.1,
+                        planted_on=start + timedelta(days=rng.randint(0, 60)),
+                    )
+                    for _ in range(plantings_per_bed)
+                ],
+            )
+            for b in range(beds)
+        ],
+        tasks=[
+            GardenTask(
+                title=f"Task {t}",
+                target_date=start + timedelta(days=rng.randint(0, 365)),
+            )
+            for t in range(tasks)
+        ],
+        agent_comments=[AgentCommentary(comment="Looks good.") for _ in range(50)],
+    )
+
+
+def best_of(fn, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    garden = make_garden(beds=50, plantings_per_bed=200, tasks=2000)
+    encoders = {
+        "json (indent=2)": (
+            lambda g: g.model_dump_json(indent=2).encode("utf-8"),
+            lambda data: Garden.model_validate_json(data),
+        ),
+        "compact raw": (
+            lambda g: encode_compressed(g, compression_level=0),
+            decode_compressed,
+        ),
+        "compact zlib-1": (
+            lambda g: encode_compressed(g, compression_level=1),
+            decode_compressed,
+        ),
+        "compact zlib-6": (
+            lambda g: encode_compressed(g, compression_level=6),
+            decode_compressed,
+        ),
+    }
+    print(f"{'format':<18} {'size (KB)':>10} {'encode (ms)':>12} {'decode (ms)':>12}")
+    for name, (encode, decode) in encoders.items():
+        data = encode(garden)
+        print(
+            f"{name:<18} {len(data) / 1024:10.1f} "
+            f"{best_of(encode, garden) * 1e3:12.1f} {best_of(decode, data) * 1e3:12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark for validate_spacing_conflicts.
+
+Compares the grid-indexed validator against the previous all-pairs loop on
+beds of increasing size. Run with:
+
+    uv run python benchmarks/bench_spacing.py
+"""
+
+import random
+import time
+from math import dist
+
+from growkit_core.models import Bed, Dimensions, Planting
+from growkit_core.validators import validate_spacing_conflicts
+
+SIZES = [250, 500, 1000, 2000, 4000, 8000, 16000]
+ALL_PAIRS_LIMIT = 4000
+
+
+def make_dense_bed(n: int, spacing: float = 0.1, seed: int = 0) -> Bed:
+    """Plug plantings on a jittered grid at roughly their own spacing."""
+    rng = random.Random(seed)
+    per_row = max(1, int(n**0.5))
+    plantings = [
+        Planting(
+            species="Lettuce",
+            position=(
+                (i % per_row) * spacing + rng.uniform(-0.01, 0.01),
+                (i // per_row) * spacing + rng.uniform(-0.01, 0.01),
+            ),
+            spacing=spacing,
+        )
+        for i in range(n)
+    ]
+    side = per_row * spacing + spacing
+    return Bed(
+        name="Market Bed",
+        dimensions=Dimensions(width=side, length=side),
+        plantings=plantings,
+    )
+
+
+def all_pairs_spacing_conflicts(bed: Bed):
+    conflicts = []
+    for i, p1 in enumerate(bed.plantings):
+        for j, p2 in enumerate(bed.plantings):
+            if i >= j:
+                continue
+            min_distance = max(p1.spacing or 0, p2.spacing or 0)
+            if dist(p1.position, p2.position) < min_distance:
+                conflicts.append((p1, p2))
+    return conflicts
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(
+        f"{'plantings':>10} {'grid (s)':>10} {'us/planting':>12} {'all-pairs (s)':>14}"
+    )
+    for n in SIZES:
+        bed = make_dense_bed(n)
+        grid_time = timed(validate_spacing_conflicts, bed)
+        pairs_time = (
+            f"{timed(all_pairs_spacing_conflicts, bed):14.3f}"
+            if n <= ALL_PAIRS_LIMIT
+            else f"{'-':>14}"
+        )
+        print(f"{n:>10} {grid_time:10.4f} {grid_time / n * 1e6:12.2f} {pairs_time}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Synthetic gardens for the benchmark suite.
+
+Gardens are deterministic for a given scale and seed and pass
+validate_garden, so validated mutations can be timed on them. Every bed keeps
+a free strip at its far end (see free_spot) for plantings added during a
+benchmark.
+"""
+
+import random
+from datetime import date, timedelta
+from math import ceil
+from typing import Dict, NamedTuple, Tuple
+
+from growkit_core.models import (
+    AgentCommentary,
+    Bed,
+    Dimensions,
+    Garden,
+    GardenTask,
+    Planting,
+)
+
+SPECIES = ["Lettuce", "Carrot", "Radish", "Kale", "Beet", "Onion", "Spinach"]
+PITCH = 0.1  # distance between neighbouring plantings
+SPACING = 0.08
+COLUMNS = 10  # plantings per row across a bed
+BED_WIDTH = 1.2
+BED_GAP = 0.8
+FREE_STRIP = 1.0  # meters left empty at the end of each bed
+
+
+class Scale(NamedTuple):
+    beds: int
+    plantings_per_bed: int
+    tasks: int
+
+
+SCALES: Dict[str, Scale] = {
+    "small": Scale(beds=5, plantings_per_bed=20, tasks=20),
+    "medium": Scale(beds=50, plantings_per_bed=200, tasks=500),
+    "large": Scale(beds=200, plantings_per_bed=500, tasks=5000),
+}
+
+
+def bed_length(plantings: int) -> float:
+    return ceil(plantings / COLUMNS) * PITCH + FREE_STRIP
+
+
+def free_spot(bed: Bed) -> Tuple[float, float]:
+    """A position in the bed's free strip, clear of the generated plantings."""
+    return BED_WIDTH / 2, bed.dimensions.length - FREE_STRIP / 2
+
+
+def make_garden(scale: Scale, seed: int = 0) -> Garden:
+    rng = random.Random(seed)
+    # Tasks are dated after the garden's creation so they validate.
+    start = date.today() + timedelta(days=1)
+    beds = []
+    for b in range(scale.beds):
+        plantings = [
+            Planting(
+                species=rng.choice(SPECIES),
+                position=(
+                    (i % COLUMNS + 0.5) * PITCH,
+                    (i // COLUMNS + 0.5) * PITCH,
+                ),
+                spacing=SPACING,
+                planted_on=start + timedelta(days=rng.randint(0, 30)),
+            )
+            for i in range(scale.plantings_per_bed)
+        ]
+        beds.append(
+            Bed(
+                name=f"Bed {b}",
+                position=(b * (BED_WIDTH + BED_GAP), 0.0),
+                dimensions=Dimensions(
+                    width=BED_WIDTH, length=bed_length(scale.plantings_per_bed)
+                ),
+                plantings=plantings,
+            )
+        )
+    tasks = []
+    for t in range(scale.tasks):
+        bed = rng.choice(beds)
+        planting = rng.choice(bed.plantings) if bed.plantings else None
+        tasks.append(
+            GardenTask(
+                title=f"Task {t}",
+                target_date=start + timedelta(days=rng.randint(31, 365)),
+                related_bed_id=bed.id,
+                related_planting_id=planting.id if planting else None,
+            )
+        )
+    return Garden(
+        name=f"Benchmark garden {scale.beds}x{scale.plantings_per_bed}",
+        beds=beds,
+        tasks=tasks,
+        agent_comments=[AgentCommentary(comment="Looks good.") for _ in range(10)],
+    )
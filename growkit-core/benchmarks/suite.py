@@ -0,0 +1,387 @@
+"""
+Benchmark suite for growkit-core's hot paths.
+
+Times validation (whole garden and each sub-validator), every api mutator,
+loading and saving, schema generation and the ViewGarden encoding on the
+synthetic gardens from generators.py, and writes the results as JSON so runs
+from different commits can be compared. Run with:
+
+    uv run python benchmarks/suite.py run [--scale small,medium] [-k FILTER]
+    uv run python benchmarks/suite.py compare BASE.json NEW.json
+
+Results go to benchmarks/results/<commit>.json unless -o is given. compare
+exits with status 1 if any benchmark's median got slower than --threshold.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from generators import SCALES, free_spot, make_garden
+
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    AutoPlacePlantingsParams,
+    CreateGardenParams,
+    MoveBedParams,
+    PlacementRequest,
+    RemoveBedParams,
+    RemovePlantingParams,
+    UpdateBedDimensionsParams,
+    UpdateGardenMetadataParams,
+    UpdateTaskStatusParams,
+    add_bed,
+    add_planting,
+    add_task,
+    apply_batch,
+    auto_place_plantings,
+    create_garden,
+    move_bed,
+    remove_bed,
+    remove_planting,
+    update_bed_dimensions,
+    update_garden_metadata,
+    update_task_status,
+)
+from growkit_core.history import snapshot
+from growkit_core.io import GardenFormat, load_garden, save_garden
+from growkit_core.models import Garden, TaskStatus
+from growkit_core.schema import generate_garden_schema
+from growkit_core.validators import (
+    validate_bed_overlaps,
+    validate_garden,
+    validate_garden_boundaries,
+    validate_garden_spacing,
+    validate_task_dates,
+)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+REPEAT = 7
+DEFAULT_SCALES = ["small", "medium"]
+
+
+class Case(NamedTuple):
+    name: str
+    # Untimed; turns the scale's garden into the argument of `run`.
+    setup: Callable[[Garden], Any]
+    run: Callable[[Any], Any]
+    # False for benchmarks that do not depend on the garden's size.
+    scaled: bool = True
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, setup: Callable[[Garden], Any] = lambda g: g, scaled=True):
+    def register(run: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        CASES.append(Case(name, setup, run, scaled))
+        return run
+
+    return register
+
+
+def editable(garden: Garden) -> Garden:
+    """A copy of `garden` with its id index and validator state already built."""
+    copy = snapshot(garden)
+    apply_batch(copy, [])
+    return copy
+
+
+# ---------- Validation ----------
+
+case("validate_garden")(validate_garden)
+case("validate_garden_spacing")(validate_garden_spacing)
+case("validate_garden_boundaries")(validate_garden_boundaries)
+case("validate_bed_overlaps")(validate_bed_overlaps)
+case("validate_task_dates")(validate_task_dates)
+
+
+# ---------- Mutators ----------
+
+
+@case("create_garden", scaled=False)
+def _(garden):
+    create_garden(CreateGardenParams(name="New", latitude=41.0, longitude=-96.0))
+
+
+@case("add_bed", editable)
+def _(garden):
+    add_bed(garden, AddBedParams(name="New", width=1.0, length=1.0))
+
+
+@case("add_planting", editable)
+def _(garden):
+    bed = garden.beds[0]
+    add_planting(
+        garden,
+        AddPlantingParams(
+            bed_id=bed.id, species="Kale", position=free_spot(bed), spacing=0.1
+        ),
+    )
+
+
+@case("auto_place_plantings", editable)
+def _(garden):
+    auto_place_plantings(
+        garden,
+        AutoPlacePlantingsParams(
+            bed_id=garden.beds[0].id,
+            plantings=[PlacementRequest(species="Basil", spacing=0.2, count=4)],
+        ),
+    )
+
+
+@case("add_task", editable)
+def _(garden):
+    add_task(
+        garden,
+        AddTaskParams(
+            title="Water",
+            target_date=garden.tasks[0].target_date,
+            related_bed_id=garden.beds[0].id,
+        ),
+    )
+
+
+@case("update_task_status", editable)
+def _(garden):
+    update_task_status(
+        garden,
+        UpdateTaskStatusParams(
+            task_id=garden.tasks[-1].id, status=TaskStatus.completed
+        ),
+    )
+
+
+@case("move_bed", editable)
+def _(garden):
+    bed = garden.beds[-1]
+    x, y = bed.position
+    move_bed(garden, MoveBedParams(bed_id=bed.id, new_position=(x + 10.0, y)))
+
+
+@case("update_bed_dimensions", editable)
+def _(garden):
+    bed = garden.beds[0]
+    update_bed_dimensions(
+        garden,
+        UpdateBedDimensionsParams(
+            bed_id=bed.id,
+            width=bed.dimensions.width,
+            length=bed.dimensions.length + 0.5,
+        ),
+    )
+
+
+@case("remove_planting", editable)
+def _(garden):
+    bed = garden.beds[0]
+    remove_planting(
+        garden, RemovePlantingParams(bed_id=bed.id, planting_id=bed.plantings[-1].id)
+    )
+
+
+@case("remove_bed", editable)
+def _(garden):
+    remove_bed(garden, RemoveBedParams(bed_id=garden.beds[-1].id))
+
+
+@case("update_garden_metadata", editable)
+def _(garden):
+    update_garden_metadata(garden, UpdateGardenMetadataParams(name="Renamed"))
+
+
+@case("apply_batch", editable)
+def _(garden):
+    first, last = garden.beds[0], garden.beds[-1]
+    x, y = last.position
+    apply_batch(
+        garden,
+        [
+            AddBedParams(name="New", width=1.0, length=1.0),
+            AddPlantingParams(
+                bed_id=first.id, species="Kale", position=free_spot(first)
+            ),
+            MoveBedParams(bed_id=last.id, new_position=(x + 10.0, y)),
+            AddTaskParams(title="Weed", target_date=garden.tasks[0].target_date),
+            UpdateGardenMetadataParams(name="Batched"),
+        ],
+    )
+
+
+# ---------- Loading and saving ----------
+
+_tmp = tempfile.TemporaryDirectory(prefix="growkit-bench-")
+
+
+def _saved(format: GardenFormat) -> Callable[[Garden], Path]:
+    def setup(garden: Garden) -> Path:
+        path = Path(_tmp.name) / f"garden.{format.value}"
+        save_garden(garden, path, format=format)
+        return path
+
+    return setup
+
+
+for _format in GardenFormat:
+    case(f"save_garden[{_format.value}]")(
+        lambda garden, format=_format: save_garden(
+            garden, Path(_tmp.name) / f"out.{format.value}", format=format
+        )
+    )
+    case(f"load_garden[{_format.value}]", _saved(_format))(load_garden)
+case("load_garden[lazy]", _saved(GardenFormat.json))(
+    lambda path: load_garden(path, lazy=True)
+)
+
+
+# ---------- Schema and viewer ----------
+
+case("model_json_schema", scaled=False)(lambda garden: generate_garden_schema())
+
+try:
+    from growkit_mcp.viewer import encode_garden
+except ImportError:  # growkit-mcp is not installed alongside growkit-core
+    pass
+else:
+    case("view_garden_encoding")(encode_garden)
+
+
+# ---------- Running and comparing ----------
+
+
+def time_case(case: Case, garden: Garden, repeat: int) -> Dict[str, Any]:
+    times = []
+    for _ in range(repeat):
+        argument = case.setup(garden)
+        start = time.perf_counter()
+        case.run(argument)
+        times.append(time.perf_counter() - start)
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "repeat": repeat,
+    }
+
+
+def git_revision() -> str:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return revision + ("-dirty" if dirty else "")
+
+
+def run_suite(
+    scales: List[str], repeat: int, name_filter: Optional[str]
+) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+    ran_unscaled = set()
+    for scale in scales:
+        garden = make_garden(SCALES[scale])
+        for c in CASES:
+            if name_filter and name_filter not in c.name:
+                continue
+            if not c.scaled:
+                if c.name in ran_unscaled:
+                    continue
+                ran_unscaled.add(c.name)
+            key = f"{c.name}@{scale}" if c.scaled else c.name
+            results[key] = time_case(c, garden, repeat)
+            print(f"{key:<40} {results[key]['median'] * 1e3:>10.3f} ms", flush=True)
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scales": {s: SCALES[s]._asdict() for s in scales},
+        },
+        "results": results,
+    }
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> int:
+    regressions = 0
+    print(f"{'benchmark':<40} {'base ms':>10} {'new ms':>10} {'change':>8}")
+    for key, result in new["results"].items():
+        if key not in base["results"]:
+            continue
+        before = base["results"][key]["median"]
+        after = result["median"]
+        change = after / before - 1 if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{key:<40} {before * 1e3:>10.3f} {after * 1e3:>10.3f} "
+            f"{change:>+7.1%}{flag}"
+        )
+    print(
+        f"{regressions} regression(s) over {threshold:.0%} "
+        f"({base['meta']['revision']} -> {new['meta']['revision']})"
+    )
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the suite and save the results")
+    run.add_argument(
+        "--scale",
+        default=",".join(DEFAULT_SCALES),
+        help=f"comma-separated, from {', '.join(SCALES)}",
+    )
+    run.add_argument("--repeat", type=int, default=REPEAT)
+    run.add_argument("-k", dest="name_filter", help="only benchmarks containing this")
+    run.add_argument("-o", "--output", type=Path)
+    diff = commands.add_parser("compare", help="compare two result files")
+    diff.add_argument("base", type=Path)
+    diff.add_argument("new", type=Path)
+    diff.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown (0.1 = 10%%)"
+    )
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        base = json.loads(args.base.read_text())
+        new = json.loads(args.new.read_text())
+        return compare(base, new, args.threshold)
+
+    scales = args.scale.split(",")
+    unknown = [s for s in scales if s not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(unknown)}")
+    report = run_suite(scales, args.repeat, args.name_filter)
+    output = args.output or RESULTS_DIR / f"{report['meta']['revision']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
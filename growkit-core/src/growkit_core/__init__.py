@@ -1,5 +1,76 @@
-from .schema import get_garden_schema
+import sys
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, List, Optional
 
+if TYPE_CHECKING:
+    import argparse
 
-def main() -> None:
+# The command line is only needed by the growkit-core script, so its imports
+# are kept off the path of `import growkit_core.<module>`.
+
+
+def _validate_command(args: "argparse.Namespace") -> int:
+    from .batch import CHUNK_SIZE, read_gardens, validate_to_jsonl
+
+    with ExitStack() as stack:
+        out = (
+            sys.stdout
+            if args.output is None
+            else stack.enter_context(open(args.output, "w"))
+        )
+        stats = validate_to_jsonl(
+            read_gardens(args.path),
+            out,
+            workers=args.workers,
+            chunk_size=args.chunk or CHUNK_SIZE,
+        )
+    print(
+        f"Validated {stats.gardens} gardens in {stats.seconds:.2f}s "
+        f"({stats.gardens_per_second:.1f}/s): {stats.invalid} with issues, "
+        f"{stats.errors} unreadable, {stats.issues} issues in total.",
+        file=sys.stderr,
+    )
+    return 1 if stats.invalid or stats.errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    from pathlib import Path
+
+    from .schema import get_garden_schema, packaged_schema_path, save_garden_schema
+
+    parser = argparse.ArgumentParser(prog="growkit-core")
+    commands = parser.add_subparsers(dest="command")
+    schema = commands.add_parser(
+        "schema", help="print the garden JSON schema (default)"
+    )
+    schema.add_argument(
+        "--write-packaged",
+        action="store_true",
+        help="regenerate the schema file shipped with the package instead",
+    )
+    validate = commands.add_parser(
+        "validate",
+        help="validate many gardens in parallel, writing JSONL results",
+    )
+    validate.add_argument(
+        "path",
+        type=Path,
+        help="a directory of .json/.gkz gardens, a JSONL file, or - for stdin",
+    )
+    validate.add_argument("-w", "--workers", type=int, help="worker processes")
+    validate.add_argument(
+        "-o", "--output", type=Path, help="results file (default: stdout)"
+    )
+    validate.add_argument("--chunk", type=int, help="gardens per worker task")
+    args = parser.parse_args(argv)
+    if args.command == "validate":
+        return _validate_command(args)
+    if args.command == "schema" and args.write_packaged:
+        path = packaged_schema_path()
+        path.parent.mkdir(exist_ok=True)
+        save_garden_schema(path)
+        print(f"Wrote {path}", file=sys.stderr)
+        return 0
     print(get_garden_schema())
+    return 0
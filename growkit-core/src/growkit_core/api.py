@@ -1,9 +1,24 @@
 from datetime import date, datetime, timezone
-from typing import Annotated, Optional, Tuple
+from math import inf
+from typing import (
+    Annotated,
+    Callable,
+    List,
+    Optional,
+    Self,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from growkit_core.history import make_writable
+from growkit_core.incremental import incremental_validator
+from growkit_core.index import garden_index
+from growkit_core.instrumentation import instrumented
 from growkit_core.models import (
     Bed,
     Coordinates,
@@ -14,11 +29,40 @@ from growkit_core.models import (
     TaskStatus,
     UnitLength,
 )
-from growkit_core.validators import GardenValidationException, validate_garden
+from growkit_core.placement import pack_plantings
+from growkit_core.queries import task_index
+from growkit_core.validators import GardenValidationException
 
 NonEmptyStr = Annotated[str, Field(min_length=1)]
 NonZeroPositiveFloat = Annotated[float, Field(gt=0)]
 
+# Meters left between a bed added without a position and the beds before it.
+_PATH_WIDTH = 0.5
+
+
+def _touch_bed(garden: Garden, bed_id: str) -> None:
+    """Marks a bed as changed so the next validation re-checks it."""
+    incremental_validator(garden).invalidate_bed(bed_id)
+
+
+def _bed_position(garden: Garden, bed_id: str) -> int:
+    i = garden_index(garden).bed_position(garden, bed_id)
+    if i is None:
+        raise ValueError(f"No bed found with id '{bed_id}'")
+    return i
+
+
+@instrumented("api.validate")
+def _validate(garden: Garden) -> None:
+    """
+    Raises GardenValidationException if the garden has any issues. Only beds
+    and tasks touched since the last validation are re-checked, and bed
+    overlaps only count for beds added, moved or resized since then.
+    """
+    issues = incremental_validator(garden).validate_changes(garden)
+    if issues:
+        raise GardenValidationException(issues)
+
 
 # ---------- Garden Metadata ----------
 
@@ -28,6 +72,7 @@ class UpdateGardenMetadataParams(BaseModel):
     location: Optional[Coordinates] = None
 
 
+@instrumented("api.update_garden_metadata")
 def update_garden_metadata(
     garden: Garden, params: UpdateGardenMetadataParams
 ) -> Garden:
@@ -49,59 +94,83 @@ class UpdateBedDimensionsParams(BaseModel):
     unit: UnitLength = UnitLength.meters
 
 
+@instrumented("api.update_bed_dimensions")
 def update_bed_dimensions(
     garden: Garden, params: UpdateBedDimensionsParams, validate: bool = True
 ) -> Garden:
-    for bed in garden.beds:
-        if bed.id == params.bed_id:
-            bed.dimensions = Dimensions(
-                width=params.width,
-                length=params.length,
-                depth=params.depth,
-                unit=params.unit,
-            )
-            if validate:
-                issues = validate_garden(garden)
-                if issues:
-                    raise GardenValidationException(issues)
-            return garden
-    raise ValueError(f"No bed found with id '{params.bed_id}'")
+    bed_position = _bed_position(garden, params.bed_id)
+    make_writable(garden, ["beds", bed_position])
+    bed = garden.beds[bed_position]
+    bed.dimensions = Dimensions(
+        width=params.width,
+        length=params.length,
+        depth=params.depth,
+        unit=params.unit,
+    )
+    incremental_validator(garden).footprint_changed(bed)
+    if validate:
+        _validate(garden)
+    return garden
 
 
 class RemovePlantingParams(BaseModel):
     bed_id: NonEmptyStr
-    planting_index: int  # You may want to allow removing by ID in the future
+    planting_index: Optional[int] = None
+    planting_id: Optional[NonEmptyStr] = None  # takes precedence over the index
+
+
+def _planting_position(garden: Garden, params: RemovePlantingParams) -> Tuple[int, int]:
+    bed_position = _bed_position(garden, params.bed_id)
+    bed = garden.beds[bed_position]
+    if params.planting_id is not None:
+        found = garden_index(garden).planting_position(garden, params.planting_id)
+        if found is None or found[0] != bed_position:
+            raise ValueError(
+                f"No planting with id '{params.planting_id}' in bed '{params.bed_id}'"
+            )
+        index = found[1]
+    elif params.planting_index is None:
+        raise ValueError("Either planting_index or planting_id must be provided")
+    else:
+        index = params.planting_index
+    if not 0 <= index < len(bed.plantings):
+        raise IndexError("Invalid planting index")
+    return bed_position, index
 
 
+@instrumented("api.remove_planting")
 def remove_planting(
     garden: Garden, params: RemovePlantingParams, validate: bool = True
 ) -> Garden:
-    for bed in garden.beds:
-        if bed.id == params.bed_id:
-            if 0 <= params.planting_index < len(bed.plantings):
-                # Remove the planting
-                del bed.plantings[params.planting_index]
-                if validate:
-                    issues = validate_garden(garden)
-                    if issues:
-                        raise GardenValidationException(issues)
-                return garden
-            raise IndexError("Invalid planting index")
-    raise ValueError(f"No bed found with id '{params.bed_id}'")
+    bed_position, index = _planting_position(garden, params)
+    make_writable(garden, ["beds", bed_position, "plantings"])
+    bed = garden.beds[bed_position]
+    planting = bed.plantings.pop(index)
+    garden_index(garden).planting_removed(garden, bed_position, index, planting)
+    _touch_bed(garden, bed.id)
+    if validate:
+        _validate(garden)
+    return garden
 
 
 class RemoveBedParams(BaseModel):
     bed_id: str
 
 
+@instrumented("api.remove_bed")
 def remove_bed(
     garden: Garden, params: RemoveBedParams, validate: bool = True
 ) -> Garden:
-    garden.beds = [bed for bed in garden.beds if bed.id != params.bed_id]
+    index = garden_index(garden)
+    position = index.bed_position(garden, params.bed_id)
+    if position is not None:
+        make_writable(garden, ["beds"])
+    while position is not None:
+        bed = garden.beds.pop(position)
+        index.bed_removed(garden, position, bed)
+        position = index.bed_position(garden, params.bed_id)
     if validate:
-        issues = validate_garden(garden)
-        if issues:
-            raise GardenValidationException(issues)
+        _validate(garden)
     return garden
 
 
@@ -110,21 +179,22 @@ class MoveBedParams(BaseModel):
     new_position: Tuple[float, float]
 
 
+@instrumented("api.move_bed")
 def move_bed(garden: Garden, params: MoveBedParams, validate: bool = True) -> Garden:
-    for bed in garden.beds:
-        if bed.id == params.bed_id:
-            bed.position = params.new_position
-            if validate:
-                issues = validate_garden(garden)
-                if issues:
-                    raise GardenValidationException(issues)
-            return garden
-    raise ValueError(f"No bed found with id '{params.bed_id}'")
+    bed_position = _bed_position(garden, params.bed_id)
+    make_writable(garden, ["beds", bed_position])
+    bed = garden.beds[bed_position]
+    bed.position = params.new_position
+    incremental_validator(garden).footprint_changed(bed)
+    if validate:
+        _validate(garden)
+    return garden
 
 
 class AddBedParams(BaseModel):
     name: NonEmptyStr
-    position: Optional[Tuple[float, float]] = (0, 0)
+    # In meters; if omitted the bed is placed to the right of the other beds.
+    position: Optional[Tuple[float, float]] = None
     width: NonZeroPositiveFloat
     length: NonZeroPositiveFloat
     depth: Optional[NonZeroPositiveFloat] = None
@@ -132,11 +202,24 @@ class AddBedParams(BaseModel):
     soil_type: Optional[NonEmptyStr] = None
 
 
+def _free_position(garden: Garden) -> Tuple[float, float]:
+    """A position right of every positioned bed, so a new bed overlaps none."""
+    right = incremental_validator(garden).right_edge(garden)
+    return (0.0, 0.0) if right == -inf else (right + _PATH_WIDTH, 0.0)
+
+
+@instrumented("api.add_bed")
 def add_bed(garden: Garden, params: AddBedParams, validate: bool = True) -> Garden:
+    """
+    Adds a bed at params.position. Without a position the bed no longer goes
+    to (0, 0), where it would overlap any bed already there: it is placed
+    half a meter to the right of the rightmost bed, or at (0, 0) in a garden
+    without positioned beds. Pass position=(0, 0) to get the old placement.
+    """
     new_bed = Bed(
         id=str(uuid4()),
         name=params.name,
-        position=params.position,
+        position=params.position or _free_position(garden),
         dimensions=Dimensions(
             width=params.width,
             length=params.length,
@@ -146,11 +229,12 @@ def add_bed(garden: Garden, params: AddBedParams, validate: bool = True) -> Gard
         soil_type=params.soil_type,
         plantings=[],
     )
-    if validate:
-        issues = validate_garden(garden)
-        if issues:
-            raise GardenValidationException(issues)
+    make_writable(garden, ["beds"])
     garden.beds.append(new_bed)
+    garden_index(garden).bed_added(garden)
+    incremental_validator(garden).footprint_changed(new_bed)
+    if validate:
+        _validate(garden)
     return garden
 
 
@@ -168,6 +252,7 @@ class AddPlantingParams(BaseModel):
     notes: Optional[NonEmptyStr] = None
 
 
+@instrumented("api.add_planting")
 def add_planting(
     garden: Garden, params: AddPlantingParams, validate: bool = True
 ) -> Garden:
@@ -177,29 +262,83 @@ def add_planting(
     If a crop definition exists and includes a timeline,
     corresponding tasks are generated and added to the garden.
     """
-    for bed in garden.beds:
-        if bed.id == params.bed_id:
-            spacing = params.spacing
-
-            new_planting = Planting(
-                id=str(uuid4()),
-                species=params.species,
-                variety=params.variety,
-                planted_on=params.planted_on,
-                expected_harvest=params.expected_harvest,
-                spacing=spacing,
-                position=params.position,
-                notes=params.notes,
-            )
-            bed.plantings.append(new_planting)
-            if validate:
-                issues = validate_garden(garden)
-                if issues:
-                    raise GardenValidationException(issues)
+    bed_position = _bed_position(garden, params.bed_id)
+    make_writable(garden, ["beds", bed_position, "plantings"])
+    bed = garden.beds[bed_position]
+    spacing = params.spacing
 
-            return garden
+    new_planting = Planting(
+        id=str(uuid4()),
+        species=params.species,
+        variety=params.variety,
+        planted_on=params.planted_on,
+        expected_harvest=params.expected_harvest,
+        spacing=spacing,
+        position=params.position,
+        notes=params.notes,
+    )
+    bed.plantings.append(new_planting)
+    garden_index(garden).planting_added(garden, bed_position)
+    _touch_bed(garden, bed.id)
+    if validate:
+        _validate(garden)
 
-    raise ValueError(f"No bed found with id '{params.bed_id}'")
+    return garden
+
+
+class PlacementRequest(BaseModel):
+    species: NonEmptyStr
+    variety: Optional[NonEmptyStr] = None
+    spacing: NonZeroPositiveFloat  # in the bed's unit
+    count: Annotated[int, Field(gt=0)]
+    planted_on: Optional[date] = None
+    expected_harvest: Optional[date] = None
+    notes: Optional[NonEmptyStr] = None
+
+
+class AutoPlacePlantingsParams(BaseModel):
+    bed_id: NonEmptyStr
+    plantings: List[PlacementRequest]
+
+
+@instrumented("api.auto_place_plantings")
+def auto_place_plantings(
+    garden: Garden, params: AutoPlacePlantingsParams, validate: bool = True
+) -> Garden:
+    """
+    Adds `count` plantings of each requested species to the bed, at positions
+    chosen so that they neither conflict with each other or the bed's
+    existing plantings nor fall outside the bed (see pack_plantings). Raises
+    ValueError, leaving the garden unchanged, if they do not all fit.
+    """
+    return apply_batch(garden, auto_place_operations(garden, params), validate=validate)
+
+
+def auto_place_operations(
+    garden: Garden, params: AutoPlacePlantingsParams
+) -> List[AddPlantingParams]:
+    """
+    The AddPlantingParams auto_place_plantings applies, with the positions
+    already chosen. Raises ValueError if they do not all fit.
+    """
+    bed = garden.beds[_bed_position(garden, params.bed_id)]
+    positions = pack_plantings(
+        bed, [(request.spacing, request.count) for request in params.plantings]
+    )
+    return [
+        AddPlantingParams(
+            bed_id=params.bed_id,
+            species=request.species,
+            variety=request.variety,
+            planted_on=request.planted_on,
+            expected_harvest=request.expected_harvest,
+            spacing=request.spacing,
+            position=position,
+            notes=request.notes,
+        )
+        for request, group in zip(params.plantings, positions)
+        for position in group
+    ]
 
 
 # ---------- Garden Creation ----------
@@ -211,6 +350,7 @@ class CreateGardenParams(BaseModel):
     longitude: Optional[float] = None
 
 
+@instrumented("api.create_garden")
 def create_garden(params: CreateGardenParams) -> Garden:
     location = None
     if params.latitude is not None and params.longitude is not None:
@@ -233,6 +373,7 @@ class AddTaskParams(BaseModel):
     related_bed_id: Optional[str] = None
 
 
+@instrumented("api.add_task")
 def add_task(garden: Garden, params: AddTaskParams) -> Garden:
     task = GardenTask(
         id=str(uuid4()),
@@ -243,10 +384,36 @@ def add_task(garden: Garden, params: AddTaskParams) -> Garden:
         related_planting_id=params.related_planting_id,
         related_bed_id=params.related_bed_id,
     )
+    make_writable(garden, ["tasks"])
     garden.tasks.append(task)
+    garden_index(garden).task_added(garden)
+    task_index(garden).task_added(garden)
+    return garden
+
+
+class UpdateTaskStatusParams(BaseModel):
+    task_id: NonEmptyStr
+    status: TaskStatus
+    completed_on: Optional[date] = None  # defaults to today for completed tasks
+
+
+@instrumented("api.update_task_status")
+def update_task_status(garden: Garden, params: UpdateTaskStatusParams) -> Garden:
+    position = garden_index(garden).task_position(garden, params.task_id)
+    if position is None:
+        raise ValueError(f"No task found with id '{params.task_id}'")
+    make_writable(garden, ["tasks", position])
+    task = garden.tasks[position]
+    task.status = params.status
+    if params.status == TaskStatus.completed:
+        task.completed_on = params.completed_on or date.today()
+    else:
+        task.completed_on = None
+    task_index(garden).task_changed(garden, position)
     return garden
 
 
+@instrumented("api.add_planting_task")
 def add_planting_task(
     garden: Garden,
     planting_id: str,
@@ -254,11 +421,8 @@ def add_planting_task(
     target_date: date,
     description: Optional[str] = None,
 ) -> Garden:
-    bed_id = None
-    for bed in garden.beds:
-        if any(p.id == planting_id for p in bed.plantings):
-            bed_id = bed.id
-            break
+    found = garden_index(garden).planting(garden, planting_id)
+    bed_id = found[0].id if found else None
     return add_task(
         garden,
         AddTaskParams(
@@ -269,3 +433,158 @@ def add_planting_task(
             related_bed_id=bed_id,
         ),
     )
+
+
+# ---------- Batches ----------
+
+BatchOperation = Union[
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    MoveBedParams,
+    RemoveBedParams,
+    RemovePlantingParams,
+    UpdateBedDimensionsParams,
+    UpdateGardenMetadataParams,
+]
+
+
+class GardenTransaction:
+    """
+    Applies a sequence of operations to a garden, validates once at the end
+    and restores the garden if an operation or the validation fails.
+
+    Instead of copying the garden up front, each operation records how to
+    undo itself (the removed planting and its position, the previous bed
+    dimensions, ...), so the cost of a transaction is proportional to what
+    it changes. Use it as a context manager, which commits on success and
+    rolls back on an exception, or call commit() / rollback() directly.
+
+    Undo steps are bound to the lists and beds as they are after the
+    operation, since an edit may have swapped in copies of containers shared
+    with a snapshot (see growkit_core.history).
+
+    `created_ids` lists the ids of the beds, plantings and tasks the
+    operations added, in order; it is emptied by a rollback. A rollback also
+    forgets the beds the operations added, moved or resized, so they do not
+    count as moved in the next validation (see validate_changes).
+    """
+
+    def __init__(self, garden: Garden, validate: bool = True):
+        self.garden = garden
+        self.validate = validate
+        self.created_ids: List[str] = []
+        self._undo: List[Callable[[], None]] = []
+        self._touched_beds: Set[str] = set()
+        self._moves = incremental_validator(garden).pending_moves()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def apply(self, operation: BatchOperation) -> None:
+        garden = self.garden
+        if isinstance(operation, AddBedParams):
+            add_bed(garden, operation, validate=False)
+            self.created_ids.append(garden.beds[-1].id)
+            self._undo.append(garden.beds.pop)
+        elif isinstance(operation, AddPlantingParams):
+            add_planting(garden, operation, validate=False)
+            bed = garden.beds[_bed_position(garden, operation.bed_id)]
+            self._touched_beds.add(bed.id)
+            self.created_ids.append(bed.plantings[-1].id)
+            self._undo.append(bed.plantings.pop)
+        elif isinstance(operation, AddTaskParams):
+            add_task(garden, operation)
+            self.created_ids.append(garden.tasks[-1].id)
+            self._undo.append(garden.tasks.pop)
+        elif isinstance(operation, RemovePlantingParams):
+            bed_position, index = _planting_position(garden, operation)
+            planting = garden.beds[bed_position].plantings[index]
+            remove_planting(garden, operation, validate=False)
+            plantings = garden.beds[bed_position].plantings
+            self._touched_beds.add(operation.bed_id)
+            self._undo.append(lambda: plantings.insert(index, planting))
+        elif isinstance(operation, RemoveBedParams):
+            previous = list(garden.beds)
+            remove_bed(garden, operation, validate=False)
+            beds = garden.beds
+
+            def restore() -> None:
+                beds[:] = previous
+
+            self._undo.append(restore)
+        elif isinstance(operation, (MoveBedParams, UpdateBedDimensionsParams)):
+            bed_position = _bed_position(garden, operation.bed_id)
+            before = garden.beds[bed_position]
+            position, dimensions = before.position, before.dimensions
+            if isinstance(operation, MoveBedParams):
+                move_bed(garden, operation, validate=False)
+            else:
+                update_bed_dimensions(garden, operation, validate=False)
+            # The edit may have replaced a bed shared with a snapshot.
+            bed = garden.beds[bed_position]
+            self._touched_beds.add(bed.id)
+            self._undo.append(lambda: self._restore_bed(bed, position, dimensions))
+        elif isinstance(operation, UpdateGardenMetadataParams):
+            name, location = garden.name, garden.location
+            update_garden_metadata(garden, operation)
+            self._undo.append(lambda: self._restore_metadata(name, location))
+        else:
+            raise TypeError(f"Unsupported batch operation: {type(operation).__name__}")
+
+    def commit(self) -> None:
+        """Validates the garden once; on failure rolls back and re-raises."""
+        if self.validate:
+            try:
+                _validate(self.garden)
+            except GardenValidationException:
+                self.rollback()
+                raise
+        self._undo.clear()
+        self._touched_beds.clear()
+        self._moves = incremental_validator(self.garden).pending_moves()
+
+    def rollback(self) -> None:
+        while self._undo:
+            self._undo.pop()()
+        self.created_ids.clear()
+        # Undo steps edit the lists directly; let the indexes and the
+        # incremental validator catch up.
+        garden_index(self.garden).invalidate()
+        task_index(self.garden).invalidate()
+        for bed_id in self._touched_beds:
+            _touch_bed(self.garden, bed_id)
+        self._touched_beds.clear()
+        incremental_validator(self.garden).reset_moves(self._moves)
+
+    def _restore_bed(
+        self,
+        bed: Bed,
+        position: Optional[Tuple[float, float]],
+        dimensions: Dimensions,
+    ) -> None:
+        bed.position, bed.dimensions = position, dimensions
+
+    def _restore_metadata(self, name: str, location: Optional[Coordinates]) -> None:
+        self.garden.name, self.garden.location = name, location
+
+
+@instrumented("api.apply_batch")
+def apply_batch(
+    garden: Garden, operations: Sequence[BatchOperation], validate: bool = True
+) -> Garden:
+    """
+    Applies `operations` in order with a single validation at the end. If
+    any operation raises or the result does not validate, the garden is left
+    exactly as it was and the error is re-raised.
+    """
+    with GardenTransaction(garden, validate=validate) as transaction:
+        for operation in operations:
+            transaction.apply(operation)
+    return garden
@@ -0,0 +1,151 @@
+import os
+import sys
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Deque, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import BaseModel
+
+from growkit_core.io import COMPRESSED_MAGIC, decode_compressed
+from growkit_core.models import Garden
+from growkit_core.validators import GardenValidationIssue, validate_garden
+
+# (source name, raw garden bytes). Workers receive the bytes undecoded, so the
+# parent process never parses a garden.
+RawGarden = Tuple[str, bytes]
+
+GARDEN_SUFFIXES = (".json", ".gkz")
+# Gardens handed to one worker per round trip.
+CHUNK_SIZE = 16
+
+
+class GardenBatchResult(BaseModel):
+    source: str  # file path, or path:line for JSONL input
+    garden_id: Optional[str] = None
+    issues: List[GardenValidationIssue] = []
+    error: Optional[str] = None  # set if the garden could not be parsed
+
+
+class BatchStats(BaseModel):
+    gardens: int = 0
+    invalid: int = 0  # gardens with at least one issue
+    errors: int = 0  # gardens that could not be parsed
+    issues: int = 0
+    seconds: float = 0.0
+
+    @property
+    def gardens_per_second(self) -> float:
+        return self.gardens / self.seconds if self.seconds else 0.0
+
+    def add(self, result: GardenBatchResult) -> None:
+        self.gardens += 1
+        self.issues += len(result.issues)
+        self.invalid += bool(result.issues)
+        self.errors += result.error is not None
+
+
+def read_garden_dir(directory: Path) -> Iterator[RawGarden]:
+    """Yields the .json and .gkz garden files in `directory`, by name."""
+    for path in sorted(Path(directory).iterdir()):
+        if path.suffix in GARDEN_SUFFIXES and path.is_file():
+            yield str(path), path.read_bytes()
+
+
+def read_garden_lines(f: BinaryIO, name: str) -> Iterator[RawGarden]:
+    """Yields one garden per non-blank line of a JSONL stream."""
+    for number, line in enumerate(f, start=1):
+        if line.strip():
+            yield f"{name}:{number}", line
+
+
+def read_gardens(path: Path) -> Iterator[RawGarden]:
+    """
+    Yields raw gardens from a directory of garden files, a JSONL file, or
+    standard input if path is "-".
+    """
+    if str(path) == "-":
+        yield from read_garden_lines(sys.stdin.buffer, "<stdin>")
+    elif Path(path).is_dir():
+        yield from read_garden_dir(Path(path))
+    else:
+        with open(path, "rb") as f:
+            yield from read_garden_lines(f, str(path))
+
+
+def validate_raw_garden(raw: RawGarden) -> GardenBatchResult:
+    source, data = raw
+    try:
+        if data.startswith(COMPRESSED_MAGIC):
+            garden = decode_compressed(data)
+        else:
+            garden = Garden.model_validate_json(data)
+    except (ValueError, zlib.error) as e:
+        return GardenBatchResult(source=source, error=str(e))
+    return GardenBatchResult(
+        source=source, garden_id=garden.id, issues=validate_garden(garden)
+    )
+
+
+def _validate_chunk(chunk: List[RawGarden]) -> List[GardenBatchResult]:
+    return [validate_raw_garden(raw) for raw in chunk]
+
+
+def _chunks(gardens: Iterable[RawGarden], size: int) -> Iterator[List[RawGarden]]:
+    chunk = []
+    for raw in gardens:
+        chunk.append(raw)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_many(
+    gardens: Iterable[RawGarden],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> Iterator[GardenBatchResult]:
+    """
+    Validates raw gardens on a process pool (or the given executor), yielding
+    results in input order. Only a few chunks per worker are
+    in flight at a time, so input is read as fast as it is validated rather
+    than all at once.
+    """
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    in_flight = 4 * (workers or os.cpu_count() or 1)
+    pending: Deque[Future] = deque()
+    try:
+        for chunk in _chunks(gardens, chunk_size):
+            pending.append(executor.submit(_validate_chunk, chunk))
+            if len(pending) >= in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def validate_to_jsonl(
+    gardens: Iterable[RawGarden],
+    out: TextIO,
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> BatchStats:
+    """Writes one GardenBatchResult per line to `out`; returns the totals."""
+    stats = BatchStats()
+    start = time.perf_counter()
+    for result in validate_many(gardens, workers=workers, chunk_size=chunk_size):
+        out.write(result.model_dump_json(exclude_none=True) + "\n")
+        stats.add(result)
+    stats.seconds = time.perf_counter() - start
+    return stats
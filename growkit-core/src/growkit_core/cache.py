@@ -0,0 +1,157 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from growkit_core.models import Bed, Garden, Planting
+from growkit_core.validators import (
+    GardenValidationIssue,
+    bed_boundary_issues,
+    bed_overlap_issue,
+    bed_spacing_issues,
+    task_date_issue,
+    validate_bed_overlaps,
+    validate_task_dates,
+)
+
+# A bed's (spacing issues, boundary issues), or the issues of a task list.
+_Issues = List[GardenValidationIssue]
+_Entry = Union[Tuple[_Issues, _Issues], _Issues]
+
+_BED = b"b"
+_TASKS = b"t"
+
+
+def _digest(kind: bytes, *parts: bytes) -> bytes:
+    h = hashlib.blake2b(kind, digest_size=16)
+    for part in parts:
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.digest()
+
+
+def bed_hash(bed: Bed) -> bytes:
+    """Content hash of everything a bed's own checks depend on."""
+    return _digest(_BED, bed.model_dump_json().encode())
+
+
+def tasks_hash(garden: Garden) -> bytes:
+    """
+    Content hash of the garden's tasks together with what the task checks
+    read from the rest of the garden: its creation date and the planted_on
+    date of each planting a task refers to.
+    """
+    referenced = {t.related_planting_id for t in garden.tasks}
+    plantings: Dict[str, Planting] = {
+        p.id: p for bed in garden.beds for p in bed.plantings if p.id in referenced
+    }
+    planted = sorted(
+        (planting_id, str(planting.planted_on))
+        for planting_id, planting in plantings.items()
+    )
+    return _digest(
+        _TASKS,
+        garden.created_at.date().isoformat().encode(),
+        repr(planted).encode(),
+        b"".join(t.model_dump_json().encode() + b"\n" for t in garden.tasks),
+    )
+
+
+class ValidationCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    issues: int  # issues currently held by the cache
+
+
+class ValidationCache:
+    """
+    Memoizes validate_garden per bed and per task list, keyed by content
+    hash, so repeated validations only re-check beds that changed. Entries
+    are shared by all gardens validated through the same cache, including
+    unrelated gardens with identical beds.
+
+    The cache is a thread-safe LRU bounded both by entry count and by the
+    number of issues it holds, so a few beds with thousands of conflicts
+    cannot crowd out everything else. Returned issues are shared with the
+    cache and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_issues: int = 100_000):
+        self.max_entries = max_entries
+        self.max_issues = max_issues
+        self._entries: "OrderedDict[bytes, Tuple[_Entry, int]]" = OrderedDict()
+        self._issues = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def validate(self, garden: Garden) -> List[GardenValidationIssue]:
+        """Returns the same issues, in the same order, as validate_garden."""
+        spacing: _Issues = []
+        boundary: _Issues = []
+        for bed in garden.beds:
+            key = bed_hash(bed)
+            entry = self._get(key)
+            if entry is None:
+                entry = bed_spacing_issues(bed), bed_boundary_issues(bed)
+                self._put(key, entry, len(entry[0]) + len(entry[1]))
+            spacing.extend(entry[0])
+            boundary.extend(entry[1])
+        overlaps = [bed_overlap_issue(a, b) for a, b in validate_bed_overlaps(garden)]
+        key = tasks_hash(garden)
+        tasks = self._get(key)
+        if tasks is None:
+            tasks = [task_date_issue(t) for t in validate_task_dates(garden)]
+            self._put(key, tasks, len(tasks))
+        return spacing + boundary + overlaps + tasks
+
+    def stats(self) -> ValidationCacheStats:
+        with self._lock:
+            return ValidationCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                issues=self._issues,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._issues = 0
+
+    def _get(self, key: bytes) -> Optional[_Entry]:
+        with self._lock:
+            found = self._entries.get(key)
+            if found is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return found[0]
+
+    def _put(self, key: bytes, entry: _Entry, size: int) -> None:
+        with self._lock:
+            if size > self.max_issues or key in self._entries:
+                return
+            self._entries[key] = entry, size
+            self._issues += size
+            while (
+                len(self._entries) > self.max_entries or self._issues > self.max_issues
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._issues -= evicted
+                self._evictions += 1
+
+
+validation_cache = ValidationCache()
+
+
+def validate_garden_cached(garden: Garden) -> List[GardenValidationIssue]:
+    """validate_garden through the process-wide validation_cache."""
+    return validation_cache.validate(garden)
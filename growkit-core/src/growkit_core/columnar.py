@@ -0,0 +1,323 @@
+"""
+Columnar (structure-of-arrays) storage for the plantings of a dense bed.
+
+Requires numpy, available as the `columnar` extra:
+
+    pip install "growkit-core[columnar]"
+"""
+
+from math import dist, isnan
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "growkit_core.columnar requires numpy; install growkit-core[columnar]"
+    ) from e
+
+from growkit_core.models import Bed, Planting
+
+_UUID_DTYPE = np.dtype((np.void, 16))
+# Candidate pairs are confirmed with math.dist so results match the
+# object-based validators exactly; this slack keeps the numpy prefilter from
+# dropping pairs that sit right on the spacing boundary.
+_PREFILTER_SLACK = 1 + 1e-9
+
+
+def _encode_ids(ids: List[str]) -> np.ndarray:
+    """Packs canonical uuid4 strings into 16 bytes each, else keeps strings."""
+    try:
+        packed = [UUID(i) for i in ids]
+    except ValueError:
+        packed = None
+    if packed is not None and all(str(u) == i for u, i in zip(packed, ids)):
+        return np.frombuffer(b"".join(u.bytes for u in packed), dtype=_UUID_DTYPE)
+    return np.array(ids, dtype=object)
+
+
+def _decode_ids(ids: np.ndarray) -> List[str]:
+    if ids.dtype != _UUID_DTYPE:
+        return ids.tolist()
+    # Hex-format the packed bytes in one pass instead of a UUID per id.
+    digits = ids.tobytes().hex()
+    return [
+        f"{digits[i : i + 8]}-{digits[i + 8 : i + 12]}-{digits[i + 12 : i + 16]}"
+        f"-{digits[i + 16 : i + 20]}-{digits[i + 20 : i + 32]}"
+        for i in range(0, len(digits), 32)
+    ]
+
+
+def _intern(values: List[Optional[str]]) -> Tuple[np.ndarray, List[str]]:
+    """Returns (codes, table); None is stored as code -1."""
+    table: List[str] = []
+    index: Dict[str, int] = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+            continue
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(table)
+            table.append(value)
+        codes[i] = code
+    return codes, table
+
+
+def _dates(values) -> np.ndarray:
+    return np.array(
+        [v if v is not None else "NaT" for v in values], dtype="datetime64[D]"
+    )
+
+
+class ColumnarBed:
+    """
+    A bed whose plantings are stored as parallel numpy arrays instead of a
+    list of Planting models: float64 positions and spacing (NaN for no
+    spacing), datetime64 dates (NaT for none), uuids packed into 16 bytes and
+    species/variety interned into int32 codes. Notes and metadata are kept
+    only for plantings that have them.
+
+    Converts losslessly to and from Bed. The bed's own fields are kept on a
+    planting-less copy of the bed, and `name` and `id` are exposed so the
+    issue builders in validators accept a ColumnarBed as well.
+    """
+
+    def __init__(
+        self,
+        header: Bed,
+        ids: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        spacing: np.ndarray,
+        species: np.ndarray,
+        species_table: List[str],
+        variety: np.ndarray,
+        variety_table: List[str],
+        planted_on: np.ndarray,
+        expected_harvest: np.ndarray,
+        notes: Dict[int, str],
+        metadata: Dict[int, Optional[Dict[str, Any]]],
+    ):
+        self.header = header
+        self.ids = ids
+        self.x = x
+        self.y = y
+        self.spacing = spacing
+        self.species = species
+        self.species_table = species_table
+        self.variety = variety
+        self.variety_table = variety_table
+        self.planted_on = planted_on
+        self.expected_harvest = expected_harvest
+        self.notes = notes
+        self.metadata = metadata
+
+    @classmethod
+    def from_bed(cls, bed: Bed) -> "ColumnarBed":
+        plantings = bed.plantings
+        header = bed.model_copy(update={"plantings": []}).model_copy(deep=True)
+        species, species_table = _intern([p.species for p in plantings])
+        variety, variety_table = _intern([p.variety for p in plantings])
+        positions = np.array([p.position for p in plantings], dtype=np.float64)
+        positions = positions.reshape(-1, 2)
+        return cls(
+            header=header,
+            ids=_encode_ids([p.id for p in plantings]),
+            x=np.ascontiguousarray(positions[:, 0]),
+            y=np.ascontiguousarray(positions[:, 1]),
+            spacing=np.array(
+                [np.nan if p.spacing is None else p.spacing for p in plantings],
+                dtype=np.float64,
+            ),
+            species=species,
+            species_table=species_table,
+            variety=variety,
+            variety_table=variety_table,
+            planted_on=_dates(p.planted_on for p in plantings),
+            expected_harvest=_dates(p.expected_harvest for p in plantings),
+            notes={i: p.notes for i, p in enumerate(plantings) if p.notes is not None},
+            metadata={
+                i: p.metadata for i, p in enumerate(plantings) if p.metadata != {}
+            },
+        )
+
+    @property
+    def id(self) -> str:
+        return self.header.id
+
+    @property
+    def name(self) -> str:
+        return self.header.name
+
+    @property
+    def dimensions(self):
+        return self.header.dimensions
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the numeric columns, excluding interned strings and notes."""
+        arrays = (self.x, self.y, self.spacing, self.species, self.variety)
+        dates = (self.planted_on, self.expected_harvest)
+        return sum(a.nbytes for a in arrays + dates) + (
+            self.ids.nbytes if self.ids.dtype == _UUID_DTYPE else 0
+        )
+
+    def plantings(self, indices: Optional[Sequence[int]] = None) -> List[Planting]:
+        """Materializes the plantings at `indices` (all of them by default)."""
+        if indices is None:
+            indices = range(len(self))
+        idx = np.asarray(indices, dtype=np.intp)
+        species, variety = self.species[idx].tolist(), self.variety[idx].tolist()
+        spacing = self.spacing[idx].tolist()
+        columns = zip(
+            idx.tolist(),
+            _decode_ids(self.ids[idx]),
+            self.x[idx].tolist(),
+            self.y[idx].tolist(),
+            self.planted_on[idx].tolist(),
+            self.expected_harvest[idx].tolist(),
+        )
+        # Every field is set from already-typed columns, so validation is
+        # skipped; the result compares equal to the original planting.
+        return [
+            Planting.model_construct(
+                id=id_,
+                species=self.species_table[species[n]],
+                variety=None if variety[n] < 0 else self.variety_table[variety[n]],
+                planted_on=planted_on,
+                expected_harvest=expected_harvest,
+                position=(x, y),
+                spacing=None if isnan(spacing[n]) else spacing[n],
+                notes=self.notes.get(i),
+                metadata=self.metadata.get(i, {}),
+            )
+            for n, (i, id_, x, y, planted_on, expected_harvest) in enumerate(columns)
+        ]
+
+    def planting(self, i: int) -> Planting:
+        return self.plantings([i])[0]
+
+    def to_bed(self) -> Bed:
+        return self.header.model_copy(update={"plantings": self.plantings()})
+
+    def boundary_violations(self) -> np.ndarray:
+        """Indices of plantings outside (0, 0)..(width, length), in order."""
+        return boundary_violations([self])[0]
+
+    def spacing_conflicts(self) -> List[Tuple[int, int]]:
+        """
+        Sorted (i, j) index pairs, i < j, closer than the larger of their two
+        spacings; the same pairs as spacing_conflict_pairs.
+
+        Plantings are hashed into a grid sized to the largest "typical"
+        spacing and candidate pairs come from a vectorized join against the
+        neighbouring cells. The few plantings with an outsized spacing are
+        instead checked against every planting, so one wide shrub does not
+        blow up the cell size for the whole bed.
+        """
+        # As in the scalar check, a spacing of zero or less reaches nothing.
+        spacing = np.maximum(np.nan_to_num(self.spacing, nan=0.0), 0.0)
+        positive = spacing > 0
+        if not positive.any():
+            return []
+        median = float(np.median(spacing[positive]))
+        large = np.flatnonzero(spacing > 2 * median)
+        small_cell = float(spacing[positive & (spacing <= 2 * median)].max())
+
+        candidates = [self._grid_candidates(small_cell)]
+        if len(large):
+            candidates.append(self._large_candidates(large, spacing))
+        i = np.concatenate([first for first, _ in candidates])
+        j = np.concatenate([second for _, second in candidates])
+        i, j = np.minimum(i, j), np.maximum(i, j)
+        reach = np.maximum(spacing[i], spacing[j])
+        dx, dy = self.x[i] - self.x[j], self.y[i] - self.y[j]
+        d2 = dx * dx + dy * dy
+        outer = d2 < (reach * _PREFILTER_SLACK) ** 2
+        inner = d2 < (reach / _PREFILTER_SLACK) ** 2
+        keep = (i != j) & outer
+        n = len(self)
+        keys = i[keep].astype(np.int64) * n + j[keep]
+        sure = keys[inner[keep]]
+        # Only pairs right at the spacing distance need the exact check.
+        x, y = self.x.tolist(), self.y.tolist()
+        borderline = [
+            key
+            for key in np.setdiff1d(keys, sure).tolist()
+            if dist((x[key // n], y[key // n]), (x[key % n], y[key % n]))
+            < max(spacing[key // n], spacing[key % n])
+        ]
+        keys = np.union1d(sure, np.array(borderline, dtype=np.int64))
+        return [divmod(key, n) for key in keys.tolist()]
+
+    def _grid_candidates(self, cell: float) -> Tuple[np.ndarray, np.ndarray]:
+        cx = np.floor(self.x / cell).astype(np.int64)
+        cy = np.floor(self.y / cell).astype(np.int64)
+        cx -= cx.min() - 1
+        cy -= cy.min() - 1
+        rows = int(cy.max()) + 2
+        keys = cx * rows + cy
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+
+        firsts, seconds = [], []
+        # Half the 3x3 neighbourhood, so each pair of cells is joined once.
+        for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+            target = sorted_keys + dx * rows + dy
+            lo = np.searchsorted(sorted_keys, target, side="left")
+            hi = np.searchsorted(sorted_keys, target, side="right")
+            if dx == 0 and dy == 0:
+                lo = np.maximum(lo, np.arange(len(order)) + 1)
+            counts = np.maximum(hi - lo, 0)
+            total = int(counts.sum())
+            if not total:
+                continue
+            src = np.repeat(np.arange(len(order)), counts)
+            starts = np.cumsum(counts) - counts
+            dst = lo[src] + np.arange(total) - starts[src]
+            firsts.append(order[src])
+            seconds.append(order[dst])
+        if not firsts:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(firsts), np.concatenate(seconds)
+
+    def _large_candidates(
+        self, large: np.ndarray, spacing: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        firsts, seconds = [], []
+        for i in large.tolist():
+            dx, dy = self.x - self.x[i], self.y - self.y[i]
+            reach = spacing[i] * _PREFILTER_SLACK
+            near = np.flatnonzero(dx * dx + dy * dy < reach * reach)
+            firsts.append(np.full(len(near), i, dtype=np.int64))
+            seconds.append(near)
+        return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def boundary_violations(beds: Sequence[ColumnarBed]) -> List[np.ndarray]:
+    """
+    Checks the plantings of all `beds` against their boundaries in one pass
+    and returns, per bed, the indices of plantings outside it. Positions are
+    in their bed's unit, so each bed's extent is broadcast over its plantings
+    as is.
+    """
+    if not beds:
+        return []
+    counts = [len(bed) for bed in beds]
+    width = np.repeat([bed.dimensions.width for bed in beds], counts)
+    length = np.repeat([bed.dimensions.length for bed in beds], counts)
+    x = np.concatenate([bed.x for bed in beds])
+    y = np.concatenate([bed.y for bed in beds])
+    outside = ~((0 <= x) & (x <= width) & (0 <= y) & (y <= length))
+    offsets = np.cumsum([0] + counts)
+    return [
+        np.flatnonzero(outside[start:end])
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
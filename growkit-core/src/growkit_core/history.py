@@ -0,0 +1,186 @@
+"""
+Copy-on-write snapshots of a garden, and undo/redo built on top of them.
+
+A snapshot is a new Garden that shares its beds, plantings and tasks with the
+garden it was taken from, so taking one costs the same no matter how large the
+garden is. From then on neither garden edits a shared container in place:
+growkit_core.api and apply_patch call make_writable() first, which copies only
+the containers along the edited path (the beds list, the one bed being
+changed and its plantings list, ...) and leaves everything else shared.
+
+Gardens that were never snapshotted skip all of this. Code that edits a
+snapshotted garden in place by other means must call make_writable() itself.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Sequence, Tuple, Union
+
+from pydantic import BaseModel
+
+from growkit_core.index import garden_index
+from growkit_core.models import Garden
+from growkit_core.queries import task_index
+from growkit_core.registry import GardenRegistry
+
+PathToken = Union[str, int]
+
+
+class _CopyOnWrite:
+    """The containers a garden has copied for itself since its last snapshot."""
+
+    def __init__(self):
+        self.owned: Dict[int, Any] = {}
+
+
+_states: GardenRegistry[_CopyOnWrite] = GardenRegistry(_CopyOnWrite)
+
+
+def _share(garden: Garden) -> None:
+    # Everything reachable from the garden may now be shared with a snapshot.
+    _states.get(garden).owned = {}
+
+
+def snapshot(garden: Garden) -> Garden:
+    """
+    Returns a copy of the garden that shares all of its structure. Both the
+    garden and the copy stay independently editable; whichever is edited
+    first copies just the parts it changes. Lazy sections of a LazyGarden are
+    loaded so the snapshot does not depend on its source file.
+    """
+    copy = Garden.model_construct(
+        _fields_set=set(garden.model_fields_set),
+        **{name: getattr(garden, name) for name in Garden.model_fields},
+    )
+    _share(garden)
+    _share(copy)
+    return copy
+
+
+def restore(garden: Garden, state: Garden) -> Garden:
+    """
+    Makes `garden` equal to the snapshot `state` in place and returns it. The
+    two share their structure afterwards, so `state` remains usable. The id
+    index and incremental validator notice the swapped lists and beds by
+    themselves; only beds that differ from before are re-validated.
+    """
+    for name in Garden.model_fields:
+        setattr(garden, name, getattr(state, name))
+    _share(garden)
+    _share(state)
+    return garden
+
+
+def _child(parent: Any, token: PathToken) -> Any:
+    if isinstance(parent, BaseModel):
+        if token not in type(parent).model_fields:
+            return None
+        return getattr(parent, token)
+    if isinstance(parent, list):
+        if isinstance(token, str):
+            token = int(token) if token.isdigit() else len(parent)
+        return parent[token] if token < len(parent) else None
+    if isinstance(parent, dict):
+        return parent.get(token)
+    return None
+
+
+def _set_child(parent: Any, token: PathToken, value: Any) -> None:
+    if isinstance(parent, BaseModel):
+        setattr(parent, str(token), value)
+    elif isinstance(parent, list):
+        parent[int(token)] = value
+    else:
+        parent[token] = value
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_copy()
+    return type(value)(value)
+
+
+def make_writable(garden: Garden, path: Sequence[PathToken]) -> None:
+    """
+    Prepares the container at `path` (e.g. ["beds", 2, "plantings"]) for an
+    in-place edit: every list, dict or model along the way that may be shared
+    with a snapshot is replaced by a shallow copy owned by this garden. Stops
+    quietly at a path that does not resolve, leaving the error to the edit.
+    """
+    state = _states.peek(garden)
+    if state is None:
+        return
+    parent: Any = garden
+    for n, token in enumerate(path):
+        child = _child(parent, token)
+        if not isinstance(child, (BaseModel, list, dict)):
+            return
+        if state.owned.get(id(child)) is not child:
+            copy = _copy(child)
+            _set_child(parent, token, copy)
+            state.owned[id(copy)] = copy
+            if isinstance(copy, list):
+                garden_index(garden).list_copied(path[: n + 1], child, copy)
+                if n == 0 and token == "tasks":
+                    task_index(garden).list_copied(child, copy)
+            child = copy
+        parent = child
+
+
+class GardenHistory:
+    """
+    Undo and redo stacks of snapshots for one live garden. Each entry costs
+    only the beds changed after it was taken; the oldest entries are dropped
+    beyond `limit`.
+    """
+
+    def __init__(self, limit: int = 100):
+        self._undo: Deque[Tuple[str, Garden]] = deque(maxlen=limit)
+        self._redo: List[Tuple[str, Garden]] = []
+
+    def checkpoint(self, garden: Garden, label: str = "") -> None:
+        """Records the garden's current state as an undo step."""
+        self.push(snapshot(garden), label)
+
+    def push(self, state: Garden, label: str = "") -> None:
+        """Records a snapshot taken earlier, e.g. just before a successful edit."""
+        self._undo.append((label, state))
+        self._redo.clear()
+
+    def undo(self, garden: Garden) -> str:
+        """Restores the garden to the last checkpoint and returns its label."""
+        if not self._undo:
+            raise ValueError("Nothing to undo")
+        label, state = self._undo.pop()
+        self._redo.append((label, snapshot(garden)))
+        restore(garden, state)
+        return label
+
+    def redo(self, garden: Garden) -> str:
+        """Re-applies the last undone step and returns its label."""
+        if not self._redo:
+            raise ValueError("Nothing to redo")
+        label, state = self._redo.pop()
+        self._undo.append((label, snapshot(garden)))
+        restore(garden, state)
+        return label
+
+    @property
+    def undo_labels(self) -> List[str]:
+        """Labels of the steps undo() would revert, most recent last."""
+        return [label for label, _ in self._undo]
+
+    @property
+    def redo_labels(self) -> List[str]:
+        return [label for label, _ in self._redo]
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+
+_histories: GardenRegistry[GardenHistory] = GardenRegistry(GardenHistory)
+
+
+def garden_history(garden: Garden) -> GardenHistory:
+    """Returns the GardenHistory attached to this garden."""
+    return _histories.get(garden)
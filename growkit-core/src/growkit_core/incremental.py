@@ -0,0 +1,271 @@
+from datetime import date
+from math import inf
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from growkit_core.models import Bed, Garden, GardenTask, Planting
+from growkit_core.registry import GardenRegistry
+from growkit_core.spatial import Rect, RectangleGrid
+from growkit_core.validators import (
+    GardenValidationIssue,
+    bed_boundary_issues,
+    bed_overlap_issue,
+    bed_rectangle,
+    bed_spacing_issues,
+    is_task_date_invalid,
+    task_date_issue,
+    validate_bed_overlaps,
+)
+
+
+class _BedEntry:
+    __slots__ = ("bed", "spacing", "boundary", "plantings", "planted_on")
+
+    def __init__(
+        self,
+        bed: Bed,
+        spacing: List[GardenValidationIssue],
+        boundary: List[GardenValidationIssue],
+        plantings: Dict[str, Planting],
+    ):
+        self.bed = bed
+        self.spacing = spacing
+        self.boundary = boundary
+        self.plantings = plantings
+        # Task checks depend on planted_on; kept to notice in-place edits.
+        self.planted_on = {pid: p.planted_on for pid, p in plantings.items()}
+
+
+class IncrementalValidator:
+    """
+    Stateful counterpart of validate_garden that caches issues per bed and per
+    task, and only re-checks entries that were invalidated since the last call.
+
+    Beds and tasks are re-checked when they are new, when the object under
+    their id was replaced, or when they were explicitly invalidated. Tasks are
+    also re-checked when the planting they refer to was replaced, removed, or
+    had its planted_on changed in a re-checked bed. Bed footprints
+    are kept in a RectangleGrid, so a re-checked bed is only tested for
+    overlaps against the beds around it. In-place edits
+    made outside of growkit_core.api must be reported through invalidate_bed /
+    invalidate_task (or invalidate_all); beds added, moved or resized through
+    footprint_changed.
+    """
+
+    def __init__(self):
+        self._beds: Dict[str, _BedEntry] = {}
+        self._tasks: Dict[str, Tuple[GardenTask, Optional[GardenValidationIssue]]] = {}
+        self._plantings: Dict[str, Planting] = {}
+        self._dirty_beds: Set[str] = set()
+        self._dirty_tasks: Set[str] = set()
+        self._created_on: Optional[date] = None
+        self._footprints: Optional[RectangleGrid] = None
+        self._overlaps: Dict[str, Set[str]] = {}
+        self._moved: Set[str] = set()
+        # Largest x reached by a bed footprint; None until first needed.
+        self._right_edge: Optional[float] = None
+
+    def invalidate_bed(self, bed_id: str) -> None:
+        self._dirty_beds.add(bed_id)
+
+    def footprint_changed(self, bed: Bed) -> None:
+        """Reports a bed that was added, moved or resized."""
+        self._dirty_beds.add(bed.id)
+        self._moved.add(bed.id)
+        self._extend_right_edge(bed_rectangle(bed))
+
+    def pending_moves(self) -> FrozenSet[str]:
+        """Beds passed to footprint_changed since the last validate_changes."""
+        return frozenset(self._moved)
+
+    def reset_moves(self, bed_ids: Iterable[str]) -> None:
+        """
+        Replaces the pending moves, e.g. with pending_moves() from before
+        edits that were undone, so their beds no longer count as moved.
+        """
+        self._moved = set(bed_ids)
+
+    def _extend_right_edge(self, rect: Optional[Rect]) -> None:
+        if rect is not None and self._right_edge is not None:
+            self._right_edge = max(self._right_edge, rect[2])
+
+    def right_edge(self, garden: Garden) -> float:
+        """
+        The largest x coordinate any bed footprint reaches, or -inf without
+        positioned beds. It is only ever raised, so it may overshoot after
+        beds were moved left or removed, but a bed placed right of it
+        overlaps none. Only the first call scans the beds.
+        """
+        if self._right_edge is None:
+            self._right_edge = max(
+                (rect[2] for rect in map(bed_rectangle, garden.beds) if rect),
+                default=-inf,
+            )
+        return self._right_edge
+
+    def invalidate_task(self, task_id: str) -> None:
+        self._dirty_tasks.add(task_id)
+
+    def invalidate_all(self) -> None:
+        self.__init__()
+
+    def validate(self, garden: Garden) -> List[GardenValidationIssue]:
+        """
+        Returns the same issues, in the same order, as validate_garden(garden).
+        """
+        changed_plantings: Set[str] = set()
+        spacing: List[GardenValidationIssue] = []
+        boundary: List[GardenValidationIssue] = []
+        positions: Dict[str, int] = {}
+        changed_beds: List[Bed] = []
+        duplicates = False
+        for i, bed in enumerate(garden.beds):
+            if bed.id in positions:
+                # Duplicate ids cannot share a cache entry; check uncached.
+                spacing.extend(bed_spacing_issues(bed))
+                boundary.extend(bed_boundary_issues(bed))
+                duplicates = True
+                continue
+            positions[bed.id] = i
+            entry = self._beds.get(bed.id)
+            if entry is None or entry.bed is not bed or bed.id in self._dirty_beds:
+                entry = self._check_bed(bed, entry, changed_plantings)
+                changed_beds.append(bed)
+            spacing.extend(entry.spacing)
+            boundary.extend(entry.boundary)
+        removed_beds = self._beds.keys() - positions.keys()
+        for bed_id in removed_beds:
+            removed = self._beds.pop(bed_id)
+            changed_plantings.update(removed.plantings)
+            for planting_id in removed.plantings:
+                self._plantings.pop(planting_id, None)
+        self._dirty_beds.clear()
+
+        if duplicates:
+            self._footprints = None
+            overlaps = [
+                bed_overlap_issue(*pair) for pair in validate_bed_overlaps(garden)
+            ]
+        else:
+            overlaps = self._check_overlaps(
+                garden, positions, changed_beds, removed_beds
+            )
+        return (
+            spacing + boundary + overlaps + self._check_tasks(garden, changed_plantings)
+        )
+
+    def validate_changes(self, garden: Garden) -> List[GardenValidationIssue]:
+        """
+        Like validate, but bed overlaps are only reported if they involve a
+        bed passed to footprint_changed since the last call. Overlaps a garden
+        already had, such as beds all created at the former default position
+        (0, 0), then do not block edits that leave those beds alone.
+        """
+        moved, self._moved = self._moved, set()
+        return [
+            issue
+            for issue in self.validate(garden)
+            if issue.type != "bed_overlap"
+            or issue.bed_id in moved
+            or issue.other_bed_id in moved
+        ]
+
+    def _check_overlaps(
+        self,
+        garden: Garden,
+        positions: Dict[str, int],
+        changed_beds: List[Bed],
+        removed_beds: Set[str],
+    ) -> List[GardenValidationIssue]:
+        if self._footprints is None:
+            rects = [bed_rectangle(bed) for bed in garden.beds]
+            sizes = sorted(max(r[2] - r[0], r[3] - r[1]) for r in rects if r)
+            self._footprints = RectangleGrid(sizes[len(sizes) // 2] if sizes else 1.0)
+            self._overlaps = {}
+            self._right_edge = -inf
+            changed_beds, removed_beds = list(garden.beds), set()
+        footprints, overlaps = self._footprints, self._overlaps
+        for bed_id in removed_beds | {bed.id for bed in changed_beds}:
+            footprints.remove(bed_id)
+            for other in overlaps.pop(bed_id, ()):
+                overlaps[other].discard(bed_id)
+        for bed in changed_beds:
+            rect = bed_rectangle(bed)
+            if rect is None:
+                continue
+            self._extend_right_edge(rect)
+            for other in footprints.overlapping(rect):
+                overlaps.setdefault(bed.id, set()).add(other)
+                overlaps.setdefault(other, set()).add(bed.id)
+            footprints.insert(bed.id, rect)
+
+        pairs = sorted(
+            (positions[a], positions[b])
+            for a, others in overlaps.items()
+            for b in others
+            if positions[a] < positions[b]
+        )
+        beds = garden.beds
+        return [bed_overlap_issue(beds[i], beds[j]) for i, j in pairs]
+
+    def _check_bed(
+        self, bed: Bed, previous: Optional[_BedEntry], changed_plantings: Set[str]
+    ) -> _BedEntry:
+        plantings = {p.id: p for p in bed.plantings}
+        old = previous.plantings if previous else {}
+        old_planted_on = previous.planted_on if previous else {}
+        for planting_id in old.keys() - plantings.keys():
+            self._plantings.pop(planting_id, None)
+            changed_plantings.add(planting_id)
+        for planting_id, planting in plantings.items():
+            if (
+                old.get(planting_id) is not planting
+                or old_planted_on[planting_id] != planting.planted_on
+            ):
+                changed_plantings.add(planting_id)
+        self._plantings.update(plantings)
+        entry = _BedEntry(
+            bed, bed_spacing_issues(bed), bed_boundary_issues(bed), plantings
+        )
+        self._beds[bed.id] = entry
+        return entry
+
+    def _check_tasks(
+        self, garden: Garden, changed_plantings: Set[str]
+    ) -> List[GardenValidationIssue]:
+        created_on = garden.created_at.date()
+        if created_on != self._created_on:
+            self._created_on = created_on
+            self._tasks.clear()
+
+        issues = []
+        for task in garden.tasks:
+            cached = self._tasks.get(task.id)
+            if (
+                cached is None
+                or cached[0] is not task
+                or task.id in self._dirty_tasks
+                or task.related_planting_id in changed_plantings
+            ):
+                planting = self._plantings.get(task.related_planting_id or "")
+                issue = (
+                    task_date_issue(task)
+                    if is_task_date_invalid(task, planting, created_on)
+                    else None
+                )
+                cached = self._tasks[task.id] = (task, issue)
+            if cached[1] is not None:
+                issues.append(cached[1])
+        self._dirty_tasks.clear()
+        if len(self._tasks) > len(garden.tasks):
+            live = {task.id for task in garden.tasks}
+            for task_id in self._tasks.keys() - live:
+                del self._tasks[task_id]
+        return issues
+
+
+_validators: GardenRegistry[IncrementalValidator] = GardenRegistry(IncrementalValidator)
+
+
+def incremental_validator(garden: Garden) -> IncrementalValidator:
+    """Returns the IncrementalValidator attached to this garden."""
+    return _validators.get(garden)
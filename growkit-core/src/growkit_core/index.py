@@ -0,0 +1,281 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from growkit_core.models import Bed, Garden, GardenTask, Planting
+from growkit_core.registry import GardenRegistry
+
+V = TypeVar("V")
+
+# A list the index was built from and its length at the time. The list
+# itself is kept rather than its id(): a list freed and reallocated at the
+# same address would otherwise pass for the recorded one.
+_ListShape = Tuple[list, int]
+
+
+def _shape(items: list) -> _ListShape:
+    return items, len(items)
+
+
+def _matches(shape: Optional[_ListShape], items: list, delta: int = 0) -> bool:
+    """Whether `items` is the list recorded in `shape`, grown by `delta` since."""
+    return shape is not None and shape[0] is items and shape[1] == len(items) - delta
+
+
+class GardenIndex:
+    """
+    Constant-time lookups of a garden's beds, plantings and tasks by id.
+
+    Each id maps to a position (a planting to its bed id and its position in
+    that bed), and a lookup checks that the entity at that position still
+    carries the id, so entries made stale by other code are detected on use
+    and that part of the index rebuilt. growkit_core.api reports its own
+    additions and removals, so they never cause a rebuild.
+
+    Removing an entity renumbers the entries after it, so removals cost
+    O(entities after it), like the list deletion itself; appends are
+    constant-time.
+
+    Looking up an id that is not in the index costs a walk over the beds (not
+    the plantings) to rule out lists that were replaced or resized behind the
+    index's back. Beds and tasks are indexed separately, so bed and planting
+    lookups never load the tasks of a LazyGarden. Other in-place edits that
+    add or re-id entities must be reported through invalidate().
+    """
+
+    def __init__(self):
+        self._beds: Dict[str, int] = {}
+        self._plantings: Dict[str, Tuple[str, int]] = {}
+        self._beds_shape: Optional[_ListShape] = None
+        self._bed_shapes: List[_ListShape] = []
+        self._tasks: Dict[str, int] = {}
+        self._tasks_shape: Optional[_ListShape] = None
+
+    def invalidate(self) -> None:
+        self._invalidate_beds()
+        self._invalidate_tasks()
+
+    # ---------- Lookups ----------
+
+    def bed_position(self, garden: Garden, bed_id: str) -> Optional[int]:
+        return self._lookup(
+            garden, self._beds, bed_id, self._bed_at, self._beds_stale, self._index_beds
+        )
+
+    def planting_position(
+        self, garden: Garden, planting_id: str
+    ) -> Optional[Tuple[int, int]]:
+        """Returns (bed position, position within the bed)."""
+        found = self._lookup(
+            garden,
+            self._plantings,
+            planting_id,
+            self._planting_at,
+            self._beds_stale,
+            self._index_beds,
+        )
+        return None if found is None else (self._beds[found[0]], found[1])
+
+    def task_position(self, garden: Garden, task_id: str) -> Optional[int]:
+        return self._lookup(
+            garden,
+            self._tasks,
+            task_id,
+            self._task_at,
+            self._tasks_stale,
+            self._index_tasks,
+        )
+
+    def bed(self, garden: Garden, bed_id: str) -> Optional[Bed]:
+        i = self.bed_position(garden, bed_id)
+        return None if i is None else garden.beds[i]
+
+    def planting(
+        self, garden: Garden, planting_id: str
+    ) -> Optional[Tuple[Bed, Planting]]:
+        """Returns the planting together with the bed it is in."""
+        position = self.planting_position(garden, planting_id)
+        if position is None:
+            return None
+        bed = garden.beds[position[0]]
+        return bed, bed.plantings[position[1]]
+
+    def task(self, garden: Garden, task_id: str) -> Optional[GardenTask]:
+        i = self.task_position(garden, task_id)
+        return None if i is None else garden.tasks[i]
+
+    # ---------- Maintenance ----------
+    #
+    # Each of these is called right after the change it describes. If the
+    # index had already drifted from the garden, recording the change on top
+    # would hide that, so that part of the index is dropped instead and
+    # rebuilt on the next lookup.
+
+    def bed_added(self, garden: Garden) -> None:
+        """Records the bed just appended to garden.beds."""
+        i = len(garden.beds) - 1
+        bed = garden.beds[i]
+        if not _matches(self._beds_shape, garden.beds, 1) or bed.id in self._beds:
+            self._invalidate_beds()
+            return
+        self._beds_shape = _shape(garden.beds)
+        self._beds[bed.id] = i
+        self._bed_shapes.append(_shape(bed.plantings))
+        for j, planting in enumerate(bed.plantings):
+            self._plantings.setdefault(planting.id, (bed.id, j))
+
+    def bed_removed(self, garden: Garden, position: int, bed: Bed) -> None:
+        """Records that `bed` was deleted from garden.beds at `position`."""
+        if (
+            not _matches(self._beds_shape, garden.beds, -1)
+            or self._beds.get(bed.id) != position
+        ):
+            self._invalidate_beds()
+            return
+        self._beds_shape = _shape(garden.beds)
+        del self._beds[bed.id]
+        del self._bed_shapes[position]
+        for planting in bed.plantings:
+            if self._plantings.get(planting.id, ("",))[0] == bed.id:
+                del self._plantings[planting.id]
+        for i in range(position, len(garden.beds)):
+            self._beds[garden.beds[i].id] = i
+
+    def planting_added(self, garden: Garden, bed_position: int) -> None:
+        """Records the planting just appended to the bed at `bed_position`."""
+        bed = garden.beds[bed_position]
+        j = len(bed.plantings) - 1
+        if not self._bed_resized(bed_position, bed, 1) or (
+            bed.plantings[j].id in self._plantings
+        ):
+            self._invalidate_beds()
+            return
+        self._plantings[bed.plantings[j].id] = (bed.id, j)
+
+    def planting_removed(
+        self, garden: Garden, bed_position: int, position: int, planting: Planting
+    ) -> None:
+        """Records that `planting` was deleted from its bed at `position`."""
+        bed = garden.beds[bed_position]
+        if not self._bed_resized(bed_position, bed, -1) or self._plantings.get(
+            planting.id
+        ) != (bed.id, position):
+            self._invalidate_beds()
+            return
+        del self._plantings[planting.id]
+        for j in range(position, len(bed.plantings)):
+            self._plantings[bed.plantings[j].id] = (bed.id, j)
+
+    def task_added(self, garden: Garden) -> None:
+        """Records the task just appended to garden.tasks."""
+        task = garden.tasks[-1]
+        if not _matches(self._tasks_shape, garden.tasks, 1) or task.id in self._tasks:
+            self._invalidate_tasks()
+            return
+        self._tasks_shape = _shape(garden.tasks)
+        self._tasks[task.id] = len(garden.tasks) - 1
+
+    def list_copied(
+        self, path: Sequence[Union[str, int]], old: list, new: list
+    ) -> None:
+        """
+        Records that the list at `path` (["beds"], ["tasks"] or ["beds", i,
+        "plantings"]) was swapped for `new`, an equal copy of `old`.
+        """
+        tokens = [str(token) for token in path]
+        if tokens == ["beds"]:
+            if _matches(self._beds_shape, old):
+                self._beds_shape = _shape(new)
+        elif tokens == ["tasks"]:
+            if _matches(self._tasks_shape, old):
+                self._tasks_shape = _shape(new)
+        elif len(tokens) == 3 and tokens[0] == "beds" and tokens[2] == "plantings":
+            i = int(tokens[1])
+            if i < len(self._bed_shapes) and _matches(self._bed_shapes[i], old):
+                self._bed_shapes[i] = _shape(new)
+
+    # ---------- Internals ----------
+
+    def _invalidate_beds(self) -> None:
+        self._beds.clear()
+        self._plantings.clear()
+        self._beds_shape = None
+        self._bed_shapes = []
+
+    def _invalidate_tasks(self) -> None:
+        self._tasks.clear()
+        self._tasks_shape = None
+
+    def _index_beds(self, garden: Garden) -> None:
+        self._invalidate_beds()
+        for i, bed in enumerate(garden.beds):
+            if self._beds.setdefault(bed.id, i) != i:
+                # Plantings are keyed by bed id, so only the first of several
+                # beds sharing an id is reachable (as with a linear scan).
+                continue
+            for j, planting in enumerate(bed.plantings):
+                self._plantings.setdefault(planting.id, (bed.id, j))
+        self._beds_shape = _shape(garden.beds)
+        self._bed_shapes = [_shape(bed.plantings) for bed in garden.beds]
+
+    def _index_tasks(self, garden: Garden) -> None:
+        self._invalidate_tasks()
+        for i, task in enumerate(garden.tasks):
+            self._tasks.setdefault(task.id, i)
+        self._tasks_shape = _shape(garden.tasks)
+
+    def _beds_stale(self, garden: Garden) -> bool:
+        return not _matches(self._beds_shape, garden.beds) or not all(
+            map(_matches, self._bed_shapes, [bed.plantings for bed in garden.beds])
+        )
+
+    def _tasks_stale(self, garden: Garden) -> bool:
+        return not _matches(self._tasks_shape, garden.tasks)
+
+    def _bed_resized(self, bed_position: int, bed: Bed, delta: int) -> bool:
+        if bed_position >= len(self._bed_shapes) or not _matches(
+            self._bed_shapes[bed_position], bed.plantings, delta
+        ):
+            return False
+        self._bed_shapes[bed_position] = _shape(bed.plantings)
+        return True
+
+    def _bed_at(self, garden: Garden, i: int, bed_id: str) -> bool:
+        return i < len(garden.beds) and garden.beds[i].id == bed_id
+
+    def _task_at(self, garden: Garden, i: int, task_id: str) -> bool:
+        return i < len(garden.tasks) and garden.tasks[i].id == task_id
+
+    def _planting_at(
+        self, garden: Garden, position: Tuple[str, int], planting_id: str
+    ) -> bool:
+        bed_id, j = position
+        i = self._beds.get(bed_id)
+        if i is None or not self._bed_at(garden, i, bed_id):
+            return False
+        plantings = garden.beds[i].plantings
+        return j < len(plantings) and plantings[j].id == planting_id
+
+    def _lookup(
+        self,
+        garden: Garden,
+        table: Dict[str, V],
+        key: str,
+        found: Callable[[Garden, V, str], bool],
+        stale: Callable[[Garden], bool],
+        rebuild: Callable[[Garden], None],
+    ) -> Optional[V]:
+        value = table.get(key)
+        if value is not None and found(garden, value, key):
+            return value
+        if value is None and not stale(garden):
+            return None
+        # Rebuilding refills `table` in place.
+        rebuild(garden)
+        return table.get(key)
+
+
+_indexes: GardenRegistry[GardenIndex] = GardenRegistry(GardenIndex)
+
+
+def garden_index(garden: Garden) -> GardenIndex:
+    """Returns the GardenIndex attached to this garden."""
+    return _indexes.get(garden)
@@ -0,0 +1,327 @@
+"""
+Opt-in timing of growkit's hot paths.
+
+Functions decorated with @instrumented (the growkit_core.api mutators, the
+validators, and the growkit-mcp tools) record a span per call: its name,
+duration and whether it raised. While no sink is enabled the decorator costs
+one global lookup per call. Once enabled, spans are aggregated into
+per-name counters and duration histograms (`metrics`) and handed to every
+sink:
+
+    enable(LogSink(), PrometheusTextSink("/var/lib/node_exporter/growkit.prom"))
+
+or, for processes configured through the environment, configure_from_env()
+with GROWKIT_INSTRUMENTATION set to a comma-separated list of "log",
+"jsonl:<path>" and "prometheus:<path>".
+"""
+
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+ENV_VAR = "GROWKIT_INSTRUMENTATION"
+# Upper bounds, in seconds, of the duration histogram buckets.
+BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+logger = logging.getLogger("growkit.instrumentation")
+
+
+class SpanStats:
+    __slots__ = ("count", "errors", "total", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        # buckets[i] counts durations <= BUCKETS[i]; the last one is +Inf.
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+
+class Metrics:
+    """Thread-safe call counters and duration histograms per span name."""
+
+    def __init__(self):
+        self._spans: Dict[str, SpanStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, error: bool) -> None:
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = SpanStats()
+            stats.count += 1
+            stats.errors += error
+            stats.total += seconds
+            stats.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+    def get(self, name: str) -> Optional[SpanStats]:
+        return self._spans.get(name)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def to_prometheus(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP growkit_span_seconds Duration of instrumented growkit calls.",
+            "# TYPE growkit_span_seconds histogram",
+        ]
+        errors = [
+            "# HELP growkit_span_errors_total Instrumented calls that raised.",
+            "# TYPE growkit_span_errors_total counter",
+        ]
+        with self._lock:
+            for name in sorted(self._spans):
+                stats = self._spans[name]
+                label = f'span="{name}"'
+                cumulative = 0
+                for bound, count in zip(BUCKETS + (float("inf"),), stats.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f'growkit_span_seconds_bucket{{{label},le="{le}"}} {cumulative}'
+                    )
+                lines.append(f"growkit_span_seconds_sum{{{label}}} {stats.total!r}")
+                lines.append(f"growkit_span_seconds_count{{{label}}} {stats.count}")
+                errors.append(f"growkit_span_errors_total{{{label}}} {stats.errors}")
+        return "\n".join(lines + errors) + "\n"
+
+
+metrics = Metrics()
+
+
+# ---------- Sinks ----------
+
+
+class Sink:
+    """Receives every span while enabled. Subclasses override what they need."""
+
+    def record(self, name: str, seconds: float, error: bool) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class LogSink(Sink):
+    """Logs each span to the growkit.instrumentation logger."""
+
+    def __init__(self, level: int = logging.INFO):
+        self.level = level
+
+    def record(self, name: str, seconds: float, error: bool) -> None:
+        logger.log(
+            self.level,
+            "%s took %.3f ms%s",
+            name,
+            seconds * 1e3,
+            " (raised)" if error else "",
+        )
+
+
+class JsonLinesSink(Sink):
+    """Appends each span as a JSON object per line to a file or stream."""
+
+    def __init__(self, target: "Path | str | TextIO"):
+        self._owned = isinstance(target, (str, Path))
+        # The sink owns the file for its lifetime and closes it in close().
+        self._out: TextIO = (
+            open(target, "a", encoding="utf-8")  # noqa: SIM115
+            if self._owned
+            else target
+        )
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, error: bool) -> None:
+        line = json.dumps(
+            {"time": time.time(), "span": name, "seconds": seconds, "error": error}
+        )
+        with self._lock:
+            self._out.write(line + "\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            self._out.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owned:
+            self._out.close()
+
+
+class PrometheusTextSink(Sink):
+    """
+    Periodically rewrites a Prometheus text file (e.g. for node_exporter's
+    textfile collector) with the aggregated `metrics`. Spans only update the
+    in-memory `metrics`; a background thread replaces the file atomically
+    every `interval` seconds, and flush(), close() and interpreter exit
+    write it once more.
+    """
+
+    def __init__(self, path: "Path | str", interval: float = 10.0):
+        self.path = Path(path)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="growkit-prometheus", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except OSError:
+                logger.exception("Could not write %s", self.path)
+
+    def flush(self) -> None:
+        from growkit_core.io import atomic_write
+
+        with self._lock:
+            atomic_write(self.path, metrics.to_prometheus().encode("utf-8"))
+
+    def close(self) -> None:
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        atexit.unregister(self.close)
+        self._thread.join()
+        self.flush()
+
+
+# ---------- Spans ----------
+
+# Empty while instrumentation is disabled.
+_sinks: Tuple[Sink, ...] = ()
+
+
+def enable(*sinks: Sink) -> None:
+    """
+    Starts recording spans into `metrics` and the given sinks. With no sinks,
+    spans are only aggregated.
+    """
+    global _sinks
+    _sinks = sinks or (Sink(),)
+
+
+def disable() -> None:
+    """Stops recording and closes the sinks. `metrics` keeps its totals."""
+    global _sinks
+    sinks, _sinks = _sinks, ()
+    for sink in sinks:
+        sink.close()
+
+
+def is_enabled() -> bool:
+    return bool(_sinks)
+
+
+def flush() -> None:
+    for sink in _sinks:
+        sink.flush()
+
+
+def record(name: str, seconds: float, error: bool = False) -> None:
+    metrics.observe(name, seconds, error)
+    for sink in _sinks:
+        sink.record(name, seconds, error)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Times the enclosed block as a span named `name`."""
+    if not _sinks:
+        yield
+        return
+    start = time.perf_counter()
+    error = True
+    try:
+        yield
+        error = False
+    finally:
+        record(name, time.perf_counter() - start, error)
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Records a span named `name` for every call of the decorated function."""
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _sinks:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            error = True
+            try:
+                result = fn(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                record(name, time.perf_counter() - start, error)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def sinks_from_spec(spec: str) -> List[Sink]:
+    """Parses a GROWKIT_INSTRUMENTATION value such as "log,jsonl:/tmp/spans"."""
+    sinks: List[Sink] = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        kind, _, target = item.partition(":")
+        if kind == "log" and not target:
+            sinks.append(LogSink())
+        elif kind == "jsonl" and target:
+            sinks.append(JsonLinesSink(target))
+        elif kind == "prometheus" and target:
+            sinks.append(PrometheusTextSink(target))
+        else:
+            raise ValueError(
+                f"Unknown instrumentation sink '{item}'; expected log, "
+                "jsonl:<path> or prometheus:<path>"
+            )
+    return sinks
+
+
+def configure_from_env() -> bool:
+    """Enables the sinks named in GROWKIT_INSTRUMENTATION, if it is set."""
+    spec = os.environ.get(ENV_VAR, "")
+    sinks = sinks_from_spec(spec)
+    if sinks:
+        enable(*sinks)
+    return bool(sinks)
@@ -1,13 +1,431 @@
+import contextlib
+import json
+import os
+import re
+import stat
+import tempfile
+import zlib
+from enum import Enum
 from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple, Type
 
-from growkit_core.models import Garden
+from pydantic import BaseModel, PrivateAttr, model_serializer
 
+from growkit_core.models import (
+    SCHEMA_VERSION,
+    AgentCommentary,
+    Bed,
+    Garden,
+    GardenTask,
+)
 
-def load_garden(path: Path) -> Garden:
+# Garden lists that are parsed one item at a time when streaming.
+SECTIONS: Dict[str, Type[BaseModel]] = {
+    "beds": Bed,
+    "tasks": GardenTask,
+    "agent_comments": AgentCommentary,
+}
+# Sections a lazy load leaves on disk until first access.
+LAZY_SECTIONS = ("tasks", "agent_comments")
+
+_CHUNK_SIZE = 1 << 16
+_NON_WHITESPACE = re.compile(rb"[^ \t\r\n]")
+# Skips everything up to the next bracket outside of a string.
+_TO_BRACKET = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.S)
+_STRING_TAIL = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_SCALAR = re.compile(rb"[^,\]}\s]*")
+
+
+class _JsonStream:
+    """
+    Minimal pull scanner over a JSON byte stream. It only finds value
+    boundaries; the values themselves are handed to pydantic or json as bytes,
+    so at most one item (plus a read chunk) is buffered at a time.
+    """
+
+    def __init__(self, f: BinaryIO, offset: int = 0):
+        self._f = f
+        self._buf = bytearray()
+        self._pos = 0
+        self._offset = offset
+
+    def _fill(self) -> bool:
+        chunk = self._f.read(_CHUNK_SIZE)
+        if not chunk:
+            return False
+        self._buf += chunk
+        return True
+
+    def _compact(self) -> None:
+        if self._pos:
+            del self._buf[: self._pos]
+            self._offset += self._pos
+            self._pos = 0
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"Malformed garden JSON at byte {self.tell()}: {message}")
+
+    def tell(self) -> int:
+        return self._offset + self._pos
+
+    def peek(self) -> int:
+        """Skips whitespace and returns the next byte without consuming it."""
+        while True:
+            match = _NON_WHITESPACE.search(self._buf, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return self._buf[self._pos]
+            self._pos = len(self._buf)
+            self._compact()
+            if not self._fill():
+                raise self._error("unexpected end of input")
+
+    def expect(self, char: bytes) -> None:
+        if self.peek() != char[0]:
+            raise self._error(f"expected {char.decode()!r}")
+        self._pos += 1
+
+    def read_value(self) -> bytearray:
+        """Consumes the next JSON value and returns its raw bytes."""
+        self.peek()
+        if self._pos >= _CHUNK_SIZE:
+            self._compact()
+        start = self._pos
+        end = self._scan(start)
+        self._pos = end
+        return self._buf[start:end]
+
+    def _scan(self, start: int) -> int:
+        first = self._buf[start]
+        if first == ord('"'):
+            return self._scan_string(start + 1)
+        if first not in b"[{":
+            while True:
+                match = _SCALAR.match(self._buf, start)
+                if match.end() < len(self._buf) or not self._fill():
+                    if match.end() == start:
+                        raise self._error("expected a value")
+                    return match.end()
+        depth = 0
+        pos = start
+        while True:
+            pos = _TO_BRACKET.match(self._buf, pos).end()
+            if pos == len(self._buf) or self._buf[pos] == ord('"'):
+                # Ran out of input, possibly inside a string: read more and
+                # rescan from the same place.
+                if not self._fill():
+                    raise self._error("unexpected end of input")
+                continue
+            depth += 1 if self._buf[pos] in b"[{" else -1
+            pos += 1
+            if depth == 0:
+                return pos
+
+    def _scan_string(self, start: int) -> int:
+        while True:
+            match = _STRING_TAIL.match(self._buf, start)
+            if match is not None:
+                return match.end()
+            if not self._fill():
+                raise self._error("unterminated string")
+
+    def iter_array(self, model: Type[BaseModel]) -> Iterator[BaseModel]:
+        for raw in self.iter_raw_array():
+            yield model.model_validate_json(raw)
+
+    def skip_array(self) -> None:
+        for _ in self.iter_raw_array():
+            pass
+
+    def iter_raw_array(self) -> Iterator[bytearray]:
+        self.expect(b"[")
+        if self.peek() == ord("]"):
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value()
+            if self.peek() == ord("]"):
+                self._pos += 1
+                return
+            self.expect(b",")
+
+    def iter_object(self) -> Iterator[str]:
+        """Yields each key of an object, positioned at its value."""
+        self.expect(b"{")
+        if self.peek() == ord("}"):
+            self._pos += 1
+            return
+        while True:
+            key = json.loads(self.read_value())
+            self.expect(b":")
+            yield key
+            if self.peek() == ord("}"):
+                self._pos += 1
+                return
+            self.expect(b",")
+
+
+class LazyGarden(Garden):
+    """
+    A Garden loaded with load_garden(lazy=True). Its `tasks` and
+    `agent_comments` are read from the source file the first time they are
+    accessed (or when the garden is serialized or compared). The source file
+    must not change while sections are still pending.
+    """
+
+    _source: Optional[Path] = PrivateAttr(default=None)
+    _pending: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LAZY_SECTIONS:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private and name in private["_pending"]:
+                self._materialize(name)
+                return self.__dict__[name]
+        return super().__getattr__(name)
+
+    def _materialize(self, name: str) -> None:
+        offset = self._pending.pop(name)
+        if name in self.__dict__:
+            return  # assigned before it was ever read
+        with open(self._source, "rb") as f:
+            f.seek(offset)
+            items = list(_JsonStream(f, offset).iter_array(SECTIONS[name]))
+        self.__dict__[name] = items
+        self.__pydantic_fields_set__.add(name)
+
+    def materialize(self) -> Garden:
+        """Loads every pending section and returns self."""
+        for name in list(self._pending):
+            self._materialize(name)
+        return self
+
+    @property
+    def pending_sections(self) -> tuple:
+        return tuple(self._pending)
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler):
+        self.materialize()
+        return handler(self)
+
+    def __eq__(self, other: Any) -> bool:
+        self.materialize()
+        if isinstance(other, LazyGarden):
+            other.materialize()
+        return super().__eq__(other)
+
+    def __iter__(self):
+        self.materialize()
+        return super().__iter__()
+
+
+def _stream_garden(path: Path, lazy: bool) -> Garden:
+    data: Dict[str, Any] = {}
+    pending: Dict[str, int] = {}
+    with open(path, "rb") as f:
+        stream = _JsonStream(f)
+        for key in stream.iter_object():
+            if lazy and key in LAZY_SECTIONS:
+                stream.peek()
+                pending[key] = stream.tell()
+                stream.skip_array()
+            elif key in SECTIONS:
+                data[key] = list(stream.iter_array(SECTIONS[key]))
+            else:
+                data[key] = json.loads(stream.read_value())
+    if not lazy:
+        return Garden.model_validate(data)
+    garden = LazyGarden.model_validate(data)
+    for key in pending:
+        del garden.__dict__[key]
+        garden.__pydantic_fields_set__.discard(key)
+    garden._source = Path(path)
+    garden._pending = pending
+    return garden
+
+
+def iter_garden_section(path: Path, section: str) -> Iterator[BaseModel]:
+    """
+    Yields the items of one garden list ("beds", "tasks" or "agent_comments")
+    one at a time, without loading the rest of the garden.
+    """
+    if section not in SECTIONS:
+        raise ValueError(f"Unknown garden section '{section}'")
+    with open(path, "rb") as f:
+        stream = _JsonStream(f)
+        for key in stream.iter_object():
+            if key == section:
+                yield from stream.iter_array(SECTIONS[key])
+                return
+            if key in SECTIONS:
+                stream.skip_array()
+            else:
+                stream.read_value()
+
+
+class GardenFormat(str, Enum):
+    json = "json"
+    compressed = "compressed"
+
+
+# The compressed format is compact JSON in a small container: magic,
+# container version, codec, schema version length, schema version (ASCII),
+# then the JSON payload, zlib-compressed unless stored raw. It saves space,
+# not time: pydantic's JSON encoder and parser do the work either way, and
+# compressing makes encoding slower than indented JSON (see
+# benchmarks/bench_io.py).
+COMPRESSED_MAGIC = b"GKZ"
+COMPRESSED_VERSION = 1
+COMPRESSED_SUFFIX = ".gkz"
+_CODEC_RAW = 0
+_CODEC_ZLIB = 1
+
+
+def _format_for(path: Path, format: Optional[GardenFormat]) -> GardenFormat:
+    if format is not None:
+        return GardenFormat(format)
+    if Path(path).suffix == COMPRESSED_SUFFIX:
+        return GardenFormat.compressed
+    return GardenFormat.json
+
+
+def _is_compressed(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(COMPRESSED_MAGIC)) == COMPRESSED_MAGIC
+
+
+def encode_compressed(garden: Garden, compression_level: int = 1) -> bytes:
+    """
+    Encodes a garden as compact JSON compressed at zlib compression_level;
+    0 stores the JSON uncompressed.
+    """
+    payload = garden.model_dump_json().encode("utf-8")
+    codec = _CODEC_RAW
+    if compression_level:
+        payload = zlib.compress(payload, level=compression_level)
+        codec = _CODEC_ZLIB
+    version = garden.schema_version.encode("ascii")
+    header = (
+        COMPRESSED_MAGIC + bytes([COMPRESSED_VERSION, codec, len(version)]) + version
+    )
+    return header + payload
+
+
+def _schema_version(value: str) -> Tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in value.split("."))
+    except ValueError:
+        raise ValueError(f"Invalid garden schema version '{value}'") from None
+
+
+def decode_compressed(data: bytes) -> Garden:
+    """
+    Decodes a garden written by encode_compressed. Raises ValueError for
+    files from a newer container or garden schema version than this one.
+    """
+    if data[: len(COMPRESSED_MAGIC)] != COMPRESSED_MAGIC:
+        raise ValueError("Not a compressed garden file")
+    offset = len(COMPRESSED_MAGIC)
+    version, codec, version_length = data[offset : offset + 3]
+    if version != COMPRESSED_VERSION:
+        raise ValueError(f"Unsupported compressed garden version {version}")
+    offset += 3
+    schema_version = data[offset : offset + version_length].decode("ascii")
+    if _schema_version(schema_version) > _schema_version(SCHEMA_VERSION):
+        raise ValueError(
+            f"Garden schema version {schema_version} is newer than the "
+            f"supported {SCHEMA_VERSION}"
+        )
+    payload = data[offset + version_length :]
+    if codec == _CODEC_ZLIB:
+        payload = zlib.decompress(payload)
+    elif codec != _CODEC_RAW:
+        raise ValueError(f"Unsupported compressed garden codec {codec}")
+    return Garden.model_validate_json(payload)
+
+
+def load_garden(path: Path, stream: bool = False, lazy: bool = False) -> Garden:
+    """
+    Loads a garden from a JSON or compressed (.gkz) file; the format is
+    detected from the file contents.
+
+    stream=True parses beds, tasks and comments one item at a time instead of
+    reading the whole file into memory first. lazy=True additionally leaves
+    `tasks` and `agent_comments` on disk until they are first accessed and
+    returns a LazyGarden. Both are only available for JSON files.
+    """
+    if _is_compressed(path):
+        if stream or lazy:
+            raise ValueError("Streaming and lazy loads need a JSON garden file")
+        with open(path, "rb") as f:
+            return decode_compressed(f.read())
+    if stream or lazy:
+        return _stream_garden(path, lazy=lazy)
     with open(path, "r", encoding="utf-8") as f:
         return Garden.model_validate_json(f.read())
 
 
-def save_garden(garden: Garden, path: Path) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(garden.model_dump_json(indent=2))
+def atomic_write(path: Path, data: bytes) -> None:
+    """
+    Replaces `path` with `data` so that readers (and a crash) only ever see
+    the old or the new contents: write a temp file in the same directory,
+    fsync it, rename it over the target, then fsync the directory.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+    fsync_directory(path.parent)
+
+
+def fsync_directory(directory: Path) -> None:
+    """Persists a rename or file creation in `directory` (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def save_garden(
+    garden: Garden,
+    path: Path,
+    format: Optional[GardenFormat] = None,
+    compression_level: int = 1,
+    atomic: bool = True,
+) -> None:
+    """
+    Saves a garden as indented JSON, or as compressed compact JSON when
+    format is GardenFormat.compressed or the path ends in .gkz. Compressed
+    files are several times smaller but no faster to write or read.
+
+    By default the file is replaced atomically, so a crash mid-save leaves
+    the previous garden intact. atomic=False writes the target in place.
+    """
+    if _format_for(path, format) == GardenFormat.compressed:
+        data = encode_compressed(garden, compression_level)
+    else:
+        data = garden.model_dump_json(indent=2).encode("utf-8")
+    if atomic:
+        atomic_write(path, data)
+        return
+    with open(path, "wb") as f:
+        f.write(data)
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from growkit_core.io import atomic_write, fsync_directory, load_garden, save_garden
+from growkit_core.models import Garden
+from growkit_core.patch import PatchOperation, apply_patch, diff_gardens
+
+JOURNAL_SUFFIX = ".journal"
+
+
+def _digest(path: Path) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class GardenJournal:
+    """
+    A garden stored as a snapshot file plus an append-only journal of changes.
+
+    The snapshot at `path` is written with save_garden (atomically). Every
+    change is appended to `<path>.journal` as one JSON Patch per line, so a
+    small edit costs I/O proportional to the edit, not to the garden. load()
+    rebuilds the garden by replaying the journal onto the snapshot.
+
+    The journal's first line records the SHA-256 of the snapshot it applies
+    to. If a crash lands between writing a new snapshot and resetting the
+    journal, the stale journal no longer matches and is ignored instead of
+    being replayed twice. A torn final line from a crash mid-append is
+    dropped.
+    """
+
+    def __init__(self, path: Path, snapshot_every: int = 100):
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + JOURNAL_SUFFIX)
+        self.snapshot_every = snapshot_every
+        self._base: Optional[str] = None
+        self._entries = 0
+
+    @property
+    def entries(self) -> int:
+        """Number of changes in the journal since the last snapshot."""
+        return self._entries
+
+    def load(self) -> Garden:
+        garden = load_garden(self.path)
+        self._base = _digest(self.path)
+        self._entries = 0
+        for patch in self._read_entries():
+            apply_patch(garden, patch)
+            self._entries += 1
+        return garden
+
+    def snapshot(self, garden: Garden) -> None:
+        """Writes a full snapshot and starts an empty journal for it."""
+        save_garden(garden, self.path)
+        self._base = _digest(self.path)
+        atomic_write(self.journal_path, self._header())
+        self._entries = 0
+
+    def append(self, patch: Sequence[Union[PatchOperation, Dict[str, Any]]]) -> None:
+        """Durably appends one change to the journal."""
+        if self._base is None:
+            raise RuntimeError("Call load() or snapshot() before appending")
+        ops = [
+            op.model_dump(mode="json") if isinstance(op, PatchOperation) else op
+            for op in patch
+        ]
+        line = json.dumps(ops, separators=(",", ":")).encode("utf-8") + b"\n"
+        created = not self.journal_path.exists()
+        with open(self.journal_path, "ab") as f:
+            if created:
+                f.write(self._header())
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        if created:
+            fsync_directory(self.journal_path.parent)
+        self._entries += 1
+
+    def record(self, before: Dict[str, Any], garden: Garden) -> List[PatchOperation]:
+        """
+        Journals the change from `before` (a model_dump(mode="json") taken
+        before mutating) to `garden`, snapshotting every `snapshot_every`
+        changes. Returns the recorded patch.
+        """
+        patch = diff_gardens(before, garden)
+        if patch:
+            self.append(patch)
+            if self.snapshot_every and self._entries >= self.snapshot_every:
+                self.snapshot(garden)
+        return patch
+
+    def _header(self) -> bytes:
+        return json.dumps({"base": self._base}).encode("utf-8") + b"\n"
+
+    def _read_entries(self) -> List[List[Dict[str, Any]]]:
+        try:
+            with open(self.journal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        lines = data.split(b"\n")
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("base") != self._base:
+            # Written for an older snapshot (or torn before its header).
+            atomic_write(self.journal_path, self._header())
+            return []
+
+        entries = []
+        good = len(lines[0]) + 1
+        # The last element is whatever followed the final newline: empty for
+        # a clean journal, a torn partial line after a crash.
+        for line in lines[1:-1]:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break
+            good += len(line) + 1
+        if good < len(data):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good)
+                os.fsync(f.fileno())
+        return entries
@@ -14,6 +14,13 @@ class UnitLength(str, Enum):
     inches = "in"
 
 
+METERS_PER_UNIT: Dict[UnitLength, float] = {
+    UnitLength.meters: 1.0,
+    UnitLength.feet: 0.3048,
+    UnitLength.inches: 0.0254,
+}
+
+
 class Dimensions(BaseModel):
     width: float
     length: float
@@ -0,0 +1,352 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from growkit_core.history import make_writable, restore, snapshot
+from growkit_core.incremental import incremental_validator
+from growkit_core.index import garden_index
+from growkit_core.models import Garden
+from growkit_core.queries import task_index
+
+
+class PatchOperation(BaseModel):
+    """
+    A single RFC 6902 JSON Patch operation. Only the operations produced by
+    diff_gardens (add, remove, replace) plus test are supported.
+    """
+
+    op: Literal["add", "remove", "replace", "test"]
+    path: str
+    value: Any = None
+
+
+class PatchConflict(ValueError):
+    pass
+
+
+_any_adapter: TypeAdapter = TypeAdapter(Any)
+
+
+# ---------- Diff ----------
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _dump(doc: Union[Garden, Dict[str, Any]]) -> Dict[str, Any]:
+    return doc.model_dump(mode="json") if isinstance(doc, BaseModel) else doc
+
+
+def diff_gardens(
+    before: Union[Garden, Dict[str, Any]], after: Union[Garden, Dict[str, Any]]
+) -> List[PatchOperation]:
+    """
+    Returns the JSON Patch that turns `before` into `after`. Either side may be
+    a Garden or its `model_dump(mode="json")`; pass a dump for `before` when
+    the garden is about to be mutated in place.
+    """
+    ops: List[PatchOperation] = []
+    _diff(_dump(before), _dump(after), "", ops)
+    return ops
+
+
+def _diff(a: Any, b: Any, path: str, ops: List[PatchOperation]) -> None:
+    if a == b:
+        return
+    if isinstance(a, dict) and isinstance(b, dict):
+        for key in a:
+            if key not in b:
+                ops.append(PatchOperation(op="remove", path=f"{path}/{_escape(key)}"))
+        for key, value in b.items():
+            child = f"{path}/{_escape(key)}"
+            if key in a:
+                _diff(a[key], value, child, ops)
+            else:
+                ops.append(PatchOperation(op="add", path=child, value=value))
+    elif isinstance(a, list) and isinstance(b, list):
+        _diff_list(a, b, path, ops)
+    else:
+        ops.append(PatchOperation(op="replace", path=path, value=b))
+
+
+def _diff_list(a: list, b: list, path: str, ops: List[PatchOperation]) -> None:
+    # Trim the common prefix and suffix so a single insert or removal in a
+    # long list becomes a single operation rather than a shifted rewrite.
+    start = 0
+    shortest = min(len(a), len(b))
+    while start < shortest and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+
+    paired = min(end_a - start, end_b - start)
+    for offset in range(paired):
+        i = start + offset
+        _diff(a[i], b[i], f"{path}/{i}", ops)
+    for i in range(end_a - 1, start + paired - 1, -1):
+        ops.append(PatchOperation(op="remove", path=f"{path}/{i}"))
+    for i in range(start + paired, end_b):
+        ops.append(PatchOperation(op="add", path=f"{path}/{i}", value=b[i]))
+
+
+# ---------- Apply ----------
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise PatchConflict(f"Invalid JSON pointer '{pointer}'")
+    return [_unescape(token) for token in pointer[1:].split("/")]
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _child_annotation(annotation: Any, token: str) -> Any:
+    annotation = _unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        field = annotation.model_fields.get(token)
+        if field is None:
+            raise PatchConflict(f"'{annotation.__name__}' has no field '{token}'")
+        return field.annotation
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (list, List) and args:
+        return args[0]
+    if origin in (dict, Dict) and len(args) == 2:
+        return args[1]
+    if origin in (tuple, Tuple) and args:
+        if args[-1] is Ellipsis:
+            return args[0]
+        if not token.isdigit() or int(token) >= len(args):
+            raise PatchConflict(f"Invalid tuple index '{token}'")
+        return args[int(token)]
+    return Any
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _coerce(annotation: Any, value: Any, pointer: str) -> Any:
+    if annotation is Any:
+        return value
+    try:
+        return _adapter(annotation).validate_python(value)
+    except ValidationError as e:
+        raise PatchConflict(f"Invalid value for '{pointer}': {e}") from e
+
+
+def _list_index(container: Sequence, token: str, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise PatchConflict(f"Invalid list index '{token}'")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise PatchConflict(f"List index {index} is out of range")
+    return index
+
+
+class _Location:
+    """The container a JSON pointer points into, plus the target's type."""
+
+    def __init__(self, garden: Garden, pointer: str):
+        tokens = _parse_pointer(pointer)
+        if not tokens:
+            raise PatchConflict("Patching the garden root is not supported")
+        self.parents: List[Tuple[Any, str]] = []
+        container: Any = garden
+        annotation: Any = Garden
+        for token in tokens[:-1]:
+            self.parents.append((container, token))
+            annotation = _child_annotation(annotation, token)
+            container = self._get(container, token)
+        self.pointer = pointer
+        self.container = container
+        self.key = tokens[-1]
+        self.annotation = _child_annotation(annotation, self.key)
+
+    @staticmethod
+    def _get(container: Any, token: str) -> Any:
+        if isinstance(container, BaseModel):
+            if token not in type(container).model_fields:
+                raise PatchConflict(f"Unknown field '{token}'")
+            return getattr(container, token)
+        if isinstance(container, (list, tuple)):
+            return container[_list_index(container, token, allow_end=False)]
+        if isinstance(container, dict):
+            if token not in container:
+                raise PatchConflict(f"Missing key '{token}'")
+            return container[token]
+        raise PatchConflict(f"Cannot descend into '{token}'")
+
+    def get(self) -> Any:
+        return self._get(self.container, self.key)
+
+    def add(self, value: Any) -> None:
+        value = _coerce(self.annotation, value, self.pointer)
+        if isinstance(self.container, (list, tuple)):
+            self._edit_sequence(
+                lambda items: items.insert(
+                    _list_index(items, self.key, allow_end=True), value
+                )
+            )
+        else:
+            self._assign(value)
+
+    def replace(self, value: Any) -> None:
+        self.get()
+        value = _coerce(self.annotation, value, self.pointer)
+        if isinstance(self.container, (list, tuple)):
+            self._edit_sequence(
+                lambda items: items.__setitem__(
+                    _list_index(items, self.key, allow_end=False), value
+                )
+            )
+        else:
+            self._assign(value)
+
+    def remove(self) -> None:
+        self.get()
+        if isinstance(self.container, (list, tuple)):
+            self._edit_sequence(
+                lambda items: items.__delitem__(
+                    _list_index(items, self.key, allow_end=False)
+                )
+            )
+        elif isinstance(self.container, dict):
+            del self.container[self.key]
+        else:
+            field = type(self.container).model_fields[self.key]
+            if field.is_required():
+                raise PatchConflict(f"Cannot remove required field '{self.key}'")
+            setattr(
+                self.container, self.key, field.get_default(call_default_factory=True)
+            )
+
+    def _assign(self, value: Any) -> None:
+        if isinstance(self.container, dict):
+            self.container[self.key] = value
+        else:
+            setattr(self.container, self.key, value)
+
+    def _edit_sequence(self, edit: Callable[[list], None]) -> None:
+        if isinstance(self.container, list):
+            edit(self.container)
+            return
+        # Tuples are immutable: edit a copy and store it on the parent.
+        items = list(self.container)
+        edit(items)
+        parent, token = self.parents[-1]
+        if isinstance(parent, list):
+            parent[int(token)] = tuple(items)
+        elif isinstance(parent, dict):
+            parent[token] = tuple(items)
+        else:
+            setattr(parent, token, tuple(items))
+
+
+def _touch(garden: Garden, pointer: str) -> None:
+    """
+    Tells the garden's incremental validator which bed or task changed, and
+    drops its id index if an entity may have been added, removed or re-id'd.
+    The task index re-indexes an edited task, or is dropped if tasks were
+    added, removed or replaced.
+    """
+    tokens = _parse_pointer(pointer)
+    if tokens[-1:] == ["id"] or (
+        tokens[:1] in (["beds"], ["tasks"])
+        and (len(tokens) <= 2 or (tokens[2:3] == ["plantings"] and len(tokens) <= 4))
+    ):
+        garden_index(garden).invalidate()
+    if tokens[:1] == ["tasks"]:
+        if len(tokens) <= 2:
+            task_index(garden).invalidate()
+        elif tokens[1].isdigit() and int(tokens[1]) < len(garden.tasks):
+            task_index(garden).task_changed(garden, int(tokens[1]))
+    if len(tokens) < 3 or not tokens[1].isdigit():
+        return
+    index = int(tokens[1])
+    validator = incremental_validator(garden)
+    if tokens[0] == "beds" and index < len(garden.beds):
+        validator.invalidate_bed(garden.beds[index].id)
+    elif tokens[0] == "tasks" and index < len(garden.tasks):
+        validator.invalidate_task(garden.tasks[index].id)
+
+
+def _apply_operation(garden: Garden, op: PatchOperation) -> None:
+    if op.op != "test":
+        make_writable(garden, _parse_pointer(op.path)[:-1])
+    location = _Location(garden, op.path)
+    if op.op == "test":
+        if _any_adapter.dump_python(location.get(), mode="json") != op.value:
+            raise PatchConflict(f"Test failed at '{op.path}'")
+        return
+    if op.op == "add":
+        location.add(op.value)
+    elif op.op == "replace":
+        location.replace(op.value)
+    else:
+        location.remove()
+    _touch(garden, op.path)
+
+
+def apply_patch(
+    garden: Garden, patch: Sequence[Union[PatchOperation, Dict[str, Any]]]
+) -> Garden:
+    """
+    Applies a JSON Patch to the garden in place and returns it.
+
+    Only the values being written are validated (against the type of the
+    field they land in); the garden as a whole is not revalidated. Raises
+    PatchConflict if an operation is malformed, does not apply or writes a
+    value of the wrong type, in which case the garden
+    is left as it was: as RFC 6902 requires, a patch applies entirely or not
+    at all. A patch of several operations takes a copy-on-write snapshot
+    first and restores it on failure, so the backup costs only the
+    containers the patch edits.
+    """
+    try:
+        ops = [
+            raw if isinstance(raw, PatchOperation) else PatchOperation(**raw)
+            for raw in patch
+        ]
+    except (TypeError, ValidationError) as e:
+        raise PatchConflict(f"Invalid patch operation: {e}") from e
+    if len(ops) == 1:
+        _apply_operation(garden, ops[0])
+        return garden
+    backup = snapshot(garden)
+    try:
+        for op in ops:
+            _apply_operation(garden, op)
+    except Exception:
+        restore(garden, backup)
+        raise
+    return garden
@@ -0,0 +1,142 @@
+from itertools import chain
+from math import dist, sqrt
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from growkit_core.models import Bed
+from growkit_core.spatial import Point, SpatialGrid
+
+# Positions are rounded to micrometers so they stay readable; lattices are
+# laid out slightly wider than the spacing so rounding can never bring two
+# neighbours closer than the spacing. Every position is still checked with
+# the validators' own rule before it is accepted.
+_DECIMALS = 6
+_PITCH_PAD = 1e-5
+# The fallback scans a square grid this many times finer than the spacing.
+_FALLBACK_STEPS = 4
+
+
+class _Occupied:
+    """
+    Positions already taken in a bed, bucketed into one SpatialGrid per
+    spacing so that each query only has to reach as far as the larger of the
+    two spacings involved.
+    """
+
+    def __init__(self, empty_cell: float):
+        self._empty_cell = empty_cell
+        self._grids: Dict[float, SpatialGrid] = {}
+
+    def add(self, position: Point, spacing: float) -> None:
+        grid = self._grids.get(spacing)
+        if grid is None:
+            grid = self._grids[spacing] = SpatialGrid(spacing or self._empty_cell)
+        grid.insert(0, position)
+
+    def fits(self, position: Point, spacing: float) -> bool:
+        """Whether `position` conflicts with nothing, by validate_garden's rule."""
+        for other_spacing, grid in self._grids.items():
+            reach = max(spacing, other_spacing)
+            for _, other in grid.query(position, reach):
+                if dist(position, other) < reach:
+                    return False
+        return True
+
+
+def _axis(extent: float, margin: float, pitch: float) -> List[float]:
+    """Evenly spaced coordinates in [margin, extent - margin], or the middle."""
+    if extent < 2 * margin:
+        return [extent / 2]
+    n = int((extent - 2 * margin) / pitch + 1e-9) + 1
+    return [margin + k * pitch for k in range(n)]
+
+
+class _HexLattice:
+    """Hex lattice rows: even rows at `xs`, odd rows shifted by half a pitch."""
+
+    def __init__(self, width: float, length: float, spacing: float):
+        pitch = spacing + _PITCH_PAD
+        margin = spacing / 2
+        self.xs = _axis(width, margin, pitch)
+        self.shifted = [
+            x + pitch / 2 for x in self.xs if x + pitch / 2 <= width - margin
+        ]
+        self.rows = _axis(length, margin, pitch * sqrt(3) / 2)
+
+    def __len__(self) -> int:
+        odd = len(self.rows) // 2
+        return (len(self.rows) - odd) * len(self.xs) + odd * len(self.shifted)
+
+    def __iter__(self) -> Iterator[Point]:
+        for r, y in enumerate(self.rows):
+            for x in self.shifted if r % 2 else self.xs:
+                yield x, y
+
+
+class _SquareLattice:
+    def __init__(self, width: float, length: float, step: float, margin: float):
+        self.xs = _axis(width, margin, step)
+        self.ys = _axis(length, margin, step)
+
+    def __len__(self) -> int:
+        return len(self.xs) * len(self.ys)
+
+    def __iter__(self) -> Iterator[Point]:
+        for y in self.ys:
+            for x in self.xs:
+                yield x, y
+
+
+def _candidates(width: float, length: float, spacing: float) -> Iterator[Point]:
+    """
+    Yields candidate positions for one spacing, densest packing first: a hex
+    lattice (or a square grid where that fits more, as in narrow beds), then
+    a finer grid to fill gaps left around plantings of other spacings. The
+    lattices are sized from their axes and walked lazily, so large beds with
+    small spacings cost nothing beyond the candidates actually tried.
+    """
+    hexagonal = _HexLattice(width, length, spacing)
+    square = _SquareLattice(width, length, spacing + _PITCH_PAD, spacing / 2)
+    lattice = hexagonal if len(hexagonal) >= len(square) else square
+    fine = _SquareLattice(width, length, spacing / _FALLBACK_STEPS, spacing / 2)
+    for x, y in chain(lattice, fine):
+        yield round(x, _DECIMALS), round(y, _DECIMALS)
+
+
+def pack_plantings(bed: Bed, groups: Sequence[Tuple[float, int]]) -> List[List[Point]]:
+    """
+    Finds positions for `count` new plantings at `spacing` (in the bed's
+    unit) for each (spacing, count) in `groups`, and returns them per group
+    in the same order. The positions lie inside the bed and conflict neither
+    with each other nor with the bed's current plantings, so adding them
+    leaves the bed's spacing and boundary issues unchanged.
+
+    Groups are placed widest spacing first, each on its own hex lattice kept
+    half a spacing away from the bed edges, with a finer grid as a fallback
+    when plantings of other spacings leave only gaps. Raises ValueError if
+    the bed has no room for all of them.
+    """
+    if any(spacing <= 0 or count < 0 for spacing, count in groups):
+        raise ValueError("Spacings must be positive and counts non-negative")
+    width, length = bed.dimensions.width, bed.dimensions.length
+    occupied = _Occupied(min((spacing for spacing, _ in groups), default=1.0))
+    for planting in bed.plantings:
+        occupied.add(planting.position, planting.spacing or 0.0)
+
+    placed: List[List[Point]] = [[] for _ in groups]
+    for g in sorted(range(len(groups)), key=lambda g: -groups[g][0]):
+        spacing, count = groups[g]
+        if not count:
+            continue
+        positions = placed[g]
+        for candidate in _candidates(width, length, spacing):
+            if occupied.fits(candidate, spacing):
+                occupied.add(candidate, spacing)
+                positions.append(candidate)
+                if len(positions) == count:
+                    break
+        else:
+            raise ValueError(
+                f"Bed '{bed.name}' only has room for {len(positions)} of the "
+                f"{count} plantings at {spacing} {bed.dimensions.unit.value} spacing"
+            )
+    return placed
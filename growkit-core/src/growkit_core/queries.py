@@ -0,0 +1,477 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, timedelta
+from heapq import merge
+from operator import itemgetter
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+
+from growkit_core.index import garden_index
+from growkit_core.models import (
+    METERS_PER_UNIT,
+    Bed,
+    Dimensions,
+    Garden,
+    GardenTask,
+    Planting,
+    TaskStatus,
+)
+from growkit_core.registry import GardenRegistry
+from growkit_core.validators import bed_extent
+
+# (target_date, position in garden.tasks); every list below is kept sorted.
+_Entry = Tuple[date, int]
+# What a task was indexed under: (target_date, status, planting id, bed id).
+_Keys = Tuple[date, TaskStatus, Optional[str], Optional[str]]
+
+_entry_date = itemgetter(0)
+
+T = TypeVar("T")
+
+
+def _keys(task: GardenTask) -> _Keys:
+    return (
+        task.target_date,
+        task.status,
+        task.related_planting_id,
+        task.related_bed_id,
+    )
+
+
+class TaskIndex:
+    """
+    A garden's tasks ordered by target_date, plus the same ordering per
+    status, per related planting and per related bed, so that date-range
+    queries on any of them are a binary search instead of a scan.
+
+    The index is rebuilt when garden.tasks was replaced or resized behind its
+    back. growkit_core.api and apply_patch report their own changes; other
+    in-place edits of a task must be reported through task_changed() or
+    invalidate().
+    """
+
+    def __init__(self):
+        # garden.tasks as indexed, and its length then (see index._ListShape).
+        self._shape: Optional[Tuple[list, int]] = None
+        self._keys: List[_Keys] = []
+        self._by_date: List[_Entry] = []
+        self._by_status: Dict[TaskStatus, List[_Entry]] = {}
+        self._by_planting: Dict[str, List[_Entry]] = {}
+        self._by_bed: Dict[str, List[_Entry]] = {}
+
+    def invalidate(self) -> None:
+        self.__init__()
+
+    # ---------- Maintenance ----------
+
+    def task_added(self, garden: Garden) -> None:
+        """Records the task just appended to garden.tasks."""
+        tasks = garden.tasks
+        if not self._indexed(tasks, 1):
+            self.invalidate()
+            return
+        self._shape = tasks, len(tasks)
+        self._keys.append(_keys(tasks[-1]))
+        self._insert(len(tasks) - 1)
+
+    def task_changed(self, garden: Garden, position: int) -> None:
+        """Re-indexes the task at `position` after an in-place edit."""
+        tasks = garden.tasks
+        if not self._indexed(tasks):
+            self.invalidate()
+            return
+        self._remove(position)
+        self._keys[position] = _keys(tasks[position])
+        self._insert(position)
+
+    def list_copied(self, old: list, new: list) -> None:
+        """Records that garden.tasks was swapped for `new`, an equal copy."""
+        if self._indexed(old):
+            self._shape = new, len(new)
+
+    # ---------- Queries ----------
+
+    def query(
+        self,
+        garden: Garden,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        statuses: Optional[Sequence[TaskStatus]] = None,
+        planting_id: Optional[str] = None,
+        bed_id: Optional[str] = None,
+    ) -> List[int]:
+        """
+        Positions in garden.tasks of the tasks with start <= target_date <=
+        end (either bound may be omitted) matching all given filters, in
+        target_date order (ties in list order).
+        """
+        self._refresh(garden)
+        if planting_id is not None:
+            sources = [self._by_planting.get(planting_id, [])]
+        elif bed_id is not None:
+            sources = [self._by_bed.get(bed_id, [])]
+        elif statuses is not None:
+            sources = [self._by_status.get(TaskStatus(s), []) for s in set(statuses)]
+        else:
+            sources = [self._by_date]
+        entries: Iterable[_Entry] = merge(
+            *(self._date_range(source, start, end) for source in sources)
+        )
+        wanted = None if statuses is None else {TaskStatus(s) for s in statuses}
+        positions = []
+        for _, position in entries:
+            _, status, planting, bed = self._keys[position]
+            if (
+                (wanted is None or status in wanted)
+                and (planting_id is None or planting == planting_id)
+                and (bed_id is None or bed == bed_id)
+            ):
+                positions.append(position)
+        return positions
+
+    # ---------- Internals ----------
+
+    @staticmethod
+    def _date_range(
+        entries: List[_Entry], start: Optional[date], end: Optional[date]
+    ) -> List[_Entry]:
+        lo = 0 if start is None else bisect_left(entries, start, key=_entry_date)
+        hi = (
+            len(entries) if end is None else bisect_right(entries, end, key=_entry_date)
+        )
+        return entries[lo:hi]
+
+    def _refresh(self, garden: Garden) -> None:
+        tasks = garden.tasks
+        if self._indexed(tasks):
+            return
+        self.invalidate()
+        self._keys = [_keys(task) for task in tasks]
+        # Append in list order and sort each list once, rather than an
+        # insort per task, which is quadratic on large task lists.
+        for position, keys in enumerate(self._keys):
+            for entries in self._lists(keys):
+                entries.append((keys[0], position))
+        for entries in self._all_lists():
+            entries.sort()
+        self._shape = tasks, len(tasks)
+
+    def _all_lists(self) -> List[List[_Entry]]:
+        return [
+            self._by_date,
+            *self._by_status.values(),
+            *self._by_planting.values(),
+            *self._by_bed.values(),
+        ]
+
+    def _indexed(self, tasks: list, delta: int = 0) -> bool:
+        """Whether `tasks` is the indexed list, with `delta` tasks added since."""
+        return (
+            self._shape is not None
+            and self._shape[0] is tasks
+            and self._shape[1] + delta == len(tasks)
+        )
+
+    def _lists(self, keys: _Keys) -> List[List[_Entry]]:
+        _, status, planting_id, bed_id = keys
+        lists = [self._by_date, self._by_status.setdefault(status, [])]
+        if planting_id is not None:
+            lists.append(self._by_planting.setdefault(planting_id, []))
+        if bed_id is not None:
+            lists.append(self._by_bed.setdefault(bed_id, []))
+        return lists
+
+    def _insert(self, position: int) -> None:
+        keys = self._keys[position]
+        for entries in self._lists(keys):
+            insort(entries, (keys[0], position))
+
+    def _remove(self, position: int) -> None:
+        keys = self._keys[position]
+        entry = (keys[0], position)
+        for entries in self._lists(keys):
+            del entries[bisect_left(entries, entry)]
+
+
+_indexes: GardenRegistry[TaskIndex] = GardenRegistry(TaskIndex)
+
+
+def task_index(garden: Garden) -> TaskIndex:
+    """Returns the TaskIndex attached to this garden."""
+    return _indexes.get(garden)
+
+
+# ---------- Query API ----------
+
+Offset = Annotated[int, Field(ge=0)]
+Limit = Annotated[int, Field(gt=0, le=500)]
+
+
+def _page(items: Sequence[T], offset: int, limit: int) -> Tuple[List[T], Optional[int]]:
+    """Returns items[offset:offset + limit] and the offset of the next page."""
+    page = list(items[offset : offset + limit])
+    end = offset + len(page)
+    return page, end if end < len(items) else None
+
+
+class TaskQuery(BaseModel):
+    start: Optional[date] = None  # earliest target_date, inclusive
+    end: Optional[date] = None  # latest target_date, inclusive
+    status: Optional[List[TaskStatus]] = None
+    planting_id: Optional[str] = None
+    bed_id: Optional[str] = None
+    offset: Offset = 0
+    limit: Limit = 50
+
+
+class TaskPage(BaseModel):
+    tasks: List[GardenTask]
+    total: int  # number of matching tasks across all pages
+    next_offset: Optional[int] = None
+
+
+def query_tasks(garden: Garden, query: TaskQuery) -> TaskPage:
+    """Returns one page of the tasks matching `query`, by target_date."""
+    positions = task_index(garden).query(
+        garden,
+        start=query.start,
+        end=query.end,
+        statuses=query.status,
+        planting_id=query.planting_id,
+        bed_id=query.bed_id,
+    )
+    page, next_offset = _page(positions, query.offset, query.limit)
+    return TaskPage(
+        tasks=[garden.tasks[i] for i in page],
+        total=len(positions),
+        next_offset=next_offset,
+    )
+
+
+def tasks_due(garden: Garden, start: date, end: date) -> List[GardenTask]:
+    """Pending tasks with a target_date between start and end, inclusive."""
+    positions = task_index(garden).query(
+        garden, start=start, end=end, statuses=[TaskStatus.pending]
+    )
+    return [garden.tasks[i] for i in positions]
+
+
+def overdue_tasks(garden: Garden, today: Optional[date] = None) -> List[GardenTask]:
+    """Pending tasks whose target_date is before `today`."""
+    today = today or date.today()
+    positions = task_index(garden).query(
+        garden, end=today - timedelta(days=1), statuses=[TaskStatus.pending]
+    )
+    return [garden.tasks[i] for i in positions]
+
+
+def tasks_for(
+    garden: Garden,
+    planting_id: Optional[str] = None,
+    bed_id: Optional[str] = None,
+    status: Optional[Union[TaskStatus, Sequence[TaskStatus]]] = None,
+) -> List[GardenTask]:
+    """Tasks related to a planting and/or bed, optionally of given status(es)."""
+    if isinstance(status, TaskStatus):
+        status = [status]
+    positions = task_index(garden).query(
+        garden, statuses=status, planting_id=planting_id, bed_id=bed_id
+    )
+    return [garden.tasks[i] for i in positions]
+
+
+# ---------- Beds and plantings ----------
+
+
+def _footprint(planting: Planting, scale: float) -> float:
+    # A planting claims a spacing x spacing square; spacing is in the bed's
+    # unit, `scale` meters each.
+    return ((planting.spacing or 0) * scale) ** 2
+
+
+class BedSummary(BaseModel):
+    """A bed without its plantings."""
+
+    id: str
+    name: str
+    position: Optional[Tuple[float, float]] = None
+    dimensions: Dimensions
+    soil_type: Optional[str] = None
+    planting_count: int
+    area: float  # square meters
+    planted_area: float  # square meters claimed by planting spacings
+    density: float  # plantings per square meter
+
+
+def summarize_bed(bed: Bed) -> BedSummary:
+    width, length = bed_extent(bed)
+    area = width * length
+    scale = METERS_PER_UNIT[bed.dimensions.unit]
+    return BedSummary(
+        id=bed.id,
+        name=bed.name,
+        position=bed.position,
+        dimensions=bed.dimensions,
+        soil_type=bed.soil_type,
+        planting_count=len(bed.plantings),
+        area=area,
+        planted_area=sum(_footprint(p, scale) for p in bed.plantings),
+        density=len(bed.plantings) / area if area else 0.0,
+    )
+
+
+class BedQuery(BaseModel):
+    offset: Offset = 0
+    limit: Limit = 50
+
+
+class BedPage(BaseModel):
+    beds: List[BedSummary]
+    total: int
+    next_offset: Optional[int] = None
+
+
+def list_beds(garden: Garden, query: BedQuery) -> BedPage:
+    """Returns one page of bed summaries, in garden order."""
+    beds, next_offset = _page(garden.beds, query.offset, query.limit)
+    return BedPage(
+        beds=[summarize_bed(bed) for bed in beds],
+        total=len(garden.beds),
+        next_offset=next_offset,
+    )
+
+
+class BedDetail(BedSummary):
+    """A bed's summary, metadata and one page of its plantings."""
+
+    metadata: Optional[Dict[str, Any]] = None
+    plantings: List[Planting]
+    next_offset: Optional[int] = None  # of the next page of plantings
+
+
+def get_bed(garden: Garden, bed_id: str, offset: int = 0, limit: int = 50) -> BedDetail:
+    """
+    Returns the bed with plantings[offset:offset + limit]; planting_count is
+    the total. Raises ValueError if bed_id is not a bed of the garden.
+    """
+    bed = garden_index(garden).bed(garden, bed_id)
+    if bed is None:
+        raise ValueError(f"No bed found with id {bed_id}")
+    plantings, next_offset = _page(bed.plantings, offset, limit)
+    return BedDetail(
+        **dict(summarize_bed(bed)),
+        metadata=bed.metadata,
+        plantings=plantings,
+        next_offset=next_offset,
+    )
+
+
+class PlantingQuery(BaseModel):
+    bed_id: Optional[str] = None
+    species: Optional[str] = None  # case-insensitive
+    planted_from: Optional[date] = None  # earliest planted_on, inclusive
+    planted_to: Optional[date] = None  # latest planted_on, inclusive
+    offset: Offset = 0
+    limit: Limit = 50
+
+
+class BedPlanting(Planting):
+    bed_id: str
+
+
+class PlantingPage(BaseModel):
+    plantings: List[BedPlanting]
+    total: int
+    next_offset: Optional[int] = None
+
+
+def _planting_matches(planting: Planting, query: PlantingQuery) -> bool:
+    if query.species is not None and (
+        planting.species.casefold() != query.species.casefold()
+    ):
+        return False
+    if query.planted_from is None and query.planted_to is None:
+        return True
+    planted = planting.planted_on
+    return (
+        planted is not None
+        and (query.planted_from is None or planted >= query.planted_from)
+        and (query.planted_to is None or planted <= query.planted_to)
+    )
+
+
+def list_plantings(garden: Garden, query: PlantingQuery) -> PlantingPage:
+    """
+    Returns one page of the plantings matching `query`, bed by bed in garden
+    order. Raises ValueError if query.bed_id is not a bed of the garden.
+    """
+    if query.bed_id is None:
+        beds = garden.beds
+    else:
+        bed = garden_index(garden).bed(garden, query.bed_id)
+        if bed is None:
+            raise ValueError(f"No bed found with id {query.bed_id}")
+        beds = [bed]
+    matches = [
+        (bed, planting)
+        for bed in beds
+        for planting in bed.plantings
+        if _planting_matches(planting, query)
+    ]
+    page, next_offset = _page(matches, query.offset, query.limit)
+    return PlantingPage(
+        plantings=[
+            BedPlanting(bed_id=bed.id, **dict(planting)) for bed, planting in page
+        ],
+        total=len(matches),
+        next_offset=next_offset,
+    )
+
+
+class GardenStats(BaseModel):
+    bed_count: int
+    planting_count: int
+    task_count: int
+    tasks_by_status: Dict[TaskStatus, int]
+    plantings_by_species: Dict[str, int]
+    bed_area: float  # square meters
+    planted_area: float  # square meters claimed by planting spacings
+    density: float  # plantings per square meter of bed
+    densest_bed_id: Optional[str] = None
+
+
+def garden_stats(garden: Garden) -> GardenStats:
+    """Counts and areas for the whole garden; see summarize_bed per bed."""
+    summaries = [summarize_bed(bed) for bed in garden.beds]
+    species: Dict[str, int] = {}
+    for bed in garden.beds:
+        for planting in bed.plantings:
+            species[planting.species] = species.get(planting.species, 0) + 1
+    statuses = {status: 0 for status in TaskStatus}
+    for task in garden.tasks:
+        statuses[task.status] += 1
+    planting_count = sum(s.planting_count for s in summaries)
+    bed_area = sum(s.area for s in summaries)
+    densest = max(summaries, key=lambda s: s.density, default=None)
+    return GardenStats(
+        bed_count=len(summaries),
+        planting_count=planting_count,
+        task_count=len(garden.tasks),
+        tasks_by_status=statuses,
+        plantings_by_species=species,
+        bed_area=bed_area,
+        planted_area=sum(s.planted_area for s in summaries),
+        density=planting_count / bed_area if bed_area else 0.0,
+        densest_bed_id=densest.id if densest is not None else None,
+    )
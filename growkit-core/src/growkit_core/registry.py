@@ -0,0 +1,34 @@
+import weakref
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+from growkit_core.models import Garden
+
+T = TypeVar("T")
+
+
+class GardenRegistry(Generic[T]):
+    """
+    Side-car state attached to a Garden by object identity.
+
+    State is kept out of the pydantic model so it never shows up in dumps,
+    schemas or equality checks, and it is dropped when the garden is garbage
+    collected. Copies of a garden start with fresh state.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._entries: Dict[int, T] = {}
+
+    def get(self, garden: Garden) -> T:
+        key = id(garden)
+        state = self._entries.get(key)
+        if state is None:
+            state = self._entries[key] = self._factory()
+            weakref.finalize(garden, self._entries.pop, key, None)
+        return state
+
+    def peek(self, garden: Garden) -> Optional[T]:
+        return self._entries.get(id(garden))
+
+    def discard(self, garden: Garden) -> None:
+        self._entries.pop(id(garden), None)
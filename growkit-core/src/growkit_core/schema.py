@@ -1,14 +1,84 @@
+import copy
 import json
+from importlib import resources
 from pathlib import Path
+from typing import Any, Dict, Optional
 
-from growkit_core.models import Garden
+from growkit_core.models import SCHEMA_VERSION, Garden
 
+# Pre-generated schemas ship in growkit_core/schemas/, one file per version,
+# so processes serving the schema never have to generate it.
+PACKAGED_SCHEMA = f"garden-{SCHEMA_VERSION}.json"
 
-def get_garden_schema() -> dict:
+# Serialized schema per SCHEMA_VERSION.
+_cache: Dict[str, bytes] = {}
+_inline_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def generate_garden_schema() -> dict:
+    """Builds the schema from the models, bypassing every cache."""
     return Garden.model_json_schema()
 
 
+def _encode(schema: dict) -> bytes:
+    return (json.dumps(schema, indent=2) + "\n").encode("utf-8")
+
+
+def _read_packaged_schema() -> Optional[bytes]:
+    path = resources.files("growkit_core") / "schemas" / PACKAGED_SCHEMA
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def garden_schema_json() -> bytes:
+    """
+    The garden JSON schema for SCHEMA_VERSION, serialized. It is read from the
+    packaged file if there is one and generated otherwise, once per process.
+    """
+    data = _cache.get(SCHEMA_VERSION)
+    if data is None:
+        data = _read_packaged_schema() or _encode(generate_garden_schema())
+        _cache[SCHEMA_VERSION] = data
+    return data
+
+
+def get_garden_schema() -> dict:
+    return json.loads(garden_schema_json())
+
+
+def _inline(node: Any, definitions: Dict[str, Any]) -> Any:
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if ref is not None:
+            return _inline(definitions[ref.rsplit("/", 1)[-1]], definitions)
+        return {k: _inline(v, definitions) for k, v in node.items() if k != "$defs"}
+    if isinstance(node, list):
+        return [_inline(v, definitions) for v in node]
+    return node
+
+
+def inline_garden_schema() -> Dict[str, Any]:
+    """
+    The garden schema with every $ref replaced by its definition, so it can
+    be embedded in a larger schema (e.g. through pydantic's WithJsonSchema)
+    without its $defs. The garden models are not recursive, so this is finite.
+    """
+    schema = _inline_cache.get(SCHEMA_VERSION)
+    if schema is None:
+        schema = get_garden_schema()
+        schema = _inline_cache[SCHEMA_VERSION] = _inline(
+            schema, schema.get("$defs", {})
+        )
+    return copy.deepcopy(schema)
+
+
 def save_garden_schema(path: Path) -> None:
-    schema = get_garden_schema()
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(_encode(generate_garden_schema()))
+
+
+def packaged_schema_path() -> Path:
+    """Where save_garden_schema should write the schema shipped with the package."""
+    return Path(__file__).parent / "schemas" / PACKAGED_SCHEMA
@@ -0,0 +1,183 @@
+from collections import defaultdict
+from heapq import heappop, heappush
+from math import dist, floor
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Set, Tuple
+
+Point = Tuple[float, float]
+
+
+class SpatialGrid:
+    """
+    Uniform grid over 2D points. Points are bucketed by cell so that a radius
+    query only visits the cells the query circle can reach.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than zero")
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Tuple[int, Point]]] = defaultdict(list)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def insert(self, key: int, point: Point) -> None:
+        self._cells[self._cell(*point)].append((key, point))
+
+    def query(self, point: Point, radius: float) -> Iterator[Tuple[int, Point]]:
+        """
+        Yields (key, point) for every point whose cell touches the square of
+        half-width `radius` around `point`. Callers filter by exact distance.
+        """
+        x, y = point
+        x0, y0 = self._cell(x - radius, y - radius)
+        x1, y1 = self._cell(x + radius, y + radius)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            # Huge radius relative to the cell size: walking the occupied
+            # cells is cheaper than walking the query rectangle.
+            for (cx, cy), items in self._cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    yield from items
+            return
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                items = self._cells.get((cx, cy))
+                if items:
+                    yield from items
+
+
+def spacing_conflict_pairs(
+    positions: Sequence[Point], spacings: Sequence[float]
+) -> List[Tuple[int, int]]:
+    """
+    Returns sorted (i, j) index pairs, i < j, where the distance between the two
+    positions is less than max(spacings[i], spacings[j]).
+
+    Each pair is found from the planting with the larger spacing, so the grid
+    cell can be sized for the typical planting instead of the largest one.
+    """
+    positive = sorted(s for s in spacings if s > 0)
+    if not positive:
+        return []
+    grid = SpatialGrid(positive[len(positive) // 2])
+    for i, position in enumerate(positions):
+        grid.insert(i, position)
+
+    pairs = []
+    for i, (position, spacing) in enumerate(zip(positions, spacings)):
+        if spacing <= 0:
+            continue
+        for j, other in grid.query(position, spacing):
+            other_spacing = spacings[j]
+            # The pair belongs to whichever side has the larger spacing;
+            # on a tie the lower index owns it.
+            if other_spacing > spacing or (other_spacing == spacing and j <= i):
+                continue
+            if dist(position, other) < spacing:
+                pairs.append((i, j) if i < j else (j, i))
+    pairs.sort()
+    return pairs
+
+
+# (x0, y0, x1, y1) of an axis-aligned rectangle, x0 <= x1 and y0 <= y1.
+Rect = Tuple[float, float, float, float]
+
+
+def rectangles_overlap(a: Rect, b: Rect) -> bool:
+    """Whether the interiors intersect; rectangles that only touch do not."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def overlapping_rectangles(rects: Sequence[Optional[Rect]]) -> List[Tuple[int, int]]:
+    """
+    Returns sorted (i, j) index pairs, i < j, of overlapping rectangles. None
+    entries are skipped.
+
+    A line sweeps along x over the rectangles in order of their left edge,
+    keeping those it currently crosses in a heap keyed by their right edge,
+    so each rectangle is only compared with rectangles sharing part of its x
+    range.
+    """
+    order = sorted((rect[0], i) for i, rect in enumerate(rects) if rect is not None)
+    active: List[Tuple[float, int]] = []
+    pairs = []
+    for x0, i in order:
+        while active and active[0][0] <= x0:
+            heappop(active)
+        rect = rects[i]
+        for _, j in active:
+            if rectangles_overlap(rect, rects[j]):
+                pairs.append((i, j) if i < j else (j, i))
+        heappush(active, (rect[2], i))
+    pairs.sort()
+    return pairs
+
+
+class RectangleGrid:
+    """
+    Uniform grid over keyed rectangles that supports updates, for finding
+    the rectangles overlapping one of them without scanning all of them.
+
+    Each rectangle is listed in every cell it covers. Rectangles covering
+    more than `max_cells` cells are kept aside and checked on every query
+    instead, so one huge rectangle does not fill the whole grid.
+    """
+
+    def __init__(self, cell_size: float, max_cells: int = 64):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than zero")
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self._rects: Dict[Hashable, Rect] = {}
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = defaultdict(set)
+        self._large: Set[Hashable] = set()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rects
+
+    def _span(self, rect: Rect) -> Tuple[range, range]:
+        size = self.cell_size
+        return (
+            range(floor(rect[0] / size), floor(rect[2] / size) + 1),
+            range(floor(rect[1] / size), floor(rect[3] / size) + 1),
+        )
+
+    def insert(self, key: Hashable, rect: Rect) -> None:
+        self.remove(key)
+        self._rects[key] = rect
+        xs, ys = self._span(rect)
+        if len(xs) * len(ys) > self.max_cells:
+            self._large.add(key)
+            return
+        for cx in xs:
+            for cy in ys:
+                self._cells[cx, cy].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        if key in self._large:
+            self._large.discard(key)
+            return
+        xs, ys = self._span(rect)
+        for cx in xs:
+            for cy in ys:
+                cell = self._cells[cx, cy]
+                cell.discard(key)
+                if not cell:
+                    del self._cells[cx, cy]
+
+    def overlapping(self, rect: Rect) -> Set[Hashable]:
+        """Keys of the stored rectangles whose interiors intersect `rect`."""
+        xs, ys = self._span(rect)
+        candidates = set(self._large)
+        if len(xs) * len(ys) > len(self._cells):
+            for (cx, cy), keys in self._cells.items():
+                if cx in xs and cy in ys:
+                    candidates |= keys
+        else:
+            for cx in xs:
+                for cy in ys:
+                    candidates |= self._cells.get((cx, cy), set())
+        return {key for key in candidates if rectangles_overlap(rect, self._rects[key])}
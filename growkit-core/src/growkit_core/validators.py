@@ -1,9 +1,14 @@
-from math import dist
-from typing import List, Optional, Tuple
+from datetime import date
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
-from growkit_core.models import Bed, Garden, GardenTask, Planting
+from growkit_core.instrumentation import instrumented
+from growkit_core.models import METERS_PER_UNIT, Bed, Garden, GardenTask, Planting
+from growkit_core.spatial import Rect, overlapping_rectangles, spacing_conflict_pairs
+
+if TYPE_CHECKING:
+    from growkit_core.columnar import ColumnarBed
 
 
 class GardenValidationException(Exception):
@@ -13,36 +18,81 @@ class GardenValidationException(Exception):
         super().__init__(msg)
 
 
-def validate_spacing_conflicts(bed: Bed) -> List[Tuple[Planting, Planting]]:
+@instrumented("validators.validate_spacing_conflicts")
+def validate_spacing_conflicts(
+    bed: Union[Bed, "ColumnarBed"],
+) -> List[Tuple[Planting, Planting]]:
     """
     Returns a list of (planting1, planting2) tuples that are too close together
     (based on max of their spacing values).
     """
-    conflicts = []
-    for i, p1 in enumerate(bed.plantings):
-        for j, p2 in enumerate(bed.plantings):
-            if i >= j:
-                continue  # skip self or repeats
-            spacing1 = p1.spacing or 0
-            spacing2 = p2.spacing or 0
-            min_distance = max(spacing1, spacing2)
-            if dist(p1.position, p2.position) < min_distance:
-                conflicts.append((p1, p2))
-    return conflicts
+    if not isinstance(bed, Bed):
+        pairs = bed.spacing_conflicts()
+        involved = sorted({i for pair in pairs for i in pair})
+        plantings = dict(zip(involved, bed.plantings(involved)))
+        return [(plantings[i], plantings[j]) for i, j in pairs]
+    plantings = bed.plantings
+    pairs = spacing_conflict_pairs(
+        [p.position for p in plantings], [p.spacing or 0 for p in plantings]
+    )
+    return [(plantings[i], plantings[j]) for i, j in pairs]
+
+
+def bed_extent(bed: Union[Bed, "ColumnarBed"]) -> Tuple[float, float]:
+    """
+    Returns the bed's (width, length) in meters, the unit beds are laid out
+    in across the garden.
+    """
+    scale = METERS_PER_UNIT[bed.dimensions.unit]
+    return bed.dimensions.width * scale, bed.dimensions.length * scale
 
 
-def validate_bed_boundaries(bed: Bed) -> List[Planting]:
+@instrumented("validators.validate_bed_boundaries")
+def validate_bed_boundaries(bed: Union[Bed, "ColumnarBed"]) -> List[Planting]:
     """
     Returns plantings that are outside the bed's boundaries (width, length).
     Assumes bed is laid out starting at (0,0) and extends to (width, length).
+    Planting positions are in the bed's unit, like its dimensions.
     """
-    issues = []
+    if not isinstance(bed, Bed):
+        return bed.plantings(bed.boundary_violations())
     width, length = bed.dimensions.width, bed.dimensions.length
-    for p in bed.plantings:
-        x, y = p.position
-        if not (0 <= x <= width and 0 <= y <= length):
-            issues.append(p)
-    return issues
+    return [
+        p
+        for p in bed.plantings
+        if not (0 <= p.position[0] <= width and 0 <= p.position[1] <= length)
+    ]
+
+
+def validate_garden_boundaries(garden: Garden) -> List[Tuple[str, Planting]]:
+    """
+    Checks all beds for plantings outside their boundaries. Returns
+    (bed name, planting).
+    """
+    return [(bed.name, p) for bed in garden.beds for p in validate_bed_boundaries(bed)]
+
+
+def bed_rectangle(bed: Bed) -> Optional[Rect]:
+    """
+    Returns the bed's footprint (x0, y0, x1, y1) in meters, or None if the bed
+    has no position.
+    """
+    if bed.position is None:
+        return None
+    x, y = bed.position
+    width, length = bed_extent(bed)
+    return x, y, x + width, y + length
+
+
+@instrumented("validators.validate_bed_overlaps")
+def validate_bed_overlaps(garden: Garden) -> List[Tuple[Bed, Bed]]:
+    """
+    Returns (bed1, bed2) pairs of positioned beds whose footprints overlap,
+    in garden order. Beds that only share an edge do not overlap.
+    """
+    beds = garden.beds
+    pairs = overlapping_rectangles([bed_rectangle(bed) for bed in beds])
+    return [(beds[i], beds[j]) for i, j in pairs]
 
 
 def validate_garden_spacing(garden: Garden) -> List[Tuple[str, Planting, Planting]]:
@@ -56,78 +106,112 @@ def validate_garden_spacing(garden: Garden) -> List[Tuple[str, Planting, Plantin
     return issues
 
 
+def is_task_date_invalid(
+    task: GardenTask, planting: Optional[Planting], garden_created_on: date
+) -> bool:
+    """
+    Checks a single task against its related planting (if any) or the garden's
+    creation date. `planting` is the planting the task refers to, or None when
+    it cannot be found.
+    """
+    # Planting-specific tasks
+    if task.related_planting_id:
+        return bool(
+            planting and planting.planted_on and task.target_date < planting.planted_on
+        )
+    # General garden task
+    return task.target_date < garden_created_on
+
+
+@instrumented("validators.validate_task_dates")
 def validate_task_dates(garden: Garden) -> List[GardenTask]:
     """
     Returns a list of tasks where the target_date is before the planting's planted_on
     or before the garden's created_at (if not related to a planting).
     """
-    invalid_tasks = []
     plantings_by_id = {p.id: p for bed in garden.beds for p in bed.plantings}
-    for task in garden.tasks:
-        # Planting-specific tasks
-        if task.related_planting_id:
-            planting = plantings_by_id.get(task.related_planting_id)
-            if (
-                planting
-                and planting.planted_on
-                and task.target_date < planting.planted_on
-            ):
-                invalid_tasks.append(task)
-        else:
-            # General garden task
-            if task.target_date < garden.created_at.date():
-                invalid_tasks.append(task)
-    return invalid_tasks
+    created_on = garden.created_at.date()
+    return [
+        task
+        for task in garden.tasks
+        if is_task_date_invalid(
+            task, plantings_by_id.get(task.related_planting_id or ""), created_on
+        )
+    ]
 
 
 class GardenValidationIssue(BaseModel):
     type: str
     message: str
     bed_name: Optional[str] = None
+    other_bed_name: Optional[str] = None
+    bed_id: Optional[str] = None
+    other_bed_id: Optional[str] = None
     planting1_id: Optional[str] = None
     planting2_id: Optional[str] = None
     task_id: Optional[str] = None
 
 
+def bed_spacing_issues(bed: Union[Bed, "ColumnarBed"]) -> List[GardenValidationIssue]:
+    return [
+        GardenValidationIssue(
+            type="spacing_conflict",
+            message=f"Plantings {p1.species} and {p2.species} are too close together in bed '{bed.name}'.",
+            bed_name=bed.name,
+            planting1_id=p1.id,
+            planting2_id=p2.id,
+        )
+        for p1, p2 in validate_spacing_conflicts(bed)
+    ]
+
+
+def bed_boundary_issues(bed: Union[Bed, "ColumnarBed"]) -> List[GardenValidationIssue]:
+    return [
+        GardenValidationIssue(
+            type="bed_boundary",
+            message=f"Planting {p.species} at position {p.position} is outside the boundaries of bed '{bed.name}'.",
+            bed_name=bed.name,
+            planting1_id=p.id,
+        )
+        for p in validate_bed_boundaries(bed)
+    ]
+
+
+def bed_overlap_issue(bed1: Bed, bed2: Bed) -> GardenValidationIssue:
+    return GardenValidationIssue(
+        type="bed_overlap",
+        message=f"Beds '{bed1.name}' and '{bed2.name}' overlap.",
+        bed_name=bed1.name,
+        other_bed_name=bed2.name,
+        bed_id=bed1.id,
+        other_bed_id=bed2.id,
+    )
+
+
+def task_date_issue(task: GardenTask) -> GardenValidationIssue:
+    if task.related_planting_id:
+        return GardenValidationIssue(
+            type="task_date",
+            message=f"Task '{task.title}' is scheduled before planting date.",
+            task_id=task.id,
+            planting1_id=task.related_planting_id,
+        )
+    return GardenValidationIssue(
+        type="task_date",
+        message=f"Task '{task.title}' is scheduled before garden creation.",
+        task_id=task.id,
+    )
+
+
+@instrumented("validators.validate_garden")
 def validate_garden(garden: Garden) -> List[GardenValidationIssue]:
     issues = []
     for bed in garden.beds:
-        for p1, p2 in validate_spacing_conflicts(bed):
-            issues.append(
-                GardenValidationIssue(
-                    type="spacing_conflict",
-                    message=f"Plantings {p1.species} and {p2.species} are too close together in bed '{bed.name}'.",
-                    bed_name=bed.name,
-                    planting1_id=p1.id,
-                    planting2_id=p2.id,
-                )
-            )
+        issues.extend(bed_spacing_issues(bed))
     for bed in garden.beds:
-        for p in validate_bed_boundaries(bed):
-            issues.append(
-                GardenValidationIssue(
-                    type="bed_boundary",
-                    message=f"Planting {p.species} at position {p.position} is outside the boundaries of bed '{bed.name}'.",
-                    bed_name=bed.name,
-                    planting1_id=p.id,
-                )
-            )
+        issues.extend(bed_boundary_issues(bed))
+    for bed1, bed2 in validate_bed_overlaps(garden):
+        issues.append(bed_overlap_issue(bed1, bed2))
     for task in validate_task_dates(garden):
-        if task.related_planting_id:
-            issues.append(
-                GardenValidationIssue(
-                    type="task_date",
-                    message=f"Task '{task.title}' is scheduled before planting date.",
-                    task_id=task.id,
-                    planting1_id=task.related_planting_id,
-                )
-            )
-        else:
-            issues.append(
-                GardenValidationIssue(
-                    type="task_date",
-                    message=f"Task '{task.title}' is scheduled before garden creation.",
-                    task_id=task.id,
-                )
-            )
+        issues.append(task_date_issue(task))
     return issues
@@ -1,10 +1,14 @@
+from datetime import date
+
 import pytest
 
+import growkit_core.incremental as incremental
 from growkit_core.api import (
     AddBedParams,
     AddPlantingParams,
     AddTaskParams,
     CreateGardenParams,
+    GardenTransaction,
     MoveBedParams,
     RemoveBedParams,
     RemovePlantingParams,
@@ -13,6 +17,7 @@ from growkit_core.api import (
     add_bed,
     add_planting,
     add_task,
+    apply_batch,
     create_garden,
     move_bed,
     remove_bed,
@@ -20,7 +25,7 @@ from growkit_core.api import (
     update_bed_dimensions,
     update_garden_metadata,
 )
-from growkit_core.models import Coordinates, UnitLength
+from growkit_core.models import Bed, Coordinates, Dimensions, UnitLength
 from growkit_core.validators import GardenValidationException, validate_garden
 
 
@@ -54,6 +59,82 @@ def test_add_bed_to_garden():
     assert bed.soil_type == "sandy"
 
 
+def test_existing_overlaps_do_not_block_unrelated_edits():
+    # Beds created before bed positions were checked all sit at (0, 0).
+    garden = create_garden(CreateGardenParams(name="Legacy"))
+    garden.beds = [
+        Bed(name=name, position=(0, 0), dimensions=Dimensions(width=1, length=1))
+        for name in ("A", "B")
+    ]
+    assert [i.type for i in validate_garden(garden)] == ["bed_overlap"]
+
+    bed_id = garden.beds[0].id
+    add_planting(
+        garden,
+        AddPlantingParams(bed_id=bed_id, species="Kale", position=(0.5, 0.5)),
+    )
+    add_bed(garden, AddBedParams(name="C", width=1, length=1))
+    assert garden.beds[2].position == (1.5, 0.0)
+
+    with pytest.raises(GardenValidationException, match="overlap"):
+        apply_batch(
+            garden, [MoveBedParams(bed_id=garden.beds[2].id, new_position=(0, 0))]
+        )
+    move_bed(garden, MoveBedParams(bed_id=garden.beds[1].id, new_position=(3, 0)))
+    assert validate_garden(garden) == []
+
+
+def test_rolled_back_move_does_not_block_unrelated_edits():
+    garden = create_garden(CreateGardenParams(name="Legacy"))
+    garden.beds = [
+        Bed(name=name, position=(0, 0), dimensions=Dimensions(width=1, length=1))
+        for name in ("A", "B")
+    ]
+    moved = garden.beds[0].id
+    with pytest.raises(GardenValidationException):
+        apply_batch(
+            garden,
+            [
+                MoveBedParams(bed_id=moved, new_position=(5, 5)),
+                AddTaskParams(title="Too early", target_date=date(2000, 1, 1)),
+            ],
+        )
+    with pytest.raises(ValueError):
+        apply_batch(
+            garden,
+            [
+                MoveBedParams(bed_id=moved, new_position=(5, 5)),
+                MoveBedParams(bed_id="missing", new_position=(0, 0)),
+            ],
+        )
+    assert garden.beds[0].position == (0, 0)
+    assert incremental.incremental_validator(garden).pending_moves() == frozenset()
+
+    add_planting(
+        garden,
+        AddPlantingParams(
+            bed_id=garden.beds[1].id, species="Kale", position=(0.5, 0.5)
+        ),
+    )
+    assert len(garden.beds[1].plantings) == 1
+
+
+def test_adding_beds_without_positions_scans_beds_once(monkeypatch):
+    calls = []
+    rectangle = incremental.bed_rectangle
+    monkeypatch.setattr(
+        incremental, "bed_rectangle", lambda bed: calls.append(1) or rectangle(bed)
+    )
+    garden = create_garden(CreateGardenParams(name="Bulk"))
+    for i in range(200):
+        add_bed(
+            garden, AddBedParams(name=f"Bed {i}", width=1, length=1), validate=False
+        )
+    assert len(calls) == 200
+    assert garden.beds[-1].position == (199 * 1.5, 0.0)
+    assert validate_garden(garden) == []
+
+
 def test_add_planting_to_bed():
     garden = create_garden(CreateGardenParams(name="Planting Test Garden"))
     bed_params = AddBedParams(name="Bed X", width=1.0, length=1.0)
@@ -211,3 +292,96 @@ def test_add_garden_task():
     assert len(garden.tasks) == 1
     assert garden.tasks[0].title == "Mulch All Beds"
     assert garden.tasks[0].related_planting_id is None
+
+
+def make_batch_garden():
+    garden = create_garden(CreateGardenParams(name="Batch Garden"))
+    add_bed(garden, AddBedParams(name="A", width=1.0, length=1.0))
+    add_bed(garden, AddBedParams(name="B", width=1.0, length=1.0))
+    for bed in garden.beds:
+        for x in (0.2, 0.6):
+            add_planting(
+                garden,
+                AddPlantingParams(bed_id=bed.id, species="Kale", position=(x, 0.5)),
+            )
+    return garden
+
+
+def mixed_batch(garden):
+    a, b = garden.beds
+    return [
+        AddBedParams(name="C", position=(10.0, 0.0), width=2.0, length=2.0),
+        AddPlantingParams(bed_id=a.id, species="Beet", position=(0.9, 0.9)),
+        RemovePlantingParams(bed_id=b.id, planting_id=b.plantings[0].id),
+        MoveBedParams(bed_id=a.id, new_position=(5.0, 5.0)),
+        UpdateBedDimensionsParams(bed_id=b.id, width=3.0, length=3.0),
+        UpdateGardenMetadataParams(name="Renamed"),
+        RemoveBedParams(bed_id=a.id),
+    ]
+
+
+def test_apply_batch_validates_once(monkeypatch):
+    import growkit_core.api as api
+
+    garden = make_batch_garden()
+    calls = []
+    original = api._validate
+    monkeypatch.setattr(api, "_validate", lambda g: calls.append(g) or original(g))
+
+    apply_batch(garden, mixed_batch(garden))
+    assert len(calls) == 1
+    assert garden.name == "Renamed"
+    assert [bed.name for bed in garden.beds] == ["B", "C"]
+    assert garden.beds[0].dimensions.width == 3.0
+    assert len(garden.beds[0].plantings) == 1
+
+
+def test_apply_batch_rolls_back_on_validation_failure():
+    garden = make_batch_garden()
+    before = garden.model_dump()
+    operations = mixed_batch(garden) + [
+        AddPlantingParams(bed_id=garden.beds[1].id, species="Corn", position=(9.0, 9.0))
+    ]
+    operations.insert(0, AddTaskParams(title="Too early", target_date=date(2000, 1, 1)))
+
+    with pytest.raises(GardenValidationException):
+        apply_batch(garden, operations)
+    assert garden.model_dump() == before
+    assert validate_garden(garden) == []
+
+    # The garden is still usable through the indexed API afterwards.
+    remove_planting(
+        garden,
+        RemovePlantingParams(
+            bed_id=garden.beds[0].id, planting_id=garden.beds[0].plantings[1].id
+        ),
+    )
+    assert len(garden.beds[0].plantings) == 1
+
+
+def test_apply_batch_rolls_back_on_failed_operation():
+    garden = make_batch_garden()
+    before = garden.model_dump()
+    with pytest.raises(ValueError):
+        apply_batch(
+            garden,
+            mixed_batch(garden) + [MoveBedParams(bed_id="x", new_position=(0, 0))],
+        )
+    assert garden.model_dump() == before
+
+
+def test_transaction_context_manager():
+    garden = make_batch_garden()
+    with GardenTransaction(garden) as transaction:
+        transaction.apply(AddBedParams(name="D", width=1.0, length=1.0))
+        transaction.apply(AddBedParams(name="E", width=1.0, length=1.0))
+    assert len(garden.beds) == 4
+    assert transaction.created_ids == [bed.id for bed in garden.beds[2:]]
+
+    with pytest.raises(RuntimeError):
+        with GardenTransaction(garden) as transaction:
+            transaction.apply(RemoveBedParams(bed_id=garden.beds[0].id))
+            transaction.apply(AddTaskParams(title="T", target_date=date(2030, 1, 1)))
+            raise RuntimeError("abort")
+    assert len(garden.beds) == 4
+    assert transaction.created_ids == []
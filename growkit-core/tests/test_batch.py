@@ -0,0 +1,91 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from growkit_core import main
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    CreateGardenParams,
+    add_bed,
+    add_planting,
+    create_garden,
+)
+from growkit_core.batch import (
+    read_garden_lines,
+    read_gardens,
+    validate_many,
+    validate_to_jsonl,
+)
+from growkit_core.io import encode_compressed
+from growkit_core.models import Garden
+
+
+def make_garden(i: int) -> Garden:
+    garden = create_garden(CreateGardenParams(name=f"Garden {i}"))
+    add_bed(garden, AddBedParams(name="Bed", width=1, length=1))
+    # Every third garden has a planting outside its bed.
+    add_planting(
+        garden,
+        AddPlantingParams(
+            bed_id=garden.beds[0].id,
+            species="Kale",
+            position=(5, 5) if i % 3 == 0 else (0.5, 0.5),
+        ),
+        validate=False,
+    )
+    return garden
+
+
+def jsonl(gardens) -> bytes:
+    return b"".join(g.model_dump_json().encode() + b"\n" for g in gardens)
+
+
+def test_validate_many_keeps_input_order():
+    gardens = [make_garden(i) for i in range(40)]
+    raw = list(read_garden_lines(io.BytesIO(jsonl(gardens) + b"\n{broken\n"), "in"))
+    with ThreadPoolExecutor(2) as executor:
+        results = list(validate_many(raw, workers=2, chunk_size=3, executor=executor))
+    assert [r.source for r in results] == [f"in:{i}" for i in range(1, 41)] + ["in:42"]
+    assert [r.garden_id for r in results[:-1]] == [g.id for g in gardens]
+    assert [bool(r.issues) for r in results[:-1]] == [i % 3 == 0 for i in range(40)]
+    assert results[0].issues[0].type == "bed_boundary"
+    assert results[-1].error is not None
+
+
+def test_validate_directory_on_process_pool(tmp_path):
+    for i in range(5):
+        (tmp_path / f"{i}.json").write_text(make_garden(i).model_dump_json())
+    (tmp_path / "5.gkz").write_bytes(encode_compressed(make_garden(5)))
+    (tmp_path / "notes.txt").write_text("not a garden")
+
+    out = io.StringIO()
+    stats = validate_to_jsonl(read_gardens(tmp_path), out, workers=2, chunk_size=2)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [line["source"].rsplit("/", 1)[-1] for line in lines] == [
+        "0.json",
+        "1.json",
+        "2.json",
+        "3.json",
+        "4.json",
+        "5.gkz",
+    ]
+    assert (stats.gardens, stats.invalid, stats.errors) == (6, 2, 0)
+    assert stats.issues == 2
+
+
+def test_cli(tmp_path, capsys):
+    path = tmp_path / "gardens.jsonl"
+    path.write_bytes(jsonl(make_garden(i) for i in range(1, 3)))
+    assert main(["validate", str(path), "--workers", "1"]) == 0
+    out, err = capsys.readouterr()
+    assert len(out.splitlines()) == 2
+    assert "Validated 2 gardens" in err
+
+    path.write_bytes(jsonl([make_garden(0)]))
+    results = tmp_path / "results.jsonl"
+    assert main(["validate", str(path), "-w", "1", "-o", str(results)]) == 1
+    assert json.loads(results.read_text())["issues"]
+
+    assert main([]) == 0
+    assert "Garden" in capsys.readouterr().out
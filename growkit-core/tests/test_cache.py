@@ -0,0 +1,98 @@
+from datetime import date
+
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    CreateGardenParams,
+    MoveBedParams,
+    add_bed,
+    add_planting,
+    create_garden,
+    move_bed,
+)
+from growkit_core.cache import ValidationCache
+from growkit_core.models import Garden, GardenTask
+from growkit_core.validators import validate_garden
+
+
+def make_garden() -> Garden:
+    garden = create_garden(CreateGardenParams(name="Cached"))
+    for i in range(3):
+        add_bed(
+            garden, AddBedParams(name=f"Bed {i}", width=1, length=1), validate=False
+        )
+        for position in [(0.2, 0.2), (0.25, 0.2), (3.0, 3.0)]:
+            add_planting(
+                garden,
+                AddPlantingParams(
+                    bed_id=garden.beds[i].id,
+                    species="Kale",
+                    position=position,
+                    spacing=0.3,
+                    planted_on=date(2030, 5, 1),
+                ),
+                validate=False,
+            )
+    garden.tasks.append(
+        GardenTask(
+            title="Thin",
+            target_date=date(2030, 4, 1),
+            related_planting_id=garden.beds[0].plantings[0].id,
+        )
+    )
+    return garden
+
+
+def test_matches_validate_garden_and_reuses_unchanged_beds():
+    cache = ValidationCache()
+    garden = make_garden()
+    assert cache.validate(garden) == validate_garden(garden)
+    assert cache.stats().misses == 4
+
+    assert cache.validate(garden) == validate_garden(garden)
+    assert (cache.stats().hits, cache.stats().misses) == (4, 4)
+
+    move_bed(
+        garden,
+        MoveBedParams(bed_id=garden.beds[1].id, new_position=(0, 0)),
+        validate=False,
+    )
+    assert cache.validate(garden) == validate_garden(garden)
+    assert any(issue.type == "bed_overlap" for issue in cache.validate(garden))
+    stats = cache.stats()
+    assert stats.misses == 5
+    assert stats.entries == 5
+
+
+def test_task_entry_follows_planting_dates():
+    cache = ValidationCache()
+    garden = make_garden()
+    assert [i.type for i in cache.validate(garden)].count("task_date") == 1
+    garden.beds[0].plantings[0].planted_on = date(2030, 3, 1)
+    assert cache.validate(garden) == validate_garden(garden)
+    assert [i.type for i in cache.validate(garden)].count("task_date") == 0
+
+
+def test_shared_across_gardens_with_identical_beds():
+    cache = ValidationCache()
+    garden = make_garden()
+    cache.validate(garden)
+    copy = garden.model_copy(deep=True)
+    copy.name = "Copy"
+    copy.beds.pop()
+    cache.validate(copy)
+    assert (cache.stats().hits, cache.stats().misses) == (3, 4)
+
+
+def test_bounded_by_entries_and_issues():
+    garden = make_garden()
+    cache = ValidationCache(max_entries=2)
+    cache.validate(garden)
+    stats = cache.stats()
+    assert stats.entries == 2 and stats.evictions == 2
+
+    cache = ValidationCache(max_issues=4)
+    cache.validate(garden)
+    stats = cache.stats()
+    assert stats.issues <= 4
+    assert cache.validate(garden) == validate_garden(garden)
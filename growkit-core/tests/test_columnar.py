@@ -0,0 +1,140 @@
+import random
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from growkit_core.columnar import ColumnarBed, boundary_violations  # noqa: E402
+from growkit_core.models import Bed, Dimensions, Planting, UnitLength  # noqa: E402
+from growkit_core.spatial import spacing_conflict_pairs  # noqa: E402
+from growkit_core.validators import (  # noqa: E402
+    bed_boundary_issues,
+    bed_spacing_issues,
+    validate_bed_boundaries,
+    validate_spacing_conflicts,
+)
+
+
+def make_bed(n, seed=0):
+    rng = random.Random(seed)
+    return Bed(
+        name="Dense Bed",
+        position=(1, 2),
+        dimensions=Dimensions(width=3.0, length=3.0),
+        metadata={"irrigation": "drip"},
+        plantings=[
+            Planting(
+                species=rng.choice(["Lettuce", "Carrot", "Kale"]),
+                variety=rng.choice([None, "Red", "Nantes"]),
+                position=(rng.uniform(-0.2, 3.2), rng.uniform(-0.2, 3.2)),
+                spacing=rng.choice([None, 0.05, 0.1, 0.15, 1.0]),
+                planted_on=rng.choice([None, date(2025, 4, rng.randint(1, 30))]),
+                expected_harvest=rng.choice([None, date(2025, 7, 1)]),
+                notes=rng.choice([None, "thin later"]),
+                metadata=rng.choice([{}, None, {"tray": rng.randint(1, 9)}]),
+            )
+            for _ in range(n)
+        ],
+    )
+
+
+def test_roundtrip_is_lossless():
+    bed = make_bed(500)
+    bed.plantings.append(Planting(id="custom-id", species="Bean", position=(1, 1)))
+    columnar = ColumnarBed.from_bed(bed)
+
+    assert len(columnar) == 501
+    assert sorted(columnar.species_table) == ["Bean", "Carrot", "Kale", "Lettuce"]
+    assert columnar.ids.dtype == object
+    assert columnar.to_bed() == bed
+
+
+def test_uuid_ids_are_packed():
+    columnar = ColumnarBed.from_bed(make_bed(10))
+    assert columnar.ids.dtype.itemsize == 16
+    assert columnar.nbytes < 10 * 100
+
+
+def test_empty_bed():
+    bed = Bed(name="Empty", dimensions=Dimensions(width=1, length=1))
+    columnar = ColumnarBed.from_bed(bed)
+    assert columnar.to_bed() == bed
+    assert validate_spacing_conflicts(columnar) == []
+    assert validate_bed_boundaries(columnar) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_validators_match(seed):
+    bed = make_bed(800, seed=seed)
+    columnar = ColumnarBed.from_bed(bed)
+
+    assert validate_bed_boundaries(columnar) == validate_bed_boundaries(bed)
+    assert validate_spacing_conflicts(columnar) == validate_spacing_conflicts(bed)
+    assert bed_spacing_issues(columnar) == bed_spacing_issues(bed)
+    assert bed_boundary_issues(columnar) == bed_boundary_issues(bed)
+
+
+def test_spacing_conflicts_on_boundary_distance():
+    # 3-4-5 triangle: distance exactly 0.5 is not a conflict at spacing 0.5.
+    bed = Bed(
+        name="Edge",
+        dimensions=Dimensions(width=1, length=1),
+        plantings=[
+            Planting(species="A", position=(0, 0), spacing=0.5),
+            Planting(species="B", position=(0.3, 0.4), spacing=0.5),
+            Planting(species="C", position=(0.3, 0.4000001), spacing=0.1),
+        ],
+    )
+    columnar = ColumnarBed.from_bed(bed)
+    expected = spacing_conflict_pairs(
+        [p.position for p in bed.plantings], [p.spacing for p in bed.plantings]
+    )
+    assert columnar.spacing_conflicts() == expected == [(1, 2)]
+
+
+def test_boundary_violations_across_beds():
+    beds = [make_bed(200, seed=seed) for seed in range(4)]
+    beds[1].dimensions = Dimensions(width=9.0, length=9.0, unit=UnitLength.feet)
+    beds[2].dimensions = Dimensions(width=100, length=120, unit=UnitLength.inches)
+    beds.append(Bed(name="Empty", dimensions=Dimensions(width=1, length=1)))
+    columnar = [ColumnarBed.from_bed(bed) for bed in beds]
+
+    results = boundary_violations(columnar)
+    assert [bed.plantings(r) for bed, r in zip(columnar, results)] == [
+        validate_bed_boundaries(bed) for bed in beds
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_negative_spacings_match_scalar_check(seed):
+    rng = random.Random(seed)
+    bed = Bed(
+        name="Negative",
+        dimensions=Dimensions(width=2, length=2),
+        plantings=[
+            Planting(
+                species="A",
+                position=(rng.uniform(0, 2), rng.uniform(0, 2)),
+                spacing=rng.choice([None, -1.0, -0.2, 0.0, 0.1, 0.3]),
+            )
+            for _ in range(300)
+        ],
+    )
+    columnar = ColumnarBed.from_bed(bed)
+    expected = spacing_conflict_pairs(
+        [p.position for p in bed.plantings], [p.spacing or 0 for p in bed.plantings]
+    )
+    assert columnar.spacing_conflicts() == expected
+    assert validate_spacing_conflicts(columnar) == validate_spacing_conflicts(bed)
+
+    both_negative = Bed(
+        name="Negative",
+        dimensions=Dimensions(width=2, length=2),
+        plantings=[
+            Planting(species="A", position=(1, 1), spacing=-1.0),
+            Planting(species="B", position=(1, 1.5), spacing=-1.0),
+            Planting(species="C", position=(0, 0), spacing=0.1),
+        ],
+    )
+    assert ColumnarBed.from_bed(both_negative).spacing_conflicts() == []
@@ -0,0 +1,202 @@
+from datetime import date
+
+import pytest
+
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    CreateGardenParams,
+    MoveBedParams,
+    RemoveBedParams,
+    RemovePlantingParams,
+    UpdateGardenMetadataParams,
+    add_bed,
+    add_planting,
+    add_task,
+    apply_batch,
+    create_garden,
+    move_bed,
+    remove_planting,
+)
+from growkit_core.history import garden_history, restore, snapshot
+from growkit_core.index import GardenIndex, garden_index
+from growkit_core.models import Garden
+from growkit_core.patch import apply_patch
+from growkit_core.validators import GardenValidationException
+
+
+def make_garden(beds: int = 3, plantings: int = 4) -> Garden:
+    garden = create_garden(CreateGardenParams(name="History"))
+    for i in range(beds):
+        add_bed(garden, AddBedParams(name=f"Bed {i}", width=10.0, length=10.0))
+        for j in range(plantings):
+            add_planting(
+                garden,
+                AddPlantingParams(
+                    bed_id=garden.beds[i].id, species="Kale", position=(j, 0.5)
+                ),
+                validate=False,
+            )
+    return garden
+
+
+def test_snapshot_shares_everything():
+    garden = make_garden()
+    snap = snapshot(garden)
+    assert snap == garden
+    assert snap.beds is garden.beds
+    assert snap.tasks is garden.tasks
+
+
+def test_edit_copies_only_the_changed_bed():
+    garden = make_garden()
+    dump = garden.model_dump()
+    snap = snapshot(garden)
+
+    bed = garden.beds[1]
+    add_planting(
+        garden, AddPlantingParams(bed_id=bed.id, species="Bean", position=(5, 5))
+    )
+    move_bed(garden, MoveBedParams(bed_id=bed.id, new_position=(50, 50)))
+
+    assert snap.model_dump() == dump
+    assert garden.beds is not snap.beds
+    assert garden.beds[1] is not snap.beds[1]
+    assert garden.beds[0] is snap.beds[0]
+    assert garden.beds[2] is snap.beds[2]
+    assert garden.beds[1].plantings[:4] == snap.beds[1].plantings
+    assert garden.beds[1].plantings[0] is snap.beds[1].plantings[0]
+    assert len(garden.beds[1].plantings) == 5
+
+
+def test_snapshot_can_be_edited_independently():
+    garden = make_garden()
+    dump = garden.model_dump()
+    branch = snapshot(garden)
+    remove_planting(
+        branch, RemovePlantingParams(bed_id=branch.beds[0].id, planting_index=0)
+    )
+    add_task(branch, AddTaskParams(title="Weed", target_date=date(2030, 1, 1)))
+    assert garden.model_dump() == dump
+    assert len(branch.beds[0].plantings) == 3
+    assert len(branch.tasks) == 1
+
+
+def test_patches_do_not_leak_into_snapshots():
+    garden = make_garden()
+    position = garden.beds[1].position
+    snap = snapshot(garden)
+    apply_patch(
+        garden,
+        [
+            {"op": "replace", "path": "/beds/0/plantings/1/species", "value": "Leek"},
+            {"op": "add", "path": "/beds/2/metadata/irrigation", "value": "drip"},
+            {"op": "replace", "path": "/beds/1/position/0", "value": 7.0},
+        ],
+    )
+    assert snap.beds[0].plantings[1].species == "Kale"
+    assert snap.beds[2].metadata == {}
+    assert snap.beds[1].position == position
+    assert garden.beds[0].plantings[1].species == "Leek"
+    assert garden.beds[0].plantings[0] is snap.beds[0].plantings[0]
+
+
+def test_undo_redo():
+    garden = make_garden()
+    history = garden_history(garden)
+    states = [garden.model_dump()]
+
+    history.checkpoint(garden, "add bed")
+    add_bed(garden, AddBedParams(name="New", width=1, length=1))
+    states.append(garden.model_dump())
+    history.checkpoint(garden, "batch")
+    apply_batch(
+        garden,
+        [
+            RemoveBedParams(bed_id=garden.beds[0].id),
+            UpdateGardenMetadataParams(name="Renamed"),
+            AddPlantingParams(
+                bed_id=garden.beds[1].id, species="Bean", position=(1, 1)
+            ),
+        ],
+    )
+    states.append(garden.model_dump())
+
+    assert history.undo_labels == ["add bed", "batch"]
+    assert history.undo(garden) == "batch"
+    assert garden.model_dump() == states[1]
+    assert history.undo(garden) == "add bed"
+    assert garden.model_dump() == states[0]
+    with pytest.raises(ValueError):
+        history.undo(garden)
+
+    assert history.redo(garden) == "add bed"
+    assert history.redo(garden) == "batch"
+    assert garden.model_dump() == states[2]
+    with pytest.raises(ValueError):
+        history.redo(garden)
+
+    history.undo(garden)
+    history.checkpoint(garden, "diverge")
+    assert history.redo_labels == []
+    assert history.undo_labels == ["add bed", "diverge"]
+
+
+def test_failed_batch_leaves_snapshot_intact():
+    garden = make_garden()
+    snap = snapshot(garden)
+    dump = garden.model_dump()
+    with pytest.raises(GardenValidationException):
+        apply_batch(
+            garden,
+            [
+                AddPlantingParams(
+                    bed_id=garden.beds[0].id, species="Bean", position=(50, 50)
+                ),
+                RemoveBedParams(bed_id=garden.beds[2].id),
+            ],
+        )
+    assert garden.model_dump() == dump
+    assert snap.model_dump() == dump
+
+
+def test_index_follows_copies_without_rebuilding(monkeypatch):
+    garden = make_garden()
+    index = garden_index(garden)
+    index.bed_position(garden, garden.beds[0].id)
+    rebuilds = []
+    original = GardenIndex._index_beds
+    monkeypatch.setattr(
+        GardenIndex,
+        "_index_beds",
+        lambda self, g: rebuilds.append(g) or original(self, g),
+    )
+    for i in range(3):
+        snapshot(garden)
+        add_planting(
+            garden,
+            AddPlantingParams(
+                bed_id=garden.beds[i].id, species="Bean", position=(1, 1)
+            ),
+        )
+        add_bed(garden, AddBedParams(name=f"Extra {i}", width=1, length=1))
+    assert rebuilds == []
+    for i, bed in enumerate(garden.beds):
+        assert index.bed_position(garden, bed.id) == i
+        for j, planting in enumerate(bed.plantings):
+            assert index.planting_position(garden, planting.id) == (i, j)
+
+
+def test_restore_revalidates_changed_beds():
+    garden = make_garden()
+    snap = snapshot(garden)
+    add_planting(
+        garden,
+        AddPlantingParams(bed_id=garden.beds[0].id, species="Bean", position=(50, 50)),
+        validate=False,
+    )
+    with pytest.raises(GardenValidationException):
+        apply_batch(garden, [])
+    restore(garden, snap)
+    apply_batch(garden, [])
@@ -0,0 +1,250 @@
+import random
+from datetime import date, datetime, timezone
+
+import growkit_core.incremental as incremental
+import growkit_core.spatial as spatial
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    CreateGardenParams,
+    MoveBedParams,
+    RemoveBedParams,
+    RemovePlantingParams,
+    UpdateBedDimensionsParams,
+    add_bed,
+    add_planting,
+    add_planting_task,
+    add_task,
+    apply_batch,
+    create_garden,
+    move_bed,
+    remove_bed,
+    remove_planting,
+    update_bed_dimensions,
+)
+from growkit_core.incremental import IncrementalValidator, incremental_validator
+from growkit_core.models import Garden, UnitLength
+from growkit_core.validators import validate_garden
+
+
+def make_garden(beds: int) -> Garden:
+    garden = create_garden(CreateGardenParams(name="Allotment"))
+    garden.created_at = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    for i in range(beds):
+        add_bed(garden, AddBedParams(name=f"Bed {i}", width=1.0, length=1.0))
+    return garden
+
+
+def test_matches_validate_garden_across_mutations():
+    rng = random.Random(3)
+    garden = make_garden(5)
+    validator = incremental_validator(garden)
+    for step in range(200):
+        bed = rng.choice(garden.beds)
+        action = rng.random()
+        if action < 0.5:
+            add_planting(
+                garden,
+                AddPlantingParams(
+                    bed_id=bed.id,
+                    species=rng.choice(["Kale", "Beet"]),
+                    position=(rng.uniform(-0.1, 1.1), rng.uniform(-0.1, 1.1)),
+                    spacing=0.1,
+                    planted_on=date(2025, 4, rng.randint(1, 30)),
+                ),
+                validate=False,
+            )
+        elif action < 0.65 and bed.plantings:
+            planting = rng.choice(bed.plantings)
+            add_planting_task(
+                garden, planting.id, "Thin", date(2025, 4, rng.randint(1, 30))
+            )
+        elif action < 0.75:
+            add_task(
+                garden,
+                AddTaskParams(
+                    title="Mulch", target_date=date(2025, 2, rng.randint(1, 28))
+                ),
+            )
+        elif action < 0.9 and bed.plantings:
+            remove_planting(
+                garden,
+                RemovePlantingParams(
+                    bed_id=bed.id, planting_index=rng.randrange(len(bed.plantings))
+                ),
+                validate=False,
+            )
+        elif action < 0.95:
+            update_bed_dimensions(
+                garden,
+                UpdateBedDimensionsParams(
+                    bed_id=bed.id, width=rng.uniform(0.5, 1.5), length=1.0
+                ),
+                validate=False,
+            )
+        elif len(garden.beds) > 1:
+            remove_bed(garden, RemoveBedParams(bed_id=bed.id), validate=False)
+        assert validator.validate(garden) == validate_garden(garden), step
+
+
+def test_only_touched_bed_is_rechecked(monkeypatch):
+    garden = make_garden(200)
+    incremental_validator(garden).validate(garden)
+
+    checked = []
+    original = incremental.bed_spacing_issues
+
+    def counting(bed):
+        checked.append(bed.id)
+        return original(bed)
+
+    monkeypatch.setattr(incremental, "bed_spacing_issues", counting)
+    bed_id = garden.beds[42].id
+    add_planting(
+        garden,
+        AddPlantingParams(bed_id=bed_id, species="Kale", position=(0.5, 0.5)),
+    )
+    assert checked == [bed_id]
+
+
+def test_task_rechecked_when_planting_removed():
+    garden = make_garden(1)
+    bed_id = garden.beds[0].id
+    add_planting(
+        garden,
+        AddPlantingParams(
+            bed_id=bed_id,
+            species="Kale",
+            position=(0.5, 0.5),
+            planted_on=date(2025, 5, 1),
+        ),
+    )
+    add_planting_task(garden, garden.beds[0].plantings[0].id, "Thin", date(2025, 4, 1))
+    validator = incremental_validator(garden)
+    assert [i.type for i in validator.validate(garden)] == ["task_date"]
+
+    remove_planting(garden, RemovePlantingParams(bed_id=bed_id, planting_index=0))
+    assert validator.validate(garden) == []
+
+
+def test_task_rechecked_when_planted_on_edited_in_place():
+    garden = make_garden(1)
+    bed = garden.beds[0]
+    add_planting(
+        garden,
+        AddPlantingParams(
+            bed_id=bed.id,
+            species="Kale",
+            position=(0.5, 0.5),
+            planted_on=date(2025, 3, 15),
+        ),
+    )
+    add_planting_task(garden, bed.plantings[0].id, "Thin", date(2025, 4, 1))
+    validator = incremental_validator(garden)
+    assert validator.validate(garden) == []
+
+    bed.plantings[0].planted_on = date(2025, 5, 1)
+    validator.invalidate_bed(bed.id)
+    assert [i.type for i in validator.validate(garden)] == ["task_date"]
+    assert [i.type for i in validate_garden(garden)] == ["task_date"]
+
+
+def test_in_place_edits_need_invalidation():
+    garden = make_garden(1)
+    bed = garden.beds[0]
+    validator = IncrementalValidator()
+    assert validator.validate(garden) == []
+
+    bed.dimensions.width = 0.1
+    add_planting(
+        garden,
+        AddPlantingParams(bed_id=bed.id, species="Kale", position=(0.5, 0.5)),
+        validate=False,
+    )
+    assert validator.validate(garden) == []
+    validator.invalidate_bed(bed.id)
+    assert [i.type for i in validator.validate(garden)] == ["bed_boundary"]
+
+
+def test_overlaps_match_validate_garden_across_moves():
+    rng = random.Random(4)
+    garden = make_garden(40)
+    validator = incremental_validator(garden)
+    for step in range(150):
+        bed = rng.choice(garden.beds)
+        action = rng.random()
+        if action < 0.6:
+            move_bed(
+                garden,
+                MoveBedParams(
+                    bed_id=bed.id,
+                    new_position=(rng.uniform(0, 30), rng.uniform(0, 10)),
+                ),
+                validate=False,
+            )
+        elif action < 0.8:
+            update_bed_dimensions(
+                garden,
+                UpdateBedDimensionsParams(
+                    bed_id=bed.id,
+                    width=rng.uniform(1, 10),
+                    length=rng.uniform(1, 10),
+                    unit=rng.choice(list(UnitLength)),
+                ),
+                validate=False,
+            )
+        elif action < 0.9:
+            add_bed(
+                garden,
+                AddBedParams(
+                    name=f"New {step}",
+                    position=(rng.uniform(0, 30), rng.uniform(0, 10)),
+                    width=2,
+                    length=2,
+                ),
+                validate=False,
+            )
+        elif len(garden.beds) > 1:
+            remove_bed(garden, RemoveBedParams(bed_id=bed.id), validate=False)
+        assert validator.validate(garden) == validate_garden(garden), step
+
+
+def test_move_only_checks_neighbouring_beds(monkeypatch):
+    garden = create_garden(CreateGardenParams(name="Allotment site"))
+    apply_batch(
+        garden,
+        [
+            AddBedParams(
+                name=f"Bed {i}",
+                position=(i % 50 * 2.0, i // 50 * 2.0),
+                width=1,
+                length=1,
+            )
+            for i in range(2000)
+        ],
+    )
+    validator = incremental_validator(garden)
+    validator.validate(garden)
+
+    compared = []
+    original = spatial.rectangles_overlap
+
+    def counting(a, b):
+        compared.append(b)
+        return original(a, b)
+
+    monkeypatch.setattr(spatial, "rectangles_overlap", counting)
+    bed = garden.beds[1000]
+    neighbour = garden.beds[1500]
+    issues = validator.validate(
+        move_bed(
+            garden,
+            MoveBedParams(bed_id=bed.id, new_position=neighbour.position),
+            validate=False,
+        )
+    )
+    assert [(i.bed_name, i.other_bed_name) for i in issues] == [
+        ("Bed 1000", "Bed 1500")
+    ]
+    assert 0 < len(compared) < 10
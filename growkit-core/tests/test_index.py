@@ -0,0 +1,173 @@
+import random
+from datetime import date
+
+import pytest
+
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    CreateGardenParams,
+    RemoveBedParams,
+    RemovePlantingParams,
+    add_bed,
+    add_planting,
+    add_planting_task,
+    add_task,
+    create_garden,
+    remove_bed,
+    remove_planting,
+)
+from growkit_core.index import GardenIndex, garden_index
+from growkit_core.models import Bed, Dimensions, Garden, GardenTask, Planting
+from growkit_core.patch import apply_patch
+
+
+def make_garden(beds: int, plantings: int) -> Garden:
+    garden = create_garden(CreateGardenParams(name="Indexed"))
+    for i in range(beds):
+        add_bed(garden, AddBedParams(name=f"Bed {i}", width=10.0, length=10.0))
+        for j in range(plantings):
+            add_planting(
+                garden,
+                AddPlantingParams(
+                    bed_id=garden.beds[i].id, species="Kale", position=(j, 0.5)
+                ),
+                validate=False,
+            )
+    return garden
+
+
+def assert_consistent(garden: Garden):
+    index = garden_index(garden)
+    for i, bed in enumerate(garden.beds):
+        assert index.bed_position(garden, bed.id) == i
+        for j, planting in enumerate(bed.plantings):
+            assert index.planting_position(garden, planting.id) == (i, j)
+    for i, task in enumerate(garden.tasks):
+        assert index.task_position(garden, task.id) == i
+    assert index.bed(garden, "missing") is None
+    assert index.planting(garden, "missing") is None
+    assert index.task(garden, "missing") is None
+
+
+def count_rebuilds(monkeypatch):
+    calls = []
+    original = GardenIndex._index_beds
+
+    def spy(self, garden):
+        calls.append(garden)
+        original(self, garden)
+
+    monkeypatch.setattr(GardenIndex, "_index_beds", spy)
+    return calls
+
+
+def test_api_keeps_index_current_without_rebuilding(monkeypatch):
+    garden = make_garden(beds=4, plantings=5)
+    rebuilds = count_rebuilds(monkeypatch)
+    rng = random.Random(1)
+    for step in range(200):
+        bed = rng.choice(garden.beds)
+        action = rng.random()
+        if action < 0.5 or not bed.plantings:
+            add_planting(
+                garden,
+                AddPlantingParams(bed_id=bed.id, species="Bean", position=(1, 1)),
+                validate=False,
+            )
+        elif action < 0.8:
+            planting = rng.choice(bed.plantings)
+            remove_planting(
+                garden,
+                RemovePlantingParams(bed_id=bed.id, planting_id=planting.id),
+                validate=False,
+            )
+        elif action < 0.9:
+            add_planting_task(
+                garden, bed.plantings[0].id, f"Task {step}", date(2025, 5, 1)
+            )
+        else:
+            remove_bed(garden, RemoveBedParams(bed_id=bed.id), validate=False)
+            add_bed(garden, AddBedParams(name="New", width=1, length=1))
+    assert rebuilds == []
+    assert_consistent(garden)
+
+
+def test_add_planting_task_finds_bed():
+    garden = make_garden(beds=3, plantings=2)
+    planting = garden.beds[2].plantings[1]
+    add_planting_task(garden, planting.id, "Harvest", date(2025, 8, 1))
+    add_planting_task(garden, "missing", "Orphan", date(2025, 8, 1))
+    assert garden.tasks[0].related_bed_id == garden.beds[2].id
+    assert garden.tasks[1].related_bed_id is None
+
+
+def test_remove_planting_by_id():
+    garden = make_garden(beds=2, plantings=3)
+    bed, other = garden.beds
+    target = bed.plantings[1]
+
+    with pytest.raises(ValueError):
+        remove_planting(
+            garden, RemovePlantingParams(bed_id=other.id, planting_id=target.id)
+        )
+    with pytest.raises(ValueError):
+        remove_planting(garden, RemovePlantingParams(bed_id=bed.id))
+
+    remove_planting(garden, RemovePlantingParams(bed_id=bed.id, planting_id=target.id))
+    assert target not in bed.plantings
+    assert len(bed.plantings) == 2
+    assert_consistent(garden)
+
+
+def test_detects_changes_made_outside_the_api():
+    garden = make_garden(beds=3, plantings=3)
+    assert_consistent(garden)
+
+    garden.beds[1].plantings.append(Planting(species="Leek", position=(0, 0)))
+    del garden.beds[0].plantings[0]
+    garden.beds.insert(0, Bed(name="Front", dimensions=Dimensions(width=1, length=1)))
+    garden.tasks = [GardenTask(title="Water", target_date=date(2025, 6, 1))]
+    assert_consistent(garden)
+
+    garden.beds = list(reversed(garden.beds))
+    assert_consistent(garden)
+
+
+def test_detects_replaced_list_of_same_length():
+    garden = make_garden(beds=1, plantings=1)
+    garden.tasks = [GardenTask(title="Weed", target_date=date(2025, 6, 1))]
+    index = garden_index(garden)
+    assert index.task_position(garden, garden.tasks[0].id) == 0
+    # The old list may be freed and its address reused for the new one.
+    garden.tasks = [GardenTask(title="Water", target_date=date(2025, 6, 1))]
+    assert index.task_position(garden, garden.tasks[0].id) == 0
+
+    garden.beds[0].plantings = [Planting(species="Leek", position=(0, 0))]
+    assert index.planting_position(garden, garden.beds[0].plantings[0].id) == (0, 0)
+
+
+def test_patches_invalidate_index():
+    garden = make_garden(beds=2, plantings=2)
+    assert_consistent(garden)
+    apply_patch(
+        garden,
+        [
+            {"op": "replace", "path": "/beds/0/plantings/1/id", "value": "renamed"},
+            {"op": "remove", "path": "/beds/1"},
+        ],
+    )
+    assert garden_index(garden).planting_position(garden, "renamed") == (0, 1)
+    assert_consistent(garden)
+
+
+def test_copies_get_their_own_index():
+    garden = make_garden(beds=1, plantings=1)
+    add_task(garden, AddTaskParams(title="Sow", target_date=date(2025, 4, 1)))
+    copy = garden.model_copy(deep=True)
+    remove_bed(copy, RemoveBedParams(bed_id=copy.beds[0].id), validate=False)
+    assert garden_index(garden).bed(garden, garden.beds[0].id) is garden.beds[0]
+    assert garden_index(copy).bed(copy, garden.beds[0].id) is None
+    assert_consistent(garden)
+    assert_consistent(copy)
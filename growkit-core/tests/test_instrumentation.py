@@ -0,0 +1,154 @@
+import io
+import json
+import logging
+import time
+
+import pytest
+
+from growkit_core import instrumentation
+from growkit_core.api import (
+    AddBedParams,
+    CreateGardenParams,
+    UpdateTaskStatusParams,
+    add_bed,
+    create_garden,
+    update_task_status,
+)
+from growkit_core.instrumentation import (
+    JsonLinesSink,
+    LogSink,
+    PrometheusTextSink,
+    configure_from_env,
+    instrumented,
+    metrics,
+    sinks_from_spec,
+    span,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.clear()
+    yield
+    instrumentation.disable()
+    metrics.clear()
+
+
+def test_disabled_records_nothing():
+    garden = create_garden(CreateGardenParams(name="Quiet"))
+    add_bed(garden, AddBedParams(name="Bed", width=1, length=1))
+    with span("block"):
+        pass
+    assert not instrumentation.is_enabled()
+    assert metrics.names() == []
+
+
+def test_api_and_validator_spans_reach_sinks():
+    out = io.StringIO()
+    instrumentation.enable(JsonLinesSink(out))
+    garden = create_garden(CreateGardenParams(name="Timed"))
+    add_bed(garden, AddBedParams(name="Bed", width=1, length=1))
+
+    spans = [json.loads(line)["span"] for line in out.getvalue().splitlines()]
+    assert "api.create_garden" in spans
+    assert "api.add_bed" in spans
+    assert "api.validate" in spans
+    assert "validators.validate_bed_boundaries" in spans
+    # Nested spans finish before the call that made them.
+    assert spans.index("api.validate") < spans.index("api.add_bed")
+    assert metrics.get("api.add_bed").count == 1
+
+
+def test_errors_are_counted():
+    instrumentation.enable()
+    garden = create_garden(CreateGardenParams(name="Broken"))
+    with pytest.raises(ValueError):
+        update_task_status(
+            garden, UpdateTaskStatusParams(task_id="missing", status="completed")
+        )
+    stats = metrics.get("api.update_task_status")
+    assert (stats.count, stats.errors) == (1, 1)
+
+
+def test_decorator_and_span_time_calls():
+    @instrumented("custom.double")
+    def double(x):
+        return 2 * x
+
+    instrumentation.enable()
+    assert double(21) == 42
+    with span("custom.block"):
+        pass
+    assert metrics.get("custom.double").count == 1
+    assert metrics.get("custom.block").count == 1
+    assert double.__name__ == "double"
+
+
+def test_log_sink(caplog):
+    instrumentation.enable(LogSink())
+    with caplog.at_level(logging.INFO, logger="growkit.instrumentation"):
+        with span("custom.logged"):
+            pass
+    assert "custom.logged took" in caplog.text
+
+
+def test_prometheus_text_file(tmp_path):
+    path = tmp_path / "growkit.prom"
+    instrumentation.enable(PrometheusTextSink(path, interval=3600))
+    for _ in range(3):
+        with span("custom.prom"):
+            pass
+    instrumentation.flush()
+
+    text = path.read_text()
+    assert "# TYPE growkit_span_seconds histogram" in text
+    assert 'growkit_span_seconds_bucket{span="custom.prom",le="+Inf"} 3' in text
+    assert 'growkit_span_seconds_count{span="custom.prom"} 3' in text
+    assert 'growkit_span_errors_total{span="custom.prom"} 0' in text
+
+
+def test_prometheus_writes_in_the_background(tmp_path):
+    path = tmp_path / "growkit.prom"
+    sink = PrometheusTextSink(path, interval=0.05)
+    instrumentation.enable(sink)
+    with span("custom.prom"):
+        pass
+    # Recording a span never touches the file itself.
+    assert not path.exists()
+
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert 'growkit_span_seconds_count{span="custom.prom"} 1' in path.read_text()
+
+    with span("custom.prom"):
+        pass
+    instrumentation.disable()
+    assert not sink._thread.is_alive()
+    assert 'growkit_span_seconds_count{span="custom.prom"} 2' in path.read_text()
+
+
+def test_sinks_from_spec(tmp_path):
+    sinks = sinks_from_spec(
+        f"log, jsonl:{tmp_path / 'spans.jsonl'},prometheus:{tmp_path / 'g.prom'}"
+    )
+    assert [type(s) for s in sinks] == [LogSink, JsonLinesSink, PrometheusTextSink]
+    for sink in sinks:
+        sink.close()
+    assert sinks_from_spec("") == []
+    with pytest.raises(ValueError):
+        sinks_from_spec("statsd:localhost")
+
+
+def test_configure_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv(instrumentation.ENV_VAR, raising=False)
+    assert not configure_from_env()
+    assert not instrumentation.is_enabled()
+
+    path = tmp_path / "spans.jsonl"
+    monkeypatch.setenv(instrumentation.ENV_VAR, f"jsonl:{path}")
+    assert configure_from_env()
+    with span("custom.env"):
+        pass
+    instrumentation.disable()
+    assert json.loads(path.read_text())["span"] == "custom.env"
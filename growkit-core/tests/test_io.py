@@ -3,8 +3,25 @@ import tempfile
 from datetime import date
 from pathlib import Path
 
-from growkit_core.io import load_garden, save_garden
-from growkit_core.models import Bed, Dimensions, Garden, Planting
+import pytest
+
+from growkit_core.io import (
+    GardenFormat,
+    LazyGarden,
+    decode_compressed,
+    encode_compressed,
+    iter_garden_section,
+    load_garden,
+    save_garden,
+)
+from growkit_core.models import (
+    AgentCommentary,
+    Bed,
+    Dimensions,
+    Garden,
+    GardenTask,
+    Planting,
+)
 
 
 def make_sample_garden() -> Garden:
@@ -50,3 +67,103 @@ def test_json_is_valid_json():
 
         assert isinstance(data, dict)
         assert data["name"] == "My Garden"
+
+
+def make_archive_garden() -> Garden:
+    garden = make_sample_garden()
+    garden.metadata = {"notes": 'quotes " and \\ backslashes ] } in strings'}
+    garden.tasks = [
+        GardenTask(title=f"Task {i}", target_date=date(2025, 5, 1 + i % 28))
+        for i in range(500)
+    ]
+    garden.agent_comments = [
+        AgentCommentary(comment=f"Comment {i} {{[]}}") for i in range(200)
+    ]
+    return garden
+
+
+def test_streaming_load_matches_full_load():
+    garden = make_archive_garden()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.json"
+        save_garden(garden, path)
+
+        assert load_garden(path, stream=True) == load_garden(path)
+
+
+def test_lazy_load_defers_tasks_and_comments():
+    garden = make_archive_garden()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.json"
+        save_garden(garden, path)
+
+        lazy = load_garden(path, lazy=True)
+        assert isinstance(lazy, LazyGarden)
+        assert lazy.pending_sections == ("tasks", "agent_comments")
+        assert lazy.beds[0].plantings[0].species == "Carrot"
+
+        assert lazy.tasks[499].title == "Task 499"
+        assert lazy.pending_sections == ("agent_comments",)
+        assert lazy.model_dump() == garden.model_dump()
+        assert lazy.pending_sections == ()
+
+
+def test_iter_garden_section():
+    garden = make_archive_garden()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.json"
+        save_garden(garden, path)
+
+        comments = list(iter_garden_section(path, "agent_comments"))
+        assert [c.comment for c in comments] == [
+            c.comment for c in garden.agent_comments
+        ]
+
+
+def test_streaming_load_rejects_truncated_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.json"
+        path.write_text('{"name": "Broken", "beds": [{"name": "A"', encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_garden(path, stream=True)
+
+
+def test_compressed_roundtrip_by_extension():
+    garden = make_archive_garden()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.gkz"
+        save_garden(garden, path)
+
+        assert path.read_bytes()[:3] == b"GKZ"
+        assert load_garden(path) == garden
+
+
+def test_compressed_format_argument_and_uncompressed():
+    garden = make_sample_garden()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.dat"
+        save_garden(garden, path, format=GardenFormat.compressed, compression_level=0)
+
+        assert decode_compressed(path.read_bytes()) == garden
+        with pytest.raises(ValueError):
+            load_garden(path, lazy=True)
+
+
+def test_compressed_is_smaller_than_json():
+    garden = make_archive_garden()
+    assert len(encode_compressed(garden)) < len(garden.model_dump_json(indent=2)) / 5
+
+
+def test_compressed_rejects_newer_schema_version():
+    garden = make_sample_garden()
+    garden.schema_version = "99.0.0"
+    with pytest.raises(ValueError, match="newer than the supported"):
+        decode_compressed(encode_compressed(garden))
+    garden.schema_version = "0.0.1"
+    assert decode_compressed(encode_compressed(garden)) == garden
@@ -0,0 +1,100 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    CreateGardenParams,
+    add_bed,
+    add_planting,
+    create_garden,
+)
+from growkit_core.io import load_garden, save_garden
+from growkit_core.journal import GardenJournal
+
+
+def make_garden():
+    garden = create_garden(CreateGardenParams(name="Journal Garden"))
+    return add_bed(garden, AddBedParams(name="Bed", width=2.0, length=2.0))
+
+
+def plant(journal, garden, x):
+    before = garden.model_dump(mode="json")
+    add_planting(
+        garden,
+        AddPlantingParams(bed_id=garden.beds[0].id, species="Kale", position=(x, 1)),
+    )
+    return journal.record(before, garden)
+
+
+def test_save_garden_is_atomic(monkeypatch):
+    garden = make_garden()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.json"
+        save_garden(garden, path)
+
+        def crash(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("growkit_core.io.os.replace", crash)
+        garden.name = "Changed"
+        with pytest.raises(OSError):
+            save_garden(garden, path)
+
+        assert load_garden(path).name == "Journal Garden"
+        assert [p.name for p in Path(tmpdir).iterdir()] == ["garden.json"]
+
+
+def test_journal_replays_onto_snapshot():
+    garden = make_garden()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.json"
+        journal = GardenJournal(path)
+        journal.snapshot(garden)
+        size = path.stat().st_size
+
+        for i in range(3):
+            assert len(plant(journal, garden, 0.5 * i)) == 1
+
+        assert path.stat().st_size == size
+        assert load_garden(path).beds[0].plantings == []
+        reopened = GardenJournal(path)
+        assert reopened.load() == garden
+        assert reopened.entries == 3
+
+
+def test_journal_snapshots_periodically():
+    garden = make_garden()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.json"
+        journal = GardenJournal(path, snapshot_every=2)
+        journal.snapshot(garden)
+
+        plant(journal, garden, 0.2)
+        plant(journal, garden, 0.8)
+        assert journal.entries == 0
+        assert len(load_garden(path).beds[0].plantings) == 2
+        assert GardenJournal(path).load() == garden
+
+
+def test_journal_ignores_torn_tail_and_stale_journal():
+    garden = make_garden()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "garden.json"
+        journal = GardenJournal(path)
+        journal.snapshot(garden)
+        plant(journal, garden, 0.2)
+        with open(journal.journal_path, "ab") as f:
+            f.write(b'[{"op": "add", "pa')
+
+        reopened = GardenJournal(path)
+        assert reopened.load() == garden
+        plant(reopened, garden, 0.8)
+        assert GardenJournal(path).load() == garden
+
+        # A snapshot written without resetting the journal (crash in
+        # between) must not have the old journal replayed on top of it.
+        save_garden(garden, path)
+        assert GardenJournal(path).load() == garden
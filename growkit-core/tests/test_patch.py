@@ -0,0 +1,179 @@
+from datetime import date
+
+import pytest
+
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    CreateGardenParams,
+    MoveBedParams,
+    RemoveBedParams,
+    RemovePlantingParams,
+    add_bed,
+    add_planting,
+    add_task,
+    create_garden,
+    move_bed,
+    remove_bed,
+    remove_planting,
+)
+from growkit_core.incremental import incremental_validator
+from growkit_core.index import garden_index
+from growkit_core.models import Garden, Planting
+from growkit_core.patch import (
+    PatchConflict,
+    PatchOperation,
+    apply_patch,
+    diff_gardens,
+)
+from growkit_core.validators import validate_garden
+
+
+def make_garden() -> Garden:
+    garden = create_garden(CreateGardenParams(name="Patch Garden"))
+    for name in ("North", "South"):
+        add_bed(garden, AddBedParams(name=name, width=2.0, length=2.0))
+    for i in range(5):
+        add_planting(
+            garden,
+            AddPlantingParams(
+                bed_id=garden.beds[0].id,
+                species="Kale",
+                position=(0.3 * i, 0.5),
+                planted_on=date(2025, 4, 1),
+            ),
+        )
+    return garden
+
+
+def roundtrip(garden: Garden, mutate) -> list:
+    before = garden.model_dump(mode="json")
+    mutate(garden)
+    patch = diff_gardens(before, garden)
+    restored = apply_patch(Garden.model_validate(before), patch)
+    assert restored == garden
+    return patch
+
+
+def test_add_planting_is_a_single_add():
+    garden = make_garden()
+    patch = roundtrip(
+        garden,
+        lambda g: add_planting(
+            g,
+            AddPlantingParams(bed_id=g.beds[1].id, species="Beet", position=(1.0, 1.0)),
+        ),
+    )
+    assert [(op.op, op.path) for op in patch] == [("add", "/beds/1/plantings/0")]
+
+
+def test_remove_planting_from_middle_is_a_single_remove():
+    garden = make_garden()
+    patch = roundtrip(
+        garden,
+        lambda g: remove_planting(
+            g, RemovePlantingParams(bed_id=g.beds[0].id, planting_index=2)
+        ),
+    )
+    assert [(op.op, op.path) for op in patch] == [("remove", "/beds/0/plantings/2")]
+
+
+def test_move_bed_replaces_tuple_items():
+    garden = make_garden()
+    patch = roundtrip(
+        garden,
+        lambda g: move_bed(g, MoveBedParams(bed_id=g.beds[1].id, new_position=(4, 0))),
+    )
+    assert all(op.op == "replace" for op in patch)
+    assert isinstance(garden.beds[1].position, tuple)
+
+
+def test_mixed_changes_roundtrip():
+    def mutate(g):
+        remove_bed(g, RemoveBedParams(bed_id=g.beds[1].id))
+        add_task(g, AddTaskParams(title="Water", target_date=date(2030, 1, 1)))
+        g.beds[0].metadata = {"irrigation": "drip"}
+        g.name = "Renamed"
+
+    roundtrip(make_garden(), mutate)
+
+
+def test_apply_patch_validates_written_values():
+    garden = make_garden()
+    apply_patch(
+        garden,
+        [
+            {
+                "op": "add",
+                "path": "/beds/1/plantings/-",
+                "value": {"species": "Beet", "position": [0.5, 0.5]},
+            },
+            {"op": "replace", "path": "/tasks", "value": []},
+        ],
+    )
+    assert isinstance(garden.beds[1].plantings[0], Planting)
+    assert garden.beds[1].plantings[0].position == (0.5, 0.5)
+
+    with pytest.raises(PatchConflict, match="planted_on"):
+        apply_patch(
+            garden,
+            [{"op": "replace", "path": "/beds/0/plantings/0/planted_on", "value": "x"}],
+        )
+
+
+def test_apply_patch_conflicts():
+    garden = make_garden()
+    with pytest.raises(PatchConflict):
+        apply_patch(garden, [PatchOperation(op="remove", path="/beds/9")])
+    with pytest.raises(PatchConflict):
+        apply_patch(
+            garden, [PatchOperation(op="replace", path="/beds/0/nope", value=1)]
+        )
+    with pytest.raises(PatchConflict):
+        apply_patch(garden, [PatchOperation(op="test", path="/name", value="Other")])
+    with pytest.raises(PatchConflict):
+        apply_patch(garden, [{"op": "move", "path": "/name"}])
+    with pytest.raises(PatchConflict):
+        apply_patch(garden, [{"op": "replace", "path": "/beds/0/position/2"}])
+    apply_patch(garden, [PatchOperation(op="test", path="/name", value="Patch Garden")])
+
+
+def test_failed_patch_leaves_garden_unchanged():
+    garden = make_garden()
+    before = garden.model_dump()
+    first = garden.beds[0].plantings[0].id
+    assert garden_index(garden).planting_position(garden, first) == (0, 0)
+    assert incremental_validator(garden).validate(garden) == []
+    with pytest.raises(PatchConflict):
+        apply_patch(
+            garden,
+            [
+                {"op": "replace", "path": "/name", "value": "Renamed"},
+                {"op": "remove", "path": "/beds/0/plantings/0"},
+                {"op": "remove", "path": "/beds/9"},
+            ],
+        )
+    assert garden.model_dump() == before
+    assert garden_index(garden).planting_position(garden, first) == (0, 0)
+    assert incremental_validator(garden).validate(garden) == validate_garden(garden)
+
+    with pytest.raises(PatchConflict, match="/beds/0/dimensions/width"):
+        apply_patch(
+            garden,
+            [
+                {"op": "replace", "path": "/name", "value": "Renamed"},
+                {"op": "replace", "path": "/beds/0/dimensions/width", "value": "x"},
+            ],
+        )
+    assert garden.model_dump() == before
+
+
+def test_apply_patch_invalidates_incremental_validation():
+    garden = make_garden()
+    validator = incremental_validator(garden)
+    assert validator.validate(garden) == []
+    apply_patch(
+        garden, [{"op": "replace", "path": "/beds/0/dimensions/width", "value": 0.5}]
+    )
+    assert {i.type for i in validator.validate(garden)} == {"bed_boundary"}
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AutoPlacePlantingsParams,
+    CreateGardenParams,
+    PlacementRequest,
+    add_bed,
+    add_planting,
+    auto_place_plantings,
+    create_garden,
+)
+from growkit_core.models import Bed, Dimensions, Planting, UnitLength
+from growkit_core.placement import pack_plantings
+from growkit_core.validators import validate_garden
+
+
+def make_bed(width=2.0, length=2.0, unit=UnitLength.meters, plantings=()):
+    return Bed(
+        name="Bed",
+        dimensions=Dimensions(width=width, length=length, unit=unit),
+        plantings=list(plantings),
+    )
+
+
+def as_bed(bed, groups, placed):
+    plantings = list(bed.plantings) + [
+        Planting(species="X", position=position, spacing=spacing)
+        for (spacing, _), positions in zip(groups, placed)
+        for position in positions
+    ]
+    return bed.model_copy(update={"plantings": plantings})
+
+
+def test_hex_packing_fits_more_than_a_square_grid():
+    bed = make_bed(3.0, 3.0)
+    placed = pack_plantings(bed, [(0.1, 980)])
+    assert len(placed[0]) == 980
+    with pytest.raises(ValueError, match="only has room for"):
+        pack_plantings(bed, [(0.1, 2000)])
+
+
+def test_large_bed_with_small_spacing_is_lazy():
+    # 100 m x 100 m at 2 cm spacing has tens of millions of lattice points;
+    # placing a few must not enumerate them.
+    bed = make_bed(100.0, 100.0)
+    start = time.perf_counter()
+    placed = pack_plantings(bed, [(0.02, 1), (0.5, 3)])
+    assert time.perf_counter() - start < 1.0
+    assert [len(positions) for positions in placed] == [1, 3]
+
+
+@pytest.mark.parametrize(
+    "bed",
+    [
+        make_bed(),
+        make_bed(0.05, 8.0),
+        make_bed(6.0, 4.0, UnitLength.feet),
+        make_bed(
+            plantings=[
+                Planting(species="Squash", position=(1.0, 1.0), spacing=0.9),
+                Planting(species="Marker", position=(0.2, 1.8)),
+            ]
+        ),
+    ],
+)
+def test_mixed_spacings_validate(bed):
+    groups = [(0.15, 20), (0.4, 3), (0.05, 60)]
+    placed = pack_plantings(bed, groups)
+    assert [len(positions) for positions in placed] == [20, 3, 60]
+    garden = create_garden(CreateGardenParams(name="Packed"))
+    garden.beds.append(as_bed(bed, groups, placed))
+    assert validate_garden(garden) == []
+
+
+def test_auto_place_plantings():
+    garden = create_garden(CreateGardenParams(name="Auto"))
+    add_bed(garden, AddBedParams(name="Raised", width=1.2, length=2.4))
+    bed_id = garden.beds[0].id
+    add_planting(
+        garden,
+        AddPlantingParams(bed_id=bed_id, species="Tomato", position=(0.6, 1.2)),
+    )
+    auto_place_plantings(
+        garden,
+        AutoPlacePlantingsParams(
+            bed_id=bed_id,
+            plantings=[
+                PlacementRequest(species="Lettuce", spacing=0.25, count=12),
+                PlacementRequest(
+                    species="Basil", variety="Genovese", spacing=0.2, count=6
+                ),
+            ],
+        ),
+    )
+    species = [p.species for p in garden.beds[0].plantings]
+    assert species.count("Lettuce") == 12
+    assert species.count("Basil") == 6
+    assert validate_garden(garden) == []
+
+    before = garden.model_dump()
+    with pytest.raises(ValueError):
+        auto_place_plantings(
+            garden,
+            AutoPlacePlantingsParams(
+                bed_id=bed_id,
+                plantings=[PlacementRequest(species="Kale", spacing=0.5, count=50)],
+            ),
+        )
+    assert garden.model_dump() == before
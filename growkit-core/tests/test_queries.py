@@ -0,0 +1,314 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    CreateGardenParams,
+    UpdateTaskStatusParams,
+    add_bed,
+    add_planting,
+    add_task,
+    apply_batch,
+    create_garden,
+    update_task_status,
+)
+from growkit_core.history import garden_history
+from growkit_core.models import Garden, GardenTask, TaskStatus, UnitLength
+from growkit_core.patch import apply_patch
+from growkit_core.queries import (
+    BedQuery,
+    PlantingQuery,
+    TaskIndex,
+    TaskQuery,
+    garden_stats,
+    get_bed,
+    list_beds,
+    list_plantings,
+    overdue_tasks,
+    query_tasks,
+    task_index,
+    tasks_due,
+    tasks_for,
+)
+
+START = date(2025, 3, 1)
+
+
+def make_garden(rng: random.Random, tasks: int = 300) -> Garden:
+    garden = create_garden(CreateGardenParams(name="Calendar"))
+    for i in range(3):
+        add_bed(garden, AddBedParams(name=f"Bed {i}", width=2, length=2))
+        add_planting(
+            garden,
+            AddPlantingParams(
+                bed_id=garden.beds[i].id, species="Kale", position=(1, 1)
+            ),
+        )
+    for _ in range(tasks):
+        add_random_task(garden, rng)
+    return garden
+
+
+def add_random_task(garden: Garden, rng: random.Random) -> None:
+    bed = rng.choice(garden.beds)
+    related = rng.random()
+    add_task(
+        garden,
+        AddTaskParams(
+            title="Task",
+            target_date=START + timedelta(days=rng.randrange(120)),
+            related_bed_id=bed.id if related < 0.6 else None,
+            related_planting_id=bed.plantings[0].id if related < 0.3 else None,
+        ),
+    )
+
+
+def brute_force(garden: Garden, query: TaskQuery):
+    matches = [
+        (task.target_date, i, task)
+        for i, task in enumerate(garden.tasks)
+        if (query.start is None or task.target_date >= query.start)
+        and (query.end is None or task.target_date <= query.end)
+        and (query.status is None or task.status in query.status)
+        and (query.planting_id is None or task.related_planting_id == query.planting_id)
+        and (query.bed_id is None or task.related_bed_id == query.bed_id)
+    ]
+    return [task for _, _, task in sorted(matches, key=lambda m: m[:2])]
+
+
+def random_query(garden: Garden, rng: random.Random) -> TaskQuery:
+    bed = rng.choice(garden.beds)
+    start = START + timedelta(days=rng.randrange(120))
+    return TaskQuery(
+        start=rng.choice([None, start]),
+        end=rng.choice([None, start + timedelta(days=rng.randrange(30))]),
+        status=rng.choice(
+            [None, [TaskStatus.pending], [TaskStatus.completed, TaskStatus.skipped]]
+        ),
+        planting_id=rng.choice([None, None, bed.plantings[0].id]),
+        bed_id=rng.choice([None, None, bed.id]),
+        limit=500,
+    )
+
+
+def assert_matches(garden: Garden, rng: random.Random, queries: int = 20) -> None:
+    for _ in range(queries):
+        query = random_query(garden, rng)
+        assert query_tasks(garden, query).tasks == brute_force(garden, query)
+
+
+def test_queries_match_brute_force_across_updates():
+    rng = random.Random(7)
+    garden = make_garden(rng)
+    for step in range(100):
+        action = rng.random()
+        if action < 0.4:
+            add_random_task(garden, rng)
+        elif action < 0.8:
+            update_task_status(
+                garden,
+                UpdateTaskStatusParams(
+                    task_id=rng.choice(garden.tasks).id,
+                    status=rng.choice(list(TaskStatus)),
+                ),
+            )
+        elif action < 0.9:
+            i = rng.randrange(len(garden.tasks))
+            apply_patch(
+                garden,
+                [
+                    {
+                        "op": "replace",
+                        "path": f"/tasks/{i}/target_date",
+                        "value": str(START + timedelta(days=rng.randrange(120))),
+                    }
+                ],
+            )
+        else:
+            apply_patch(garden, [{"op": "remove", "path": "/tasks/0"}])
+        assert_matches(garden, rng, queries=3)
+
+
+def test_maintained_without_rebuilding(monkeypatch):
+    rng = random.Random(8)
+    garden = make_garden(rng)
+    query_tasks(garden, TaskQuery())
+    rebuilds = []
+    original = TaskIndex._refresh
+
+    def spy(self, g):
+        if not self._indexed(g.tasks):
+            rebuilds.append(g)
+        original(self, g)
+
+    monkeypatch.setattr(TaskIndex, "_refresh", spy)
+    history = garden_history(garden)
+    for _ in range(20):
+        history.checkpoint(garden)
+        add_random_task(garden, rng)
+        update_task_status(
+            garden,
+            UpdateTaskStatusParams(
+                task_id=garden.tasks[-1].id, status=TaskStatus.completed
+            ),
+        )
+        assert_matches(garden, rng, queries=2)
+    assert rebuilds == []
+
+    history.undo(garden)
+    assert_matches(garden, rng)
+
+
+def test_pagination():
+    rng = random.Random(9)
+    garden = make_garden(rng, tasks=120)
+    query = TaskQuery(status=[TaskStatus.pending], limit=50)
+    seen = []
+    while True:
+        page = query_tasks(garden, query)
+        assert page.total == 120
+        seen.extend(page.tasks)
+        if page.next_offset is None:
+            break
+        query = query.model_copy(update={"offset": page.next_offset})
+    assert seen == brute_force(garden, TaskQuery(status=[TaskStatus.pending]))
+
+
+def test_convenience_queries():
+    garden = create_garden(CreateGardenParams(name="Week"))
+    add_bed(garden, AddBedParams(name="Bed", width=1, length=1))
+    bed_id = garden.beds[0].id
+    for day, title in [(1, "Sow"), (3, "Water"), (9, "Thin"), (20, "Harvest")]:
+        add_task(
+            garden,
+            AddTaskParams(
+                title=title, target_date=date(2025, 6, day), related_bed_id=bed_id
+            ),
+        )
+    update_task_status(
+        garden,
+        UpdateTaskStatusParams(task_id=garden.tasks[0].id, status=TaskStatus.completed),
+    )
+    assert garden.tasks[0].completed_on == date.today()
+
+    today = date(2025, 6, 10)
+    assert [t.title for t in overdue_tasks(garden, today)] == ["Water", "Thin"]
+    assert [t.title for t in tasks_due(garden, today, date(2025, 6, 30))] == ["Harvest"]
+    assert [t.title for t in tasks_for(garden, bed_id=bed_id)] == [
+        "Sow",
+        "Water",
+        "Thin",
+        "Harvest",
+    ]
+    assert [
+        t.title for t in tasks_for(garden, bed_id=bed_id, status=TaskStatus.completed)
+    ] == ["Sow"]
+
+    with pytest.raises(ValueError):
+        update_task_status(
+            garden, UpdateTaskStatusParams(task_id="missing", status=TaskStatus.skipped)
+        )
+
+
+def test_rolled_back_batch_does_not_leave_stale_entries():
+    garden = create_garden(CreateGardenParams(name="Rollback"))
+    index = task_index(garden)
+    assert index.query(garden) == []
+    with pytest.raises(ValueError):
+        apply_batch(
+            garden,
+            [
+                AddTaskParams(title="Ghost", target_date=date(2030, 1, 1)),
+                AddPlantingParams(bed_id="missing", species="Kale", position=(0, 0)),
+            ],
+        )
+    garden.tasks.append(GardenTask(title="Real", target_date=date(2031, 1, 1)))
+    assert index.query(garden, start=date(2031, 1, 1)) == [0]
+
+
+def make_planted_garden() -> Garden:
+    garden = create_garden(CreateGardenParams(name="Plots"))
+    add_bed(garden, AddBedParams(name="Meters", width=2, length=1))
+    add_bed(
+        garden, AddBedParams(name="Feet", width=10, length=10, unit=UnitLength.feet)
+    )
+    for i in range(6):
+        add_planting(
+            garden,
+            AddPlantingParams(
+                bed_id=garden.beds[i % 2].id,
+                species="Kale" if i % 3 else "Bean",
+                position=(0.3 * i + 0.1, 0.5),
+                spacing=0.1,
+                planted_on=date(2025, 4, 1 + i),
+            ),
+        )
+    return garden
+
+
+def test_list_beds():
+    garden = make_planted_garden()
+    page = list_beds(garden, BedQuery(limit=1))
+    assert page.total == 2 and page.next_offset == 1
+    assert page.beds[0].name == "Meters"
+    assert page.beds[0].planting_count == 3
+    assert page.beds[0].area == 2.0
+    assert page.beds[0].density == 1.5
+    assert page.beds[0].planted_area == pytest.approx(0.03)
+    second = list_beds(garden, BedQuery(offset=1, limit=1))
+    assert second.beds[0].area == pytest.approx(100 * 0.3048**2)
+    assert second.next_offset is None
+
+
+def test_get_bed_pages_plantings():
+    garden = make_planted_garden()
+    bed = garden.beds[0]
+    detail = get_bed(garden, bed.id, limit=2)
+    assert detail.name == "Meters" and detail.planting_count == 3
+    assert detail.plantings == bed.plantings[:2]
+    assert detail.next_offset == 2
+    rest = get_bed(garden, bed.id, offset=detail.next_offset)
+    assert rest.plantings == bed.plantings[2:] and rest.next_offset is None
+
+    with pytest.raises(ValueError):
+        get_bed(garden, "missing")
+
+
+def test_list_plantings():
+    garden = make_planted_garden()
+    bed = garden.beds[1]
+
+    page = list_plantings(garden, PlantingQuery(bed_id=bed.id))
+    assert [p.id for p in page.plantings] == [p.id for p in bed.plantings]
+    assert {p.bed_id for p in page.plantings} == {bed.id}
+
+    page = list_plantings(garden, PlantingQuery(species="kale", limit=2))
+    assert page.total == 4 and page.next_offset == 2
+    assert [p.planted_on.day for p in page.plantings] == [3, 5]
+
+    page = list_plantings(
+        garden,
+        PlantingQuery(planted_from=date(2025, 4, 2), planted_to=date(2025, 4, 4)),
+    )
+    assert sorted(p.planted_on.day for p in page.plantings) == [2, 3, 4]
+
+    with pytest.raises(ValueError):
+        list_plantings(garden, PlantingQuery(bed_id="missing"))
+
+
+def test_garden_stats():
+    garden = make_planted_garden()
+    add_task(garden, AddTaskParams(title="Weed", target_date=date(2030, 1, 1)))
+    stats = garden_stats(garden)
+    assert stats.bed_count == 2
+    assert stats.planting_count == 6
+    assert stats.task_count == 1
+    assert stats.tasks_by_status[TaskStatus.pending] == 1
+    assert stats.tasks_by_status[TaskStatus.completed] == 0
+    assert stats.plantings_by_species == {"Bean": 2, "Kale": 4}
+    assert stats.bed_area == pytest.approx(2 + 100 * 0.3048**2)
+    assert stats.densest_bed_id == garden.beds[0].id
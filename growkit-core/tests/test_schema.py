@@ -0,0 +1,34 @@
+import json
+
+import growkit_core.schema as schema
+from growkit_core.models import SCHEMA_VERSION
+
+
+def test_packaged_schema_is_up_to_date():
+    # If this fails, run `growkit-core schema --write-packaged`.
+    packaged = json.loads(schema.packaged_schema_path().read_bytes())
+    assert packaged == schema.generate_garden_schema()
+    assert schema.PACKAGED_SCHEMA == f"garden-{SCHEMA_VERSION}.json"
+
+
+def test_schema_is_generated_once_without_packaged_file(monkeypatch):
+    monkeypatch.setattr(schema, "_cache", {})
+    monkeypatch.setattr(schema, "_read_packaged_schema", lambda: None)
+    calls = []
+    generate = schema.generate_garden_schema
+    monkeypatch.setattr(
+        schema, "generate_garden_schema", lambda: calls.append(1) or generate()
+    )
+    first = schema.get_garden_schema()
+    first["title"] = "Changed"
+    assert schema.get_garden_schema() == generate()
+    assert schema.garden_schema_json() is schema.garden_schema_json()
+    assert calls == [1]
+
+
+def test_inline_schema_has_no_refs():
+    inline = schema.inline_garden_schema()
+    text = json.dumps(inline)
+    assert "$ref" not in text and "$defs" not in text
+    beds = inline["properties"]["beds"]["items"]
+    assert beds["properties"]["plantings"]["items"]["title"] == "Planting"
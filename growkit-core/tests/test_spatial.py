@@ -0,0 +1,122 @@
+import random
+from math import dist
+
+from growkit_core.models import Bed, Dimensions, Planting
+from growkit_core.spatial import (
+    RectangleGrid,
+    SpatialGrid,
+    overlapping_rectangles,
+    rectangles_overlap,
+    spacing_conflict_pairs,
+)
+from growkit_core.validators import validate_spacing_conflicts
+
+
+def brute_force_pairs(positions, spacings):
+    pairs = []
+    for i in range(len(positions)):
+        for j in range(i + 1, len(positions)):
+            if dist(positions[i], positions[j]) < max(spacings[i], spacings[j]):
+                pairs.append((i, j))
+    return pairs
+
+
+def test_grid_query_returns_nearby_points():
+    grid = SpatialGrid(1.0)
+    grid.insert(0, (0.5, 0.5))
+    grid.insert(1, (5.5, 5.5))
+    keys = {key for key, _ in grid.query((0.0, 0.0), 1.0)}
+    assert keys == {0}
+
+
+def test_grid_query_with_radius_larger_than_grid():
+    grid = SpatialGrid(0.01)
+    grid.insert(0, (0.5, 0.5))
+    grid.insert(1, (50.0, 50.0))
+    keys = {key for key, _ in grid.query((0.0, 0.0), 100.0)}
+    assert keys == {0, 1}
+
+
+def test_spacing_conflict_pairs_matches_brute_force():
+    rng = random.Random(42)
+    positions = [(rng.uniform(0, 3), rng.uniform(0, 3)) for _ in range(300)]
+    spacings = [rng.choice([0, 0.05, 0.1, 0.3, 1.0]) for _ in range(300)]
+    assert spacing_conflict_pairs(positions, spacings) == brute_force_pairs(
+        positions, spacings
+    )
+
+
+def test_spacing_conflict_pairs_handles_ties_and_duplicates():
+    positions = [(0.1, 0.1), (0.1, 0.1), (0.15, 0.1), (-0.05, 0.1)]
+    spacings = [0.2, 0.2, 0.2, 0]
+    assert spacing_conflict_pairs(positions, spacings) == brute_force_pairs(
+        positions, spacings
+    )
+
+
+def test_spacing_conflict_pairs_no_spacing():
+    assert spacing_conflict_pairs([(0, 0), (0, 0)], [0, 0]) == []
+
+
+def test_validate_spacing_conflicts_preserves_order():
+    rng = random.Random(7)
+    plantings = [
+        Planting(
+            species="Lettuce",
+            position=(rng.uniform(0, 2), rng.uniform(0, 2)),
+            spacing=rng.choice([None, 0.1, 0.25]),
+        )
+        for _ in range(200)
+    ]
+    bed = Bed(
+        name="Dense", dimensions=Dimensions(width=2, length=2), plantings=plantings
+    )
+    expected = [
+        (plantings[i], plantings[j])
+        for i, j in brute_force_pairs(
+            [p.position for p in plantings], [p.spacing or 0 for p in plantings]
+        )
+    ]
+    assert validate_spacing_conflicts(bed) == expected
+
+
+def random_rects(rng, n, size=5.0):
+    rects = []
+    for _ in range(n):
+        x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+        rects.append((x, y, x + rng.uniform(0.5, size), y + rng.uniform(0.5, size)))
+    return rects
+
+
+def test_overlapping_rectangles_matches_brute_force():
+    rng = random.Random(5)
+    rects = random_rects(rng, 400) + [None, (0, 0, 1, 1), (1, 0, 2, 1)]
+    expected = [
+        (i, j)
+        for i in range(len(rects))
+        for j in range(i + 1, len(rects))
+        if rects[i] and rects[j] and rectangles_overlap(rects[i], rects[j])
+    ]
+    assert overlapping_rectangles(rects) == expected
+    # Rectangles sharing an edge do not overlap.
+    assert (len(rects) - 2, len(rects) - 1) not in expected
+
+
+def test_rectangle_grid_tracks_updates():
+    rng = random.Random(6)
+    rects = dict(enumerate(random_rects(rng, 300)))
+    rects[300] = (-50, -50, 500, 500)  # covers far too many cells to list
+    grid = RectangleGrid(2.0)
+    for key, rect in rects.items():
+        grid.insert(key, rect)
+    for key in rng.sample(sorted(rects), 100):
+        if rng.random() < 0.5:
+            grid.remove(key)
+            del rects[key]
+        else:
+            rects[key] = random_rects(rng, 1, size=20.0)[0]
+            grid.insert(key, rects[key])
+    for probe in random_rects(rng, 50, size=30.0):
+        assert grid.overlapping(probe) == {
+            key for key, rect in rects.items() if rectangles_overlap(probe, rect)
+        }
@@ -7,9 +7,13 @@ from growkit_core.models import (
     GardenTask,
     Planting,
     TaskStatus,
+    UnitLength,
 )
 from growkit_core.validators import (
     validate_bed_boundaries,
+    validate_bed_overlaps,
+    validate_garden,
+    validate_garden_boundaries,
     validate_garden_spacing,
     validate_spacing_conflicts,
     validate_task_dates,
@@ -58,6 +62,26 @@ def test_validate_bed_boundaries_outside():
     assert p2 in issues
 
 
+def test_validate_bed_boundaries_uses_bed_unit():
+    inside = Planting(species="Bean", position=(3.9, 7.5))
+    outside = Planting(species="Corn", position=(4.1, 0.5))
+    bed = Bed(
+        name="Feet Bed",
+        dimensions=Dimensions(width=4.0, length=8.0, unit=UnitLength.feet),
+        plantings=[inside, outside],
+    )
+    assert validate_bed_boundaries(bed) == [outside]
+
+
+def test_validate_garden_boundaries_combines_beds():
+    p1 = Planting(species="Bean", position=(1.1, 0.5))
+    p2 = Planting(species="Corn", position=(0.5, -0.1))
+    b1 = make_bed_with_plantings([p1])
+    b2 = make_bed_with_plantings([Planting(species="Kale", position=(0.5, 0.5)), p2])
+    garden = Garden(name="Boundary Garden", beds=[b1, b2])
+    assert validate_garden_boundaries(garden) == [("Test Bed", p1), ("Test Bed", p2)]
+
+
 def test_validate_garden_spacing_combines_beds():
     p1 = Planting(species="A", position=(0.1, 0.1), spacing=0.2)
     p2 = Planting(species="B", position=(0.25, 0.15), spacing=0.2)
@@ -137,3 +161,24 @@ def test_validate_task_dates_invalid_general():
     invalid = validate_task_dates(garden)
     assert len(invalid) == 1
     assert invalid[0] == task
+
+
+def test_validate_bed_overlaps_converts_units():
+    feet = Bed(
+        name="Feet",
+        position=(0, 0),
+        dimensions=Dimensions(width=10.0, length=10.0, unit=UnitLength.feet),
+    )
+    near = Bed(name="Near", position=(3.0, 0), dimensions=Dimensions(width=1, length=1))
+    edge = Bed(
+        name="Edge", position=(3.048, 0), dimensions=Dimensions(width=1, length=1)
+    )
+    loose = Bed(name="Loose", dimensions=Dimensions(width=100, length=100))
+    garden = Garden(name="Overlaps", beds=[feet, near, edge, loose])
+
+    assert validate_bed_overlaps(garden) == [(feet, near), (near, edge)]
+    issues = [i for i in validate_garden(garden) if i.type == "bed_overlap"]
+    assert [(i.bed_name, i.other_bed_name) for i in issues] == [
+        ("Feet", "Near"),
+        ("Near", "Edge"),
+    ]
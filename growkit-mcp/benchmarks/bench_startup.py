@@ -0,0 +1,97 @@
+"""
+Benchmark for the stdio server's cold start.
+
+Launches a fresh growkit-mcp server process per run, the way an agent does
+for every session, and measures the time until the initialize response and
+until the tools/list response. Exits with status 1 if the median time to the
+initialize response exceeds the target. Run with:
+
+    uv run python benchmarks/bench_startup.py [--runs N] [--target SECONDS]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import IO, Tuple
+
+# Median seconds from process launch to the initialize response.
+TARGET_SECONDS = 1.2
+RUNS = 5
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench_startup", "version": "0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+LIST_TOOLS = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+
+def _send(stdin: IO[bytes], message: dict) -> None:
+    stdin.write(json.dumps(message).encode() + b"\n")
+    stdin.flush()
+
+
+def _response(stdout: IO[bytes], request_id: int) -> dict:
+    while True:
+        line = stdout.readline()
+        if not line:
+            raise RuntimeError("Server exited before responding")
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+
+def measure_startup() -> Tuple[float, float]:
+    """Returns (seconds to initialize response, seconds to tools/list response)."""
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-c", "from growkit_mcp import main; main()"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _send(server.stdin, INITIALIZE)
+        _response(server.stdout, 1)
+        initialized = time.perf_counter() - start
+        _send(server.stdin, INITIALIZED)
+        _send(server.stdin, LIST_TOOLS)
+        tools = _response(server.stdout, 2)["result"]["tools"]
+        assert tools, "Server listed no tools"
+        listed = time.perf_counter() - start
+    finally:
+        server.kill()
+        server.wait()
+    return initialized, listed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=RUNS)
+    parser.add_argument("--target", type=float, default=TARGET_SECONDS)
+    args = parser.parse_args()
+
+    initialize, list_tools = zip(*(measure_startup() for _ in range(args.runs)))
+    initialize_median = statistics.median(initialize)
+    print(f"{'':>12} {'median':>8} {'min':>8} {'max':>8}")
+    for label, times in [("initialize", initialize), ("tools/list", list_tools)]:
+        print(
+            f"{label:>12} {statistics.median(times):>7.3f}s "
+            f"{min(times):>7.3f}s {max(times):>7.3f}s"
+        )
+    verdict = "ok" if initialize_median <= args.target else "OVER TARGET"
+    print(f"target: initialize <= {args.target:.2f}s ({verdict})")
+    return 0 if initialize_median <= args.target else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
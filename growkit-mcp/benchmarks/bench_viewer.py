@@ -0,0 +1,66 @@
+"""
+Benchmark for the ViewGarden payload.
+
+Encodes growkit-core's synthetic benchmark gardens the way ViewGarden used
+to (full JSON, zlib level 9) and the way it does now (viewer.compact_garden,
+COMPRESSION_LEVEL), and prints the payload sizes, encoding times and whether
+the result fits in a URL or goes through the loopback handoff. Run with:
+
+    uv run python benchmarks/bench_viewer.py [--scale small,medium,large]
+"""
+
+import argparse
+import base64
+import json
+import statistics
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, List
+
+from growkit_core.models import Garden
+
+from growkit_mcp.viewer import MAX_URL_LENGTH, encode_garden
+
+# The synthetic gardens live with growkit-core's benchmark suite.
+sys.path.insert(0, str(Path(__file__).parents[2] / "growkit-core" / "benchmarks"))
+from generators import SCALES, make_garden
+
+REPEAT = 5
+
+
+def legacy_encode(garden: Garden) -> str:
+    garden_json = json.dumps(garden.model_dump(mode="json"), separators=(",", ":"))
+    compressed = zlib.compress(garden_json.encode("utf-8"), level=9)
+    return base64.urlsafe_b64encode(compressed).decode("ascii")
+
+
+def measure(encode: Callable[[Garden], str], garden: Garden, repeat: int):
+    """Returns (median seconds, encoded length)."""
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encoded = encode(garden)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), len(encoded)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", default="small,medium,large")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    args = parser.parse_args()
+
+    print(f"{'scale':<8} {'encoding':<8} {'bytes':>10} {'ms':>9}  delivery")
+    for scale in args.scale.split(","):
+        garden = make_garden(SCALES[scale])
+        for label, encode in [("legacy", legacy_encode), ("compact", encode_garden)]:
+            seconds, size = measure(encode, garden, args.repeat)
+            delivery = "url" if size < MAX_URL_LENGTH else "loopback"
+            print(f"{scale:<8} {label:<8} {size:>10} {seconds * 1e3:>9.2f}  {delivery}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
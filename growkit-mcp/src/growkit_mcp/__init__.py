@@ -2,7 +2,13 @@ from .server import mcp
 
 
 def main():
-    mcp.run()
+    from growkit_core.instrumentation import configure_from_env, disable
+
+    configure_from_env()
+    try:
+        mcp.run()
+    finally:
+        disable()
 
 
 if __name__ == "__main__":
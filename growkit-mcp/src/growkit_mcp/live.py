@@ -0,0 +1,228 @@
+import json
+import os
+import queue
+import secrets
+import threading
+import webbrowser
+from http.server import ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from growkit_core.history import snapshot
+from growkit_core.models import Garden
+from growkit_core.patch import PatchOperation
+
+from growkit_mcp.viewer import HandoffHandler, encode_garden
+
+# Imported by the ViewGarden tool on first use, like growkit_mcp.viewer.
+
+# Set to 1 to have ViewGarden show session gardens in a live viewer: one
+# browser tab per session, updated in place after every change instead of a
+# new tab with the whole garden per call.
+LIVE_ENV = "GROWKIT_LIVE_VIEWER"
+# Seconds between keepalive comments on an idle event stream.
+KEEPALIVE = 15.0
+# Events buffered for a viewer that is not reading. A viewer that falls
+# further behind gets a "resync" event and its stream ends; the viewer then
+# reconnects and starts over from the full garden.
+MAX_PENDING = 256
+
+
+def live_enabled() -> bool:
+    return os.environ.get(LIVE_ENV, "") not in ("", "0")
+
+
+class _Viewer:
+    def __init__(self):
+        # (event, data, version); None once the session is closed.
+        self.events: "queue.Queue[Optional[Tuple[str, str, int]]]" = queue.Queue(
+            MAX_PENDING
+        )
+        self.dropped = False
+
+    def send(self, event: Optional[Tuple[str, str, int]]) -> None:
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.dropped = True
+
+
+class _Channel:
+    """A watched session: its garden as of `version` and connected viewers."""
+
+    def __init__(self, token: str, garden: Garden):
+        self.token = token
+        self.garden = garden
+        self.version = 0
+        self.viewers: List[_Viewer] = []
+
+
+class LiveViewerHandler(HandoffHandler):
+    server: "LiveViewerServer"
+
+    def do_GET(self) -> None:
+        prefix, _, token = self.path.rpartition("/")
+        subscription = self.server.subscribe(token) if prefix == "/live" else None
+        if subscription is None:
+            self.send_error(404)
+            return
+        viewer, garden, version = subscription
+        try:
+            self.send_response(200)
+            self._cors()
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self._event("garden", encode_garden(garden), version)
+            self._stream(viewer)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.server.unsubscribe(token, viewer)
+
+    def _stream(self, viewer: _Viewer) -> None:
+        while True:
+            if viewer.dropped:
+                self._event("resync", "", 0)
+                return
+            try:
+                event = viewer.events.get(timeout=KEEPALIVE)
+            except queue.Empty:
+                self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+                continue
+            if event is None:
+                self._event("closed", "", 0)
+                return
+            self._event(*event)
+
+    def _event(self, event: str, data: str, version: int) -> None:
+        self.wfile.write(f"id: {version}\nevent: {event}\ndata: {data}\n\n".encode())
+        self.wfile.flush()
+
+
+class LiveViewerServer(ThreadingHTTPServer):
+    """
+    Streams session gardens to growkit-web over Server-Sent Events on
+    127.0.0.1. A viewer connecting to a session's stream gets a "garden" event
+    with the whole garden (viewer.encode_garden), then a "patch" event with
+    the JSON Patch of every change published for the session, and "closed"
+    when the session is closed. A viewer that falls MAX_PENDING events
+    behind gets "resync" instead and should reconnect. Event ids are the
+    session's change count.
+    As with the handoff server, only pages from `origin` may read the
+    streams.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, origin: str):
+        super().__init__(("127.0.0.1", 0), LiveViewerHandler)
+        self.origin = origin
+        self._channels: Dict[str, _Channel] = {}
+        self._sessions: Dict[str, str] = {}  # stream token -> session id
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def watch(self, session_id: str, garden: Garden) -> str:
+        """Starts serving a session's garden and returns its stream's URL."""
+        with self._lock:
+            channel = self._channels.get(session_id)
+            if channel is None:
+                channel = _Channel(secrets.token_urlsafe(16), snapshot(garden))
+                self._channels[session_id] = channel
+                self._sessions[channel.token] = session_id
+            return f"{self.base_url}/live/{channel.token}"
+
+    def is_watched(self, session_id: str) -> bool:
+        return session_id in self._channels
+
+    def viewer_count(self, session_id: str) -> int:
+        with self._lock:
+            channel = self._channels.get(session_id)
+            return len(channel.viewers) if channel else 0
+
+    def publish(
+        self, session_id: str, patch: List[PatchOperation], garden: Garden
+    ) -> None:
+        """
+        Sends a change to a watched session's viewers. `garden` is the session
+        garden after the change; call this from the thread that made it.
+        """
+        if not patch:
+            return
+        data = json.dumps([op.model_dump(mode="json") for op in patch])
+        with self._lock:
+            channel = self._channels.get(session_id)
+            if channel is None:
+                return
+            channel.version += 1
+            # New viewers start from this copy; later in-place edits of the
+            # session garden do not touch it.
+            channel.garden = snapshot(garden)
+            for viewer in channel.viewers:
+                viewer.send(("patch", data, channel.version))
+
+    def close_session(self, session_id: str) -> None:
+        with self._lock:
+            channel = self._channels.pop(session_id, None)
+            if channel is None:
+                return
+            del self._sessions[channel.token]
+            for viewer in channel.viewers:
+                viewer.send(None)
+
+    def subscribe(self, token: str) -> Optional[Tuple[_Viewer, Garden, int]]:
+        with self._lock:
+            session_id = self._sessions.get(token)
+            if session_id is None:
+                return None
+            channel = self._channels[session_id]
+            viewer = _Viewer()
+            channel.viewers.append(viewer)
+            return viewer, channel.garden, channel.version
+
+    def unsubscribe(self, token: str, viewer: _Viewer) -> None:
+        with self._lock:
+            session_id = self._sessions.get(token)
+            channel = self._channels.get(session_id) if session_id else None
+            if channel is not None and viewer in channel.viewers:
+                channel.viewers.remove(viewer)
+
+
+_server: Optional[LiveViewerServer] = None
+_server_lock = threading.Lock()
+
+
+def live_server(origin: str) -> LiveViewerServer:
+    """
+    The process's live viewer server, started on first use, streaming to the
+    viewer at `origin`.
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = LiveViewerServer(origin)
+            threading.Thread(
+                target=_server.serve_forever, name="growkit-live-viewer", daemon=True
+            ).start()
+        _server.origin = origin
+        return _server
+
+
+def open_live_viewer(
+    server: LiveViewerServer, base_url: str, session_id: str, garden: Garden
+) -> bool:
+    """
+    Opens a tab with the session's live viewer, unless one is already
+    connected. Returns whether a tab was opened.
+    """
+    stream = server.watch(session_id, garden)
+    if server.viewer_count(session_id):
+        return False
+    webbrowser.open_new_tab(f"{base_url}?live={quote(stream, safe='')}")
+    return True
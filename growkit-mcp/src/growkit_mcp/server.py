@@ -1,37 +1,78 @@
-import base64
-import json
+import functools
+import inspect
 import os
-import webbrowser
-import zlib
-from typing import List, Tuple
-from urllib.parse import quote
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from growkit_core.api import (
     AddBedParams,
     AddPlantingParams,
     AddTaskParams,
+    AutoPlacePlantingsParams,
+    BatchOperation,
     CreateGardenParams,
+    GardenTransaction,
     MoveBedParams,
     RemoveBedParams,
     RemovePlantingParams,
     UpdateBedDimensionsParams,
     UpdateGardenMetadataParams,
-    add_bed,
-    add_planting,
-    add_task,
+    UpdateTaskStatusParams,
+    auto_place_operations,
     create_garden,
-    move_bed,
-    remove_bed,
-    remove_planting,
-    update_bed_dimensions,
-    update_garden_metadata,
+    update_task_status,
 )
+from growkit_core.cache import validate_garden_cached
+from growkit_core.history import garden_history, snapshot
+from growkit_core.incremental import incremental_validator
+from growkit_core.index import garden_index
+from growkit_core.instrumentation import instrumented, span
 from growkit_core.models import Garden
-from growkit_core.validators import GardenValidationException, validate_garden
+from growkit_core.patch import diff_gardens
+from growkit_core.queries import (
+    BedDetail,
+    BedPage,
+    BedQuery,
+    GardenStats,
+    Limit,
+    Offset,
+    PlantingPage,
+    PlantingQuery,
+    TaskPage,
+    TaskQuery,
+    garden_stats,
+    get_bed,
+    list_beds,
+    list_plantings,
+    query_tasks,
+)
+from growkit_core.schema import garden_schema_json, inline_garden_schema
+from growkit_core.validators import GardenValidationException
 from mcp.server.fastmcp import FastMCP
 from mcp.shared.exceptions import McpError
 from mcp.types import INVALID_REQUEST, ErrorData
-from pydantic import BaseModel
+from pydantic import BaseModel, WithJsonSchema
+
+from growkit_mcp.sessions import (
+    GardenPatch,
+    ResponseFormat,
+    SessionInfo,
+    SessionResult,
+    SessionStore,
+)
+from growkit_mcp.workers import WorkerPool, worker_count
+
+if TYPE_CHECKING:
+    from growkit_mcp.live import LiveViewerServer
 
 INSTRUCTIONS = """
 You are a garden planning assistant. You help users construct and modify digital garden plans.
@@ -39,7 +80,85 @@ All changes must be reflected in the garden structure, and should be consistent
 Units, positions, and names must always be honored. Be explicit and safe.
 """
 
-mcp = FastMCP("Growkit Garden Agent", INSTRUCTIONS)
+
+class GrowkitMCP(FastMCP):
+    """
+    FastMCP that registers tools on the first tools request instead of at
+    import. Building each tool's argument model and schemas is the largest
+    part of server startup, and a client always sends initialize first, so
+    deferring it gets the initialize response out sooner.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._deferred_tools: List[Tuple[str, Callable]] = []
+
+    def defer_tool(self, name: str, fn: Callable) -> None:
+        self._deferred_tools.append((name, fn))
+
+    def register_deferred_tools(self) -> None:
+        deferred, self._deferred_tools = self._deferred_tools, []
+        for name, fn in deferred:
+            self.tool(name)(fn)
+
+    async def list_tools(self):
+        self.register_deferred_tools()
+        return await super().list_tools()
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]):
+        self.register_deferred_tools()
+        # Covers argument parsing, the tool body and result conversion; the
+        # body alone is the mcp.tool.<name> span recorded by _tool().
+        with span(f"mcp.call.{name}"):
+            return await super().call_tool(name, arguments)
+
+
+mcp = GrowkitMCP("Growkit Garden Agent", INSTRUCTIONS)
+
+sessions = SessionStore()
+
+# A Garden whose JSON schema comes from growkit_core.schema's cache. FastMCP
+# builds input and output schemas for every tool at import; with this they
+# embed the cached garden schema instead of regenerating it for each tool.
+GardenDoc = Annotated[Garden, WithJsonSchema(inline_garden_schema())]
+
+workers = WorkerPool(worker_count())
+# Started by the first live ViewGarden call; see growkit_mcp.live.
+_live: Optional["LiveViewerServer"] = None
+
+
+def _garden_key(arguments: Dict[str, Any]) -> Optional[str]:
+    """The id of the garden a tool call works on, if any."""
+    session_id = arguments.get("session_id")
+    if session_id is not None:
+        try:
+            return sessions.get(session_id).id
+        except KeyError:
+            return None
+    garden = arguments.get("garden")
+    return garden.id if isinstance(garden, Garden) else None
+
+
+def _tool(name: str):
+    """
+    Registers a tool whose body runs on the worker pool, serialized with other
+    calls on the same garden, instead of on the server's event loop. The tool
+    is added to the server on the first tools request; see GrowkitMCP.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+        body = instrumented(f"mcp.tool.{name}")(fn)
+
+        @functools.wraps(fn)
+        async def run(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs).arguments
+            return await workers.run(_garden_key(arguments), body, *args, **kwargs)
+
+        mcp.defer_tool(name, run)
+        return run
+
+    return decorator
 
 
 def _validation_error(e: GardenValidationException):
@@ -52,13 +171,180 @@ def _validation_error(e: GardenValidationException):
     )
 
 
-@mcp.tool("CreateGarden")
-def mcp_create_garden(params: CreateGardenParams) -> Garden:
+def _invalid(message: str) -> McpError:
+    return McpError(ErrorData(message=message, code=INVALID_REQUEST))
+
+
+def _resolve_garden(garden: Optional[Garden], session_id: Optional[str]) -> Garden:
+    if (garden is None) == (session_id is None):
+        raise _invalid("Exactly one of 'garden' or 'session_id' must be provided.")
+    if session_id is None:
+        return garden
+    try:
+        return sessions.get(session_id)
+    except KeyError as e:
+        raise _invalid(str(e.args[0]))
+
+
+Mutation = Callable[[GardenTransaction], Any]
+
+
+def _batch(operations: Sequence[BatchOperation]) -> Mutation:
+    def apply(transaction: GardenTransaction) -> None:
+        for operation in operations:
+            transaction.apply(operation)
+
+    return apply
+
+
+def _mutate(
+    garden: Optional[Garden],
+    session_id: Optional[str],
+    apply: Mutation,
+    message: str,
+    response_format: ResponseFormat = "garden",
+    validate: bool = True,
+) -> Garden | SessionResult | GardenPatch:
+    """
+    Runs a core mutation either on the garden passed in (stateless mode, the
+    mutated garden is returned) or on a session's garden (only a small result
+    is returned). `apply` makes its changes through a GardenTransaction,
+    which restores the garden if they fail, so session gardens are edited in
+    place without a copy, and which records the ids of what they created.
+    Each successful session mutation is recorded in the garden's undo
+    history.
+
+    With response_format="patch" the response carries a JSON Patch from the
+    garden before the call to the garden after it instead of the full garden.
+    """
+    current = _resolve_garden(garden, session_id)
+    before = current.model_dump(mode="json") if response_format == "patch" else None
+    if session_id is None:
+        _apply(apply, current, validate)
+        if before is None:
+            return current
+        return GardenPatch(garden_id=current.id, patch=diff_gardens(before, current))
+    state = snapshot(current)
+    transaction = _apply(apply, current, validate)
+    garden_history(current).push(state, message)
+    _publish(session_id, state, current)
+    return SessionResult(
+        session_id=session_id,
+        message=message,
+        created_ids=transaction.created_ids,
+        patch=diff_gardens(before, current) if before is not None else None,
+    )
+
+
+def _watched(session_id: str) -> bool:
+    return _live is not None and _live.is_watched(session_id)
+
+
+def _publish(session_id: str, before: Garden, after: Garden) -> None:
+    """Pushes a change of a session's garden to its live viewer, if it has one."""
+    if _watched(session_id):
+        _live.publish(session_id, diff_gardens(before, after), after)
+
+
+def _apply(apply: Mutation, garden: Garden, validate: bool) -> GardenTransaction:
+    try:
+        with GardenTransaction(garden, validate=validate) as transaction:
+            apply(transaction)
+        return transaction
+    except GardenValidationException as e:
+        raise _validation_error(e)
+    except (ValueError, IndexError) as e:
+        raise _invalid(str(e))
+
+
+@_tool("OpenGardenSession")
+def mcp_open_garden_session(garden: GardenDoc) -> SessionInfo:
+    """
+    Stores the garden on the server and returns a session id. Pass the
+    session_id instead of the garden to other tools to avoid sending the whole
+    garden back and forth.
+    """
+    return sessions.info(sessions.open(garden))
+
+
+@_tool("CreateGardenSession")
+def mcp_create_garden_session(params: CreateGardenParams) -> SessionInfo:
+    """Creates a new garden held on the server and returns its session id."""
+    return sessions.info(sessions.open(create_garden(params)))
+
+
+@_tool("GetSessionGarden")
+def mcp_get_session_garden(session_id: str) -> GardenDoc:
+    """Returns the full garden held by a session."""
+    return _resolve_garden(None, session_id)
+
+
+@_tool("CloseGardenSession")
+def mcp_close_garden_session(session_id: str) -> GardenDoc:
+    """Closes a session and returns its final garden."""
+    try:
+        garden = sessions.close(session_id)
+    except KeyError as e:
+        raise _invalid(str(e.args[0]))
+    if _live is not None:
+        _live.close_session(session_id)
+    return garden
+
+
+def _history_step(session_id: str, redo: bool) -> SessionResult:
+    garden = _resolve_garden(None, session_id)
+    history = garden_history(garden)
+    before = snapshot(garden) if _watched(session_id) else None
+    try:
+        label = history.redo(garden) if redo else history.undo(garden)
+    except ValueError as e:
+        raise _invalid(str(e))
+    if before is not None:
+        _publish(session_id, before, garden)
+    verb = "Redid" if redo else "Undid"
+    return SessionResult(session_id=session_id, message=f"{verb}: {label}")
+
+
+@_tool("UndoGarden")
+def mcp_undo_garden(session_id: str) -> SessionResult:
+    """Reverts the last change made to a session's garden."""
+    return _history_step(session_id, redo=False)
+
+
+@_tool("RedoGarden")
+def mcp_redo_garden(session_id: str) -> SessionResult:
+    """Re-applies the last change reverted with UndoGarden."""
+    return _history_step(session_id, redo=True)
+
+
+@_tool("BranchGardenSession")
+def mcp_branch_garden_session(session_id: str) -> SessionInfo:
+    """
+    Opens a new session on a copy of a session's garden, e.g. to try out a
+    layout without touching the original. Branching is cheap: the copy shares
+    all unchanged beds with the original.
+    """
+    return sessions.info(sessions.open(snapshot(_resolve_garden(None, session_id))))
+
+
+@_tool("CreateGarden")
+def mcp_create_garden(params: CreateGardenParams) -> GardenDoc:
     return create_garden(params)
 
 
-@mcp.tool("AddBed")
-def mcp_add_bed(garden: Garden, params: AddBedParams) -> Garden:
+@_tool("AddBed")
+def mcp_add_bed(
+    params: AddBedParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
+    """
+    Adds a bed to the garden. Position is in meters. If it is omitted, the bed
+    is placed half a meter to the right of the rightmost bed (at (0, 0) in a
+    garden without positioned beds), so it overlaps no other bed. Pass a
+    position to put the bed somewhere else; beds may not overlap.
+    """
     if not params.name.strip():
         raise McpError(
             ErrorData(message="Bed name must not be empty.", code=INVALID_REQUEST)
@@ -70,14 +356,22 @@ def mcp_add_bed(garden: Garden, params: AddBedParams) -> Garden:
                 code=INVALID_REQUEST,
             )
         )
-    try:
-        return add_bed(garden, params, validate=True)
-    except GardenValidationException as e:
-        raise _validation_error(e)
+    return _mutate(
+        garden,
+        session_id,
+        lambda t: t.apply(params),
+        f"Added bed '{params.name}'.",
+        response_format,
+    )
 
 
-@mcp.tool("AddPlanting")
-def mcp_add_planting(garden: Garden, params: AddPlantingParams) -> Garden:
+@_tool("AddPlanting")
+def mcp_add_planting(
+    params: AddPlantingParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
     if not params.species.strip():
         raise McpError(
             ErrorData(
@@ -85,81 +379,134 @@ def mcp_add_planting(garden: Garden, params: AddPlantingParams) -> Garden:
                 code=INVALID_REQUEST,
             )
         )
-    if not any(bed.id == params.bed_id for bed in garden.beds):
-        raise McpError(
-            ErrorData(
-                message=f"No bed with id '{params.bed_id}' exists in the garden.",
-                code=INVALID_REQUEST,
+
+    def apply(transaction: GardenTransaction) -> None:
+        garden = transaction.garden
+        if garden_index(garden).bed(garden, params.bed_id) is None:
+            raise McpError(
+                ErrorData(
+                    message=f"No bed with id '{params.bed_id}' exists in the garden.",
+                    code=INVALID_REQUEST,
+                )
             )
-        )
-    try:
-        return add_planting(garden, params, validate=True)
-    except GardenValidationException as e:
-        raise _validation_error(e)
+        transaction.apply(params)
+
+    return _mutate(
+        garden,
+        session_id,
+        apply,
+        f"Added planting '{params.species}'.",
+        response_format,
+    )
 
 
-@mcp.tool("AddTask")
-def mcp_add_task(garden: Garden, params: AddTaskParams) -> Garden:
-    return add_task(garden, params)
+@_tool("AddTask")
+def mcp_add_task(
+    params: AddTaskParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
+    return _mutate(
+        garden,
+        session_id,
+        lambda t: t.apply(params),
+        f"Added task '{params.title}'.",
+        response_format,
+    )
 
 
-@mcp.tool("MoveBed")
-def mcp_move_bed(garden: Garden, params: MoveBedParams) -> Garden:
-    if not any(b.id == params.bed_id for b in garden.beds):
-        raise McpError(
-            ErrorData(
-                message=f"No bed with id '{params.bed_id}' exists.",
-                code=INVALID_REQUEST,
+@_tool("MoveBed")
+def mcp_move_bed(
+    params: MoveBedParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
+    def apply(transaction: GardenTransaction) -> None:
+        garden = transaction.garden
+        if garden_index(garden).bed(garden, params.bed_id) is None:
+            raise McpError(
+                ErrorData(
+                    message=f"No bed with id '{params.bed_id}' exists.",
+                    code=INVALID_REQUEST,
+                )
             )
-        )
-    try:
-        return move_bed(garden, params, validate=True)
-    except GardenValidationException as e:
-        raise _validation_error(e)
+        transaction.apply(params)
 
+    return _mutate(
+        garden, session_id, apply, f"Moved bed '{params.bed_id}'.", response_format
+    )
 
-@mcp.tool("RemoveBed")
-def mcp_remove_bed(garden: Garden, params: RemoveBedParams) -> Garden:
-    if not any(b.id == params.bed_id for b in garden.beds):
-        raise McpError(
-            ErrorData(
-                message=f"No bed with id '{params.bed_id}' found.",
-                code=INVALID_REQUEST,
+
+@_tool("RemoveBed")
+def mcp_remove_bed(
+    params: RemoveBedParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
+    def apply(transaction: GardenTransaction) -> None:
+        garden = transaction.garden
+        if garden_index(garden).bed(garden, params.bed_id) is None:
+            raise McpError(
+                ErrorData(
+                    message=f"No bed with id '{params.bed_id}' found.",
+                    code=INVALID_REQUEST,
+                )
             )
-        )
-    try:
-        return remove_bed(garden, params, validate=True)
-    except GardenValidationException as e:
-        raise _validation_error(e)
+        transaction.apply(params)
 
+    return _mutate(
+        garden, session_id, apply, f"Removed bed '{params.bed_id}'.", response_format
+    )
 
-@mcp.tool("RemovePlanting")
-def mcp_remove_planting(garden: Garden, params: RemovePlantingParams) -> Garden:
-    bed = next((b for b in garden.beds if b.id == params.bed_id), None)
-    if not bed:
-        raise McpError(
-            ErrorData(
-                message=f"Bed with id '{params.bed_id}' not found.",
-                code=INVALID_REQUEST,
+
+@_tool("RemovePlanting")
+def mcp_remove_planting(
+    params: RemovePlantingParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
+    def apply(transaction: GardenTransaction) -> None:
+        garden = transaction.garden
+        bed = garden_index(garden).bed(garden, params.bed_id)
+        if bed is None:
+            raise McpError(
+                ErrorData(
+                    message=f"Bed with id '{params.bed_id}' not found.",
+                    code=INVALID_REQUEST,
+                )
             )
-        )
-    if not (0 <= params.planting_index < len(bed.plantings)):
-        raise McpError(
-            ErrorData(
-                message=f"Planting index {params.planting_index} is out of bounds for bed '{params.bed_id}'.",
-                code=INVALID_REQUEST,
+        if params.planting_index is not None and not (
+            0 <= params.planting_index < len(bed.plantings)
+        ):
+            raise McpError(
+                ErrorData(
+                    message=f"Planting index {params.planting_index} is out of bounds for bed '{params.bed_id}'.",
+                    code=INVALID_REQUEST,
+                )
             )
-        )
-    try:
-        return remove_planting(garden, params, validate=True)
-    except GardenValidationException as e:
-        raise _validation_error(e)
+        transaction.apply(params)
+
+    return _mutate(
+        garden,
+        session_id,
+        apply,
+        f"Removed planting {params.planting_id or params.planting_index} "
+        f"from bed '{params.bed_id}'.",
+        response_format,
+    )
 
 
-@mcp.tool("UpdateBedDimensions")
+@_tool("UpdateBedDimensions")
 def mcp_update_bed_dimensions(
-    garden: Garden, params: UpdateBedDimensionsParams
-) -> Garden:
+    params: UpdateBedDimensionsParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
     if params.width <= 0 or params.length <= 0:
         raise McpError(
             ErrorData(
@@ -167,23 +514,34 @@ def mcp_update_bed_dimensions(
                 code=INVALID_REQUEST,
             )
         )
-    if not any(b.id == params.bed_id for b in garden.beds):
-        raise McpError(
-            ErrorData(
-                message=f"Bed with id '{params.bed_id}' not found.",
-                code=INVALID_REQUEST,
+
+    def apply(transaction: GardenTransaction) -> None:
+        garden = transaction.garden
+        if garden_index(garden).bed(garden, params.bed_id) is None:
+            raise McpError(
+                ErrorData(
+                    message=f"Bed with id '{params.bed_id}' not found.",
+                    code=INVALID_REQUEST,
+                )
             )
-        )
-    try:
-        return update_bed_dimensions(garden, params, validate=True)
-    except GardenValidationException as e:
-        raise _validation_error(e)
+        transaction.apply(params)
+
+    return _mutate(
+        garden,
+        session_id,
+        apply,
+        f"Updated dimensions of bed '{params.bed_id}'.",
+        response_format,
+    )
 
 
-@mcp.tool("UpdateGardenMetadata")
+@_tool("UpdateGardenMetadata")
 def mcp_update_garden_metadata(
-    garden: Garden, params: UpdateGardenMetadataParams
-) -> Garden:
+    params: UpdateGardenMetadataParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
     if not params.name and not params.location:
         raise McpError(
             ErrorData(
@@ -191,61 +549,217 @@ def mcp_update_garden_metadata(
                 code=INVALID_REQUEST,
             )
         )
-    return update_garden_metadata(garden, params)
+    return _mutate(
+        garden,
+        session_id,
+        lambda t: t.apply(params),
+        "Updated garden metadata.",
+        response_format,
+    )
 
 
 class AddBedsParams(BaseModel):
     beds: List[AddBedParams]
 
 
-@mcp.tool("AddBeds")
-def mcp_add_beds(garden: Garden, params: AddBedsParams) -> Garden:
+@_tool("AddBeds")
+def mcp_add_beds(
+    params: AddBedsParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
     """
     Adds multiple beds to the garden. All beds are validated at once.
     If any addition fails, the operation halts and errors are returned.
     """
-    try:
-        for bed_params in params.beds:
-            garden = add_bed(garden, bed_params, validate=False)
-        issues = validate_garden(garden)
-        if issues:
-            raise GardenValidationException(issues)
-        return garden
-    except GardenValidationException as e:
-        raise _validation_error(e)
-    except ValueError as e:
-        raise McpError(ErrorData(message=str(e), code=INVALID_REQUEST))
+
+    return _mutate(
+        garden,
+        session_id,
+        _batch(params.beds),
+        f"Added {len(params.beds)} beds.",
+        response_format,
+    )
 
 
 class AddPlantingsParams(BaseModel):
     plantings: List[AddPlantingParams]
 
 
-@mcp.tool("BulkAddPlantings")
-def mcp_add_plantings(garden: Garden, params: AddPlantingsParams) -> Garden:
+@_tool("BulkAddPlantings")
+def mcp_add_plantings(
+    params: AddPlantingsParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
     """
     Adds multiple plantings to the garden (possibly different beds).
     Validates all at once. If any error occurs, no partial success is promised.
     """
+
+    return _mutate(
+        garden,
+        session_id,
+        _batch(params.plantings),
+        f"Added {len(params.plantings)} plantings.",
+        response_format,
+    )
+
+
+@_tool("AutoPlacePlantings")
+def mcp_auto_place_plantings(
+    params: AutoPlacePlantingsParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
+    """
+    Adds `count` plantings of each requested species to a bed and picks their
+    positions for you: they are packed (in a hex pattern where possible) so
+    that none of them conflicts with the others, with existing plantings or
+    with the bed boundary. Spacing is in the bed's unit. Fails without changing the
+    garden if the bed has no room for all of them.
+    """
+
+    def apply(transaction: GardenTransaction) -> None:
+        garden = transaction.garden
+        if garden_index(garden).bed(garden, params.bed_id) is None:
+            raise McpError(
+                ErrorData(
+                    message=f"No bed with id '{params.bed_id}' exists in the garden.",
+                    code=INVALID_REQUEST,
+                )
+            )
+        for operation in auto_place_operations(garden, params):
+            transaction.apply(operation)
+
+    return _mutate(
+        garden,
+        session_id,
+        apply,
+        f"Placed {sum(p.count for p in params.plantings)} plantings in bed "
+        f"'{params.bed_id}'.",
+        response_format,
+    )
+
+
+@_tool("UpdateTaskStatus")
+def mcp_update_task_status(
+    params: UpdateTaskStatusParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
+    """Marks a task as pending, completed or skipped."""
+    return _mutate(
+        garden,
+        session_id,
+        lambda t: update_task_status(t.garden, params),
+        f"Marked task '{params.task_id}' as {params.status.value}.",
+        response_format,
+        # Like the core function, a status change is not validated.
+        validate=False,
+    )
+
+
+@_tool("QueryTasks")
+def mcp_query_tasks(
+    query: TaskQuery,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+) -> TaskPage:
+    """
+    Returns one page of the garden's tasks, ordered by target date, filtered
+    by an inclusive date range (start/end), status, related planting or
+    related bed. For example, overdue tasks are status ["pending"] with end
+    set to yesterday. Pass next_offset back as offset to get the next page.
+    """
+    return query_tasks(_resolve_garden(garden, session_id), query)
+
+
+@_tool("GetBed")
+def mcp_get_bed(
+    bed_id: str,
+    offset: Offset = 0,
+    limit: Limit = 50,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+) -> BedDetail:
+    """
+    Returns a single bed with its summary figures and one page of its
+    plantings; planting_count is the total. Pass next_offset back as offset
+    to get the next page, or use ListPlantings to filter the plantings.
+    """
+    current = _resolve_garden(garden, session_id)
     try:
-        for planting_params in params.plantings:
-            garden = add_planting(garden, planting_params, validate=False)
-        issues = validate_garden(garden)
-        if issues:
-            raise GardenValidationException(issues)
-        return garden
-    except GardenValidationException as e:
-        raise _validation_error(e)
+        return get_bed(current, bed_id, offset, limit)
     except ValueError as e:
-        raise McpError(ErrorData(message=str(e), code=INVALID_REQUEST))
+        raise _invalid(str(e))
+
+
+@_tool("ListBeds")
+def mcp_list_beds(
+    query: BedQuery,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+) -> BedPage:
+    """
+    Returns one page of bed summaries: position, dimensions, soil, planting
+    count, area and density, but not the plantings themselves. Pass
+    next_offset back as offset to get the next page.
+    """
+    return list_beds(_resolve_garden(garden, session_id), query)
 
 
-@mcp.tool("ValidateGarden")
-def mcp_validate_garden(garden: Garden):
+@_tool("ListPlantings")
+def mcp_list_plantings(
+    query: PlantingQuery,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+) -> PlantingPage:
+    """
+    Returns one page of plantings, each with the id of its bed, filtered by
+    bed, species (case-insensitive) and an inclusive planted_on date range.
+    Pass next_offset back as offset to get the next page.
+    """
+    current = _resolve_garden(garden, session_id)
+    try:
+        return list_plantings(current, query)
+    except ValueError as e:
+        raise _invalid(str(e))
+
+
+@_tool("GardenStats")
+def mcp_garden_stats(
+    garden: Optional[GardenDoc] = None, session_id: Optional[str] = None
+) -> GardenStats:
+    """
+    Returns bed, planting and task counts, plantings per species, bed and
+    planted area in square meters, and overall density. Use ListBeds for the
+    same figures per bed.
+    """
+    return garden_stats(_resolve_garden(garden, session_id))
+
+
+@_tool("ValidateGarden")
+def mcp_validate_garden(
+    garden: Optional[GardenDoc] = None, session_id: Optional[str] = None
+):
     """
     Validates the current garden state. Returns a list of validation issues, if any.
+    Beds unchanged since an earlier validation are not re-checked.
     """
-    issues = validate_garden(garden)
+    current = _resolve_garden(garden, session_id)
+    if session_id is None:
+        # A garden passed in is a new object on every call: recognize
+        # unchanged beds by content hash.
+        issues = validate_garden_cached(current)
+    else:
+        # A session garden keeps its incremental validator, which the
+        # mutations have already told what changed.
+        issues = incremental_validator(current).validate(current)
     return [issue.model_dump() for issue in issues]
 
 
@@ -253,92 +767,96 @@ class RemovePlantingsParams(BaseModel):
     removals: List[Tuple[str, int]]  # List of (bed_id, planting_index)
 
 
-@mcp.tool("RemovePlantings")
-def mcp_remove_plantings(garden: Garden, params: RemovePlantingsParams) -> Garden:
-    try:
+@_tool("RemovePlantings")
+def mcp_remove_plantings(
+    params: RemovePlantingsParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
+    def apply(transaction: GardenTransaction) -> None:
         # Remove in reverse index order for each bed, so indices don't shift
         sorted_removals = sorted(params.removals, key=lambda x: (x[0], -x[1]))
         for bed_id, idx in sorted_removals:
-            garden = remove_planting(
-                garden,
-                RemovePlantingParams(bed_id=bed_id, planting_index=idx),
-                validate=False,
-            )
-        # Final validation
-        issues = validate_garden(garden)
-        if issues:
-            raise GardenValidationException(issues)
-        return garden
-    except GardenValidationException as e:
-        raise _validation_error(e)
-    except ValueError as e:
-        # Bed or index error from core API
-        raise McpError(
-            ErrorData(
-                message=str(e),
-                code=INVALID_REQUEST,
-            )
-        )
+            transaction.apply(RemovePlantingParams(bed_id=bed_id, planting_index=idx))
+
+    return _mutate(
+        garden,
+        session_id,
+        apply,
+        f"Removed {len(params.removals)} plantings.",
+        response_format,
+    )
 
 
 class RemoveBedsParams(BaseModel):
     bed_ids: List[str]
 
 
-@mcp.tool("RemoveBeds")
-def mcp_remove_beds(garden: Garden, params: RemoveBedsParams) -> Garden:
+@_tool("RemoveBeds")
+def mcp_remove_beds(
+    params: RemoveBedsParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
     """
     Removes multiple beds from the garden by ID. Validates at the end.
     """
-    try:
-        for bed_id in params.bed_ids:
-            garden = remove_bed(garden, RemoveBedParams(bed_id=bed_id), validate=False)
-        issues = validate_garden(garden)
-        if issues:
-            raise GardenValidationException(issues)
-        return garden
-    except GardenValidationException as e:
-        raise _validation_error(e)
-    except ValueError as e:
-        raise McpError(ErrorData(message=str(e), code=INVALID_REQUEST))
+
+    return _mutate(
+        garden,
+        session_id,
+        _batch([RemoveBedParams(bed_id=bed_id) for bed_id in params.bed_ids]),
+        f"Removed {len(params.bed_ids)} beds.",
+        response_format,
+    )
 
 
 class AddTasksParams(BaseModel):
     tasks: List[AddTaskParams]
 
 
-@mcp.tool("AddTasks")
-def mcp_add_tasks(garden: Garden, params: AddTasksParams) -> Garden:
+@_tool("AddTasks")
+def mcp_add_tasks(
+    params: AddTasksParams,
+    garden: Optional[GardenDoc] = None,
+    session_id: Optional[str] = None,
+    response_format: ResponseFormat = "garden",
+) -> GardenDoc | SessionResult | GardenPatch:
     """
     Adds multiple tasks to the garden at once. Validates at the end.
     """
-    try:
-        for task_params in params.tasks:
-            garden = add_task(garden, task_params)
-        issues = validate_garden(garden)
-        if issues:
-            raise GardenValidationException(issues)
-        return garden
-    except GardenValidationException as e:
-        raise _validation_error(e)
-    except ValueError as e:
-        raise McpError(ErrorData(message=str(e), code=INVALID_REQUEST))
+
+    return _mutate(
+        garden,
+        session_id,
+        _batch(params.tasks),
+        f"Added {len(params.tasks)} tasks.",
+        response_format,
+    )
 
 
 @mcp.resource(
     uri="json://garden-schema",
     description="get json schema for gardens.",
+    mime_type="application/json",
 )
-def get_json_schema_garden():
-    return Garden.model_json_schema()
+def get_json_schema_garden() -> str:
+    return garden_schema_json().decode("utf-8")
 
 
-@mcp.tool("ViewGarden")
-def view_garden(garden: Garden) -> str:
+@_tool("ViewGarden")
+def view_garden(
+    garden: Optional[GardenDoc] = None, session_id: Optional[str] = None
+) -> str:
     """
     Open a visualization for the garden in the user's default browser.
     Does not return the URL to the LLM, just true/false for success.
+    With GROWKIT_LIVE_VIEWER=1, a session's garden opens in a live viewer
+    that shows later changes as they are made; call this once per session.
     """
+    global _live
     try:
         URL = os.environ["VIEWER_URL"]
     except KeyError:
@@ -348,14 +866,23 @@ def view_garden(garden: Garden) -> str:
                 code=INVALID_REQUEST,
             )
         )
-    garden_json = json.dumps(garden.model_dump(mode="json"), separators=(",", ":"))
-    compressed = zlib.compress(garden_json.encode("utf-8"), level=9)
-    b64 = base64.urlsafe_b64encode(compressed).decode("ascii")
-    url = f"{URL}?data={quote(b64)}"
+    garden = _resolve_garden(garden, session_id)
+    from growkit_mcp.viewer import open_viewer, viewer_origin
+
     try:
-        webbrowser.open_new_tab(url)
+        if session_id is not None:
+            from growkit_mcp import live
+
+            if live.live_enabled():
+                _live = live.live_server(viewer_origin(URL))
+                if not live.open_live_viewer(_live, URL, session_id, garden):
+                    return "The garden is already open in the live viewer."
+                return "URL has been successfully opened!"
+        open_viewer(URL, garden)
         return "URL has been successfully opened!"
-    except Exception as e:
+    # Browser, socket and encoding failures all go back to the client as a
+    # tool error rather than crashing the server.
+    except Exception as e:  # noqa: BLE001
         raise McpError(
             ErrorData(
                 message=f"{e}",
@@ -0,0 +1,63 @@
+from typing import Dict, List, Literal, Optional
+from uuid import uuid4
+
+from growkit_core.models import Garden
+from growkit_core.patch import PatchOperation
+from pydantic import BaseModel
+
+# "garden" returns the whole mutated garden, "patch" an RFC 6902 JSON Patch.
+ResponseFormat = Literal["garden", "patch"]
+
+
+class SessionInfo(BaseModel):
+    session_id: str
+    garden_id: str
+    garden_name: str
+
+
+class SessionResult(BaseModel):
+    session_id: str
+    message: str
+    created_ids: List[str] = []
+    patch: Optional[List[PatchOperation]] = None
+
+
+class GardenPatch(BaseModel):
+    garden_id: str
+    patch: List[PatchOperation]
+
+
+class SessionStore:
+    """
+    In-process store of gardens keyed by session id, so tools can operate on a
+    server-held garden instead of receiving and returning the whole document.
+    """
+
+    def __init__(self):
+        self._gardens: Dict[str, Garden] = {}
+
+    def open(self, garden: Garden) -> str:
+        session_id = str(uuid4())
+        self._gardens[session_id] = garden
+        return session_id
+
+    def get(self, session_id: str) -> Garden:
+        try:
+            return self._gardens[session_id]
+        except KeyError:
+            raise KeyError(f"No garden session with id '{session_id}'")
+
+    def replace(self, session_id: str, garden: Garden) -> None:
+        self.get(session_id)
+        self._gardens[session_id] = garden
+
+    def close(self, session_id: str) -> Garden:
+        garden = self.get(session_id)
+        del self._gardens[session_id]
+        return garden
+
+    def info(self, session_id: str) -> SessionInfo:
+        garden = self.get(session_id)
+        return SessionInfo(
+            session_id=session_id, garden_id=garden.id, garden_name=garden.name
+        )
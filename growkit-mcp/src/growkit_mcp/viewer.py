@@ -0,0 +1,198 @@
+import base64
+import json
+import secrets
+import threading
+import time
+import webbrowser
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from growkit_core.models import Garden
+
+# Imported by the ViewGarden tool on first use, so the encoders and the
+# browser machinery stay off the server's startup path.
+
+# Positions are rounded to this many decimals (millimeters for meter beds),
+# far below what the viewer can draw.
+POSITION_DECIMALS = 3
+# zlib level 6 compresses the compact JSON within a few percent of level 9 at
+# a fraction of the time on large gardens; see benchmarks/bench_viewer.py.
+COMPRESSION_LEVEL = 6
+# Longer URLs are handed to the viewer over loopback HTTP instead: Windows
+# truncates command lines (and so webbrowser's URLs) past 32767 characters,
+# and some browsers refuse URLs well before their documented limits.
+MAX_URL_LENGTH = 32_000
+# How long a handed-off garden stays downloadable, so reloading the tab works.
+# A token can be fetched any number of times until then.
+HANDOFF_TTL = 600.0
+
+
+def _quantize(position: List[float]) -> List[float]:
+    return [round(v, POSITION_DECIMALS) for v in position]
+
+
+def _drop(doc: Dict[str, Any], key: str, default: Any) -> None:
+    if doc.get(key, default) == default:
+        doc.pop(key, None)
+
+
+def compact_garden(garden: Garden) -> Dict[str, Any]:
+    """
+    The viewer's compact form of `garden`: fields that are None, empty or at
+    their default are dropped, positions are quantized, and each planting's
+    species is an index into a shared "species" table. The viewer expands it
+    back into a plain garden (growkit-web's decodeGarden).
+    """
+    doc = garden.model_dump(mode="json", exclude_none=True)
+    species: Dict[str, int] = {}
+    _drop(doc, "metadata", {})
+    for bed in doc["beds"]:
+        _drop(bed, "metadata", {})
+        _drop(bed["dimensions"], "unit", "m")
+        if "position" in bed:
+            bed["position"] = _quantize(bed["position"])
+        for planting in bed["plantings"]:
+            _drop(planting, "metadata", {})
+            planting["position"] = _quantize(planting["position"])
+            planting["species"] = species.setdefault(planting["species"], len(species))
+    for task in doc["tasks"]:
+        _drop(task, "status", "pending")
+    return {"compact": 1, "species": list(species), "garden": doc}
+
+
+def compress_garden(garden: Garden) -> bytes:
+    """The compact form as zlib-compressed JSON."""
+    data = json.dumps(compact_garden(garden), separators=(",", ":"))
+    return zlib.compress(data.encode("utf-8"), level=COMPRESSION_LEVEL)
+
+
+def encode_garden(garden: Garden) -> str:
+    """compress_garden, base64url-encoded for the viewer's ?data= parameter."""
+    return base64.urlsafe_b64encode(compress_garden(garden)).decode("ascii")
+
+
+# ---------- Loopback handoff ----------
+
+
+def viewer_origin(base_url: str) -> str:
+    """The origin of the viewer pages under `base_url`, as browsers send it."""
+    parts = urlsplit(base_url)
+    if parts.scheme not in ("http", "https"):
+        return "null"  # file: pages have an opaque origin
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class HandoffHandler(BaseHTTPRequestHandler):
+    server: "HandoffServer"
+
+    def _cors(self) -> None:
+        # Only the configured viewer may read the responses; other pages
+        # that learn a token URL get nothing readable.
+        self.send_header("Access-Control-Allow-Origin", self.server.origin)
+        self.send_header("Vary", "Origin")
+        # Lets pages served from a public origin fetch from loopback in
+        # browsers that enforce Private Network Access.
+        self.send_header("Access-Control-Allow-Private-Network", "true")
+
+    def do_OPTIONS(self) -> None:
+        self.send_response(204)
+        self._cors()
+        self.send_header("Access-Control-Allow-Methods", "GET")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        payload = self.server.payload(self.path.rsplit("/", 1)[-1])
+        if payload is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self._cors()
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # stdout/stderr belong to the MCP stdio transport.
+        pass
+
+
+class HandoffServer(ThreadingHTTPServer):
+    """
+    Serves compressed gardens that are too large for a URL on 127.0.0.1,
+    each under an unguessable path that expires after HANDOFF_TTL seconds.
+    Browsers let only pages from `origin` (see viewer_origin) read them.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, origin: str, ttl: float = HANDOFF_TTL):
+        super().__init__(("127.0.0.1", 0), HandoffHandler)
+        self.origin = origin
+        self.ttl = ttl
+        self._payloads: Dict[str, Tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def offer(self, payload: bytes) -> str:
+        """Stores `payload` and returns the URL it can be fetched from."""
+        token = secrets.token_urlsafe(16)
+        now = time.monotonic()
+        with self._lock:
+            self._payloads = {
+                t: entry for t, entry in self._payloads.items() if entry[1] > now
+            }
+            self._payloads[token] = (payload, now + self.ttl)
+        return f"{self.base_url}/garden/{token}"
+
+    def payload(self, token: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._payloads.get(token)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+
+_handoff: Optional[HandoffServer] = None
+_handoff_lock = threading.Lock()
+
+
+def handoff_server(origin: str) -> HandoffServer:
+    """
+    The process's handoff server, started on first use, serving the viewer
+    at `origin`.
+    """
+    global _handoff
+    with _handoff_lock:
+        if _handoff is None:
+            _handoff = HandoffServer(origin)
+            threading.Thread(
+                target=_handoff.serve_forever, name="growkit-viewer", daemon=True
+            ).start()
+        _handoff.origin = origin
+        return _handoff
+
+
+def viewer_link(base_url: str, garden: Garden) -> str:
+    """
+    The URL that opens `garden` in the viewer: inline in ?data= when it fits
+    in MAX_URL_LENGTH, otherwise ?src= pointing at the loopback handoff.
+    """
+    payload = compress_garden(garden)
+    data = base64.urlsafe_b64encode(payload).decode("ascii")
+    url = f"{base_url}?data={quote(data)}"
+    if len(url) <= MAX_URL_LENGTH:
+        return url
+    src = handoff_server(viewer_origin(base_url)).offer(payload)
+    return f"{base_url}?src={quote(src, safe='')}"
+
+
+def open_viewer(base_url: str, garden: Garden) -> None:
+    webbrowser.open_new_tab(viewer_link(base_url, garden))
@@ -0,0 +1,58 @@
+import asyncio
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Number of worker threads running tool calls. Unset means the
+# ThreadPoolExecutor default, min(32, CPU count + 4).
+WORKERS_ENV = "GROWKIT_MCP_WORKERS"
+
+
+def worker_count() -> Optional[int]:
+    value = os.environ.get(WORKERS_ENV)
+    if not value:
+        return None
+    count = int(value)
+    if count < 1:
+        raise ValueError(f"{WORKERS_ENV} must be at least 1, got {count}")
+    return count
+
+
+class WorkerPool:
+    """
+    Runs blocking tool calls on a thread pool so the server's event loop keeps
+    serving other requests. Calls for the same garden id run one at a time, in
+    the order they arrived; calls for different gardens run concurrently.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="growkit-mcp"
+        )
+        # A lock lives as long as a call holds or waits on it.
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def lock(self, garden_id: str) -> asyncio.Lock:
+        lock = self._locks.get(garden_id)
+        if lock is None:
+            lock = self._locks[garden_id] = asyncio.Lock()
+        return lock
+
+    async def run(
+        self, garden_id: Optional[str], fn: Callable[..., T], *args, **kwargs
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        call = partial(fn, *args, **kwargs)
+        if garden_id is None:
+            return await loop.run_in_executor(self._executor, call)
+        async with self.lock(garden_id):
+            return await loop.run_in_executor(self._executor, call)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
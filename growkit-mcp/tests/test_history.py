@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from growkit_core.api import AddBedParams, CreateGardenParams
+from mcp.shared.exceptions import McpError
+
+from growkit_mcp.server import (
+    mcp_add_bed,
+    mcp_branch_garden_session,
+    mcp_close_garden_session,
+    mcp_create_garden_session,
+    mcp_get_session_garden,
+    mcp_redo_garden,
+    mcp_undo_garden,
+)
+
+
+def call(tool, **kwargs):
+    return asyncio.run(tool(**kwargs))
+
+
+def add_bed(session_id: str, name: str) -> None:
+    call(
+        mcp_add_bed,
+        params=AddBedParams(name=name, width=1.0, length=1.0),
+        session_id=session_id,
+    )
+
+
+def bed_names(session_id: str):
+    garden = call(mcp_get_session_garden, session_id=session_id)
+    return [bed.name for bed in garden.beds]
+
+
+@pytest.fixture
+def session_id():
+    info = call(mcp_create_garden_session, params=CreateGardenParams(name="Plot"))
+    yield info.session_id
+    call(mcp_close_garden_session, session_id=info.session_id)
+
+
+def test_undo_and_redo(session_id):
+    add_bed(session_id, "A")
+    add_bed(session_id, "B")
+
+    result = call(mcp_undo_garden, session_id=session_id)
+    assert result.message == "Undid: Added bed 'B'."
+    assert bed_names(session_id) == ["A"]
+    call(mcp_undo_garden, session_id=session_id)
+    assert bed_names(session_id) == []
+    with pytest.raises(McpError, match="Nothing to undo"):
+        call(mcp_undo_garden, session_id=session_id)
+
+    result = call(mcp_redo_garden, session_id=session_id)
+    assert result.message == "Redid: Added bed 'A'."
+    call(mcp_redo_garden, session_id=session_id)
+    assert bed_names(session_id) == ["A", "B"]
+    with pytest.raises(McpError, match="Nothing to redo"):
+        call(mcp_redo_garden, session_id=session_id)
+
+
+def test_new_mutation_clears_redo(session_id):
+    add_bed(session_id, "A")
+    add_bed(session_id, "B")
+    call(mcp_undo_garden, session_id=session_id)
+    add_bed(session_id, "C")
+
+    with pytest.raises(McpError, match="Nothing to redo"):
+        call(mcp_redo_garden, session_id=session_id)
+    assert bed_names(session_id) == ["A", "C"]
+    call(mcp_undo_garden, session_id=session_id)
+    assert bed_names(session_id) == ["A"]
+
+
+def test_branch_diverges_from_parent(session_id):
+    add_bed(session_id, "A")
+    branch = call(mcp_branch_garden_session, session_id=session_id).session_id
+    try:
+        add_bed(branch, "Branch")
+        add_bed(session_id, "Parent")
+        assert bed_names(session_id) == ["A", "Parent"]
+        assert bed_names(branch) == ["A", "Branch"]
+
+        # Each session has its own history; the branch starts with none.
+        call(mcp_undo_garden, session_id=branch)
+        assert bed_names(branch) == ["A"]
+        with pytest.raises(McpError, match="Nothing to undo"):
+            call(mcp_undo_garden, session_id=branch)
+        assert bed_names(session_id) == ["A", "Parent"]
+    finally:
+        call(mcp_close_garden_session, session_id=branch)
+
+
+def test_history_of_unknown_session():
+    with pytest.raises(McpError, match="No garden session"):
+        call(mcp_undo_garden, session_id="missing")
+    with pytest.raises(McpError, match="No garden session"):
+        call(mcp_branch_garden_session, session_id="missing")
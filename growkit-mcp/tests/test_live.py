@@ -0,0 +1,139 @@
+import base64
+import http.client
+import json
+import threading
+import zlib
+from typing import Tuple
+from urllib.parse import urlsplit
+
+import pytest
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    CreateGardenParams,
+    RemovePlantingParams,
+    add_bed,
+    add_planting,
+    create_garden,
+    remove_planting,
+)
+from growkit_core.history import snapshot
+from growkit_core.models import Garden
+from growkit_core.patch import apply_patch, diff_gardens
+
+from growkit_mcp.live import LiveViewerServer
+from growkit_mcp.viewer import compact_garden
+
+ORIGIN = "http://viewer.test"
+
+
+@pytest.fixture
+def server():
+    server = LiveViewerServer(ORIGIN)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def subscribe(url: str) -> http.client.HTTPResponse:
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=5)
+    connection.request("GET", parts.path, headers={"Origin": ORIGIN})
+    return connection.getresponse()
+
+
+def read_event(response: http.client.HTTPResponse) -> Tuple[str, str]:
+    fields = {}
+    while True:
+        line = response.readline().decode("utf-8").rstrip("\n")
+        if line.startswith(":"):  # keepalive
+            continue
+        if not line:
+            if fields:
+                return fields["event"], fields["data"]
+            continue
+        key, _, value = line.partition(": ")
+        fields[key] = value
+
+
+def publish(server: LiveViewerServer, garden: Garden, mutate) -> None:
+    before = snapshot(garden)
+    mutate(garden)
+    server.publish("session", diff_gardens(before, garden), garden)
+
+
+def test_streamed_patches_rebuild_the_garden(server):
+    garden = create_garden(CreateGardenParams(name="Live"))
+    add_bed(garden, AddBedParams(name="North", width=2.0, length=2.0))
+    bed_id = garden.beds[0].id
+    response = subscribe(server.watch("session", garden))
+    assert response.status == 200
+    assert response.getheader("Access-Control-Allow-Origin") == ORIGIN
+    assert response.getheader("Content-Type") == "text/event-stream"
+
+    event, data = read_event(response)
+    assert event == "garden"
+    compact = json.loads(zlib.decompress(base64.urlsafe_b64decode(data)))
+    assert compact == compact_garden(garden)
+    viewed = Garden.model_validate(garden.model_dump())
+
+    publish(
+        server,
+        garden,
+        lambda g: add_planting(
+            g, AddPlantingParams(bed_id=bed_id, species="Kale", position=(0.5, 0.5))
+        ),
+    )
+    publish(
+        server,
+        garden,
+        lambda g: add_bed(g, AddBedParams(name="South", width=1.0, length=1.0)),
+    )
+    publish(
+        server,
+        garden,
+        lambda g: remove_planting(
+            g, RemovePlantingParams(bed_id=bed_id, planting_index=0)
+        ),
+    )
+    for _ in range(3):
+        event, data = read_event(response)
+        assert event == "patch"
+        apply_patch(viewed, json.loads(data))
+    assert viewed == garden
+
+
+def test_closed_session_ends_stream(server):
+    garden = create_garden(CreateGardenParams(name="Live"))
+    url = server.watch("session", garden)
+    response = subscribe(url)
+    assert read_event(response)[0] == "garden"
+
+    server.close_session("session")
+    assert read_event(response)[0] == "closed"
+    assert subscribe(url).status == 404
+
+
+def test_dropped_viewer_is_asked_to_resync(server):
+    garden = create_garden(CreateGardenParams(name="Live"))
+    url = server.watch("session", garden)
+    response = subscribe(url)
+    assert read_event(response)[0] == "garden"
+
+    # As if the viewer had fallen MAX_PENDING events behind.
+    server._channels["session"].viewers[0].dropped = True
+    publish(
+        server,
+        garden,
+        lambda g: add_bed(g, AddBedParams(name="North", width=2.0, length=2.0)),
+    )
+    events = [read_event(response)[0] for _ in range(2)]
+    assert events == ["patch", "resync"]
+    assert response.readline() == b""
+
+    # Reconnecting starts over from the current garden.
+    event, data = read_event(subscribe(url))
+    assert event == "garden"
+    compact = json.loads(zlib.decompress(base64.urlsafe_b64decode(data)))
+    assert compact == compact_garden(garden)
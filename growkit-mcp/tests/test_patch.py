@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    CreateGardenParams,
+    add_bed,
+    create_garden,
+)
+from growkit_core.models import Garden
+from growkit_core.patch import apply_patch
+from mcp.shared.exceptions import McpError
+
+from growkit_mcp.server import (
+    AddPlantingsParams,
+    mcp_add_bed,
+    mcp_add_plantings,
+    mcp_close_garden_session,
+    mcp_open_garden_session,
+)
+from growkit_mcp.sessions import GardenPatch
+
+
+def call(tool, **kwargs):
+    return asyncio.run(tool(**kwargs))
+
+
+def make_garden() -> Garden:
+    garden = create_garden(CreateGardenParams(name="Plot"))
+    add_bed(garden, AddBedParams(name="North", width=2.0, length=2.0))
+    return garden
+
+
+def copy(garden: Garden) -> Garden:
+    return Garden.model_validate(garden.model_dump())
+
+
+def test_stateless_patch_response():
+    garden = make_garden()
+    viewed = copy(garden)
+    result = call(
+        mcp_add_bed,
+        params=AddBedParams(name="South", width=1.0, length=1.0),
+        garden=garden,
+        response_format="patch",
+    )
+    assert isinstance(result, GardenPatch)
+    assert result.garden_id == garden.id
+    assert [op.op for op in result.patch] == ["add"]
+    assert apply_patch(viewed, result.patch) == garden
+
+
+def test_session_patch_response():
+    garden = make_garden()
+    viewed = copy(garden)
+    session_id = call(mcp_open_garden_session, garden=garden).session_id
+    bed_id = garden.beds[0].id
+    params = AddPlantingsParams(
+        plantings=[
+            AddPlantingParams(bed_id=bed_id, species="Kale", position=(0.5, 0.5)),
+            AddPlantingParams(bed_id=bed_id, species="Bean", position=(1.5, 1.5)),
+        ]
+    )
+    result = call(
+        mcp_add_plantings,
+        params=params,
+        session_id=session_id,
+        response_format="patch",
+    )
+    assert len(result.created_ids) == 2
+    apply_patch(viewed, result.patch)
+    assert viewed == call(mcp_close_garden_session, session_id=session_id)
+
+
+def test_failed_mutation_returns_no_patch():
+    garden = make_garden()
+    before = garden.model_dump()
+    params = AddPlantingsParams(
+        plantings=[
+            AddPlantingParams(
+                bed_id=garden.beds[0].id, species="Kale", position=(0.5, 0.5)
+            ),
+            AddPlantingParams(
+                bed_id=garden.beds[0].id, species="Kale", position=(9.0, 9.0)
+            ),
+        ]
+    )
+    with pytest.raises(McpError, match="outside the boundaries"):
+        call(mcp_add_plantings, params=params, garden=garden, response_format="patch")
+    assert garden.model_dump() == before
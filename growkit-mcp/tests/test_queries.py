@@ -0,0 +1,118 @@
+import asyncio
+from datetime import date
+
+import pytest
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    CreateGardenParams,
+    add_bed,
+    add_planting,
+    add_task,
+    create_garden,
+)
+from growkit_core.models import Garden, TaskStatus
+from growkit_core.queries import BedQuery, PlantingQuery, TaskQuery
+from mcp.shared.exceptions import McpError
+
+from growkit_mcp.server import (
+    mcp_close_garden_session,
+    mcp_garden_stats,
+    mcp_get_bed,
+    mcp_list_beds,
+    mcp_list_plantings,
+    mcp_open_garden_session,
+    mcp_query_tasks,
+)
+
+
+def call(tool, **kwargs):
+    return asyncio.run(tool(**kwargs))
+
+
+def make_garden() -> Garden:
+    garden = create_garden(CreateGardenParams(name="Plot"))
+    add_bed(garden, AddBedParams(name="North", width=2.0, length=2.0))
+    add_bed(garden, AddBedParams(name="South", width=1.0, length=1.0))
+    for i in range(5):
+        add_planting(
+            garden,
+            AddPlantingParams(
+                bed_id=garden.beds[0].id,
+                species="Kale" if i % 2 else "Bean",
+                position=(0.3 * i + 0.1, 0.5),
+                spacing=0.1,
+            ),
+        )
+    for day in (3, 1, 2):
+        add_task(
+            garden,
+            AddTaskParams(title=f"Day {day}", target_date=date(2030, 5, day)),
+        )
+    return garden
+
+
+@pytest.fixture
+def session_id():
+    info = call(mcp_open_garden_session, garden=make_garden())
+    yield info.session_id
+    call(mcp_close_garden_session, session_id=info.session_id)
+
+
+def test_get_bed_pages_plantings(session_id):
+    garden = make_garden()
+    bed = garden.beds[0]
+    detail = call(mcp_get_bed, bed_id=bed.id, limit=2, garden=garden)
+    assert detail.name == "North" and detail.planting_count == 5
+    assert detail.plantings == bed.plantings[:2]
+    assert detail.next_offset == 2
+    last = call(mcp_get_bed, bed_id=bed.id, offset=4, garden=garden)
+    assert last.plantings == bed.plantings[4:] and last.next_offset is None
+
+    with pytest.raises(McpError, match="No bed found"):
+        call(mcp_get_bed, bed_id="missing", session_id=session_id)
+
+
+def test_list_beds(session_id):
+    page = call(mcp_list_beds, query=BedQuery(limit=1), session_id=session_id)
+    assert [bed.name for bed in page.beds] == ["North"]
+    assert page.beds[0].planting_count == 5 and page.beds[0].area == 4.0
+    assert page.total == 2 and page.next_offset == 1
+
+
+def test_list_plantings(session_id):
+    page = call(
+        mcp_list_plantings,
+        query=PlantingQuery(species="kale", limit=1),
+        session_id=session_id,
+    )
+    assert [p.species for p in page.plantings] == ["Kale"]
+    assert page.total == 2 and page.next_offset == 1
+
+    with pytest.raises(McpError, match="No bed found"):
+        call(
+            mcp_list_plantings,
+            query=PlantingQuery(bed_id="missing"),
+            session_id=session_id,
+        )
+
+
+def test_query_tasks(session_id):
+    page = call(
+        mcp_query_tasks,
+        query=TaskQuery(start=date(2030, 5, 2), status=[TaskStatus.pending]),
+        session_id=session_id,
+    )
+    assert [task.title for task in page.tasks] == ["Day 2", "Day 3"]
+    assert page.total == 2 and page.next_offset is None
+
+
+def test_garden_stats(session_id):
+    stats = call(mcp_garden_stats, session_id=session_id)
+    assert stats.bed_count == 2 and stats.planting_count == 5
+    assert stats.task_count == 3
+    assert stats.plantings_by_species == {"Bean": 3, "Kale": 2}
+    assert stats.bed_area == 5.0 and stats.density == 1.0
+    north = call(mcp_list_beds, query=BedQuery(limit=1), session_id=session_id)
+    assert stats.densest_bed_id == north.beds[0].id
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from growkit_core.api import (
+    AddBedParams,
+    AddPlantingParams,
+    AddTaskParams,
+    CreateGardenParams,
+    create_garden,
+)
+from mcp.shared.exceptions import McpError
+
+from growkit_mcp import server
+from growkit_mcp.server import (
+    AddBedsParams,
+    mcp_add_bed,
+    mcp_add_beds,
+    mcp_add_planting,
+    mcp_add_task,
+    mcp_close_garden_session,
+    mcp_create_garden_session,
+    mcp_get_session_garden,
+    mcp_open_garden_session,
+)
+
+
+def call(tool, **kwargs):
+    return asyncio.run(tool(**kwargs))
+
+
+def test_open_and_close_session():
+    garden = create_garden(CreateGardenParams(name="Plot"))
+    info = call(mcp_open_garden_session, garden=garden)
+    assert info.garden_id == garden.id and info.garden_name == "Plot"
+    assert call(mcp_get_session_garden, session_id=info.session_id) is garden
+
+    assert call(mcp_close_garden_session, session_id=info.session_id) is garden
+    with pytest.raises(McpError, match="No garden session"):
+        call(mcp_get_session_garden, session_id=info.session_id)
+
+
+def test_session_mutations_edit_the_held_garden():
+    info = call(mcp_create_garden_session, params=CreateGardenParams(name="Plot"))
+    garden = server.sessions.get(info.session_id)
+
+    result = call(
+        mcp_add_bed,
+        params=AddBedParams(name="North", width=2.0, length=2.0),
+        session_id=info.session_id,
+    )
+    bed_id = garden.beds[0].id
+    assert result.session_id == info.session_id
+    assert result.message == "Added bed 'North'."
+    assert result.created_ids == [bed_id]
+    assert result.patch is None
+
+    result = call(
+        mcp_add_planting,
+        params=AddPlantingParams(bed_id=bed_id, species="Kale", position=(1, 1)),
+        session_id=info.session_id,
+    )
+    # Session edits copy-on-write whatever the undo history shares.
+    assert result.created_ids == [garden.beds[0].plantings[0].id]
+    result = call(
+        mcp_add_task,
+        params=AddTaskParams(title="Water", target_date="2030-05-01"),
+        session_id=info.session_id,
+    )
+    assert result.created_ids == [garden.tasks[0].id]
+    call(mcp_close_garden_session, session_id=info.session_id)
+
+
+def test_batch_reports_every_created_id():
+    info = call(mcp_create_garden_session, params=CreateGardenParams(name="Plot"))
+    result = call(
+        mcp_add_beds,
+        params=AddBedsParams(
+            beds=[AddBedParams(name=name, width=1, length=1) for name in "ABC"]
+        ),
+        session_id=info.session_id,
+    )
+    garden = call(mcp_close_garden_session, session_id=info.session_id)
+    assert result.created_ids == [bed.id for bed in garden.beds]
+    assert len(result.created_ids) == 3
+
+
+def test_failed_session_mutation_leaves_garden_unchanged():
+    info = call(mcp_create_garden_session, params=CreateGardenParams(name="Plot"))
+    call(
+        mcp_add_bed,
+        params=AddBedParams(name="North", width=2.0, length=2.0),
+        session_id=info.session_id,
+    )
+    garden = server.sessions.get(info.session_id)
+    before = garden.model_dump()
+
+    with pytest.raises(McpError, match="No bed with id 'missing'"):
+        call(
+            mcp_add_planting,
+            params=AddPlantingParams(bed_id="missing", species="Kale", position=(0, 0)),
+            session_id=info.session_id,
+        )
+    assert garden.model_dump() == before
+    call(mcp_close_garden_session, session_id=info.session_id)
+
+
+def test_unknown_or_closed_session_is_rejected():
+    params = AddBedParams(name="North", width=2.0, length=2.0)
+    with pytest.raises(McpError, match="No garden session with id 'missing'"):
+        call(mcp_add_bed, params=params, session_id="missing")
+    with pytest.raises(McpError, match="No garden session"):
+        call(mcp_close_garden_session, session_id="missing")
+
+    info = call(mcp_create_garden_session, params=CreateGardenParams(name="Plot"))
+    call(mcp_close_garden_session, session_id=info.session_id)
+    with pytest.raises(McpError, match="No garden session"):
+        call(mcp_add_bed, params=params, session_id=info.session_id)
+
+
+def test_exactly_one_of_garden_or_session():
+    garden = create_garden(CreateGardenParams(name="Plot"))
+    params = AddBedParams(name="North", width=2.0, length=2.0)
+    info = call(mcp_open_garden_session, garden=garden)
+    for kwargs in ({}, {"garden": garden, "session_id": info.session_id}):
+        with pytest.raises(McpError, match="Exactly one of"):
+            call(mcp_add_bed, params=params, **kwargs)
+    call(mcp_close_garden_session, session_id=info.session_id)
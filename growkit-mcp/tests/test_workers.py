@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from growkit_core.api import AddBedParams, CreateGardenParams, create_garden
+
+from growkit_mcp import server
+from growkit_mcp.workers import WORKERS_ENV, WorkerPool, worker_count
+
+
+class Tracker:
+    """Counts how many tracked calls run at once."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.most = 0
+
+    def work(self, seconds: float = 0.05) -> str:
+        with self._lock:
+            self.active += 1
+            self.most = max(self.most, self.active)
+        time.sleep(seconds)
+        with self._lock:
+            self.active -= 1
+        return threading.current_thread().name
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(4)
+    yield pool
+    pool.shutdown()
+
+
+def run_all(pool: WorkerPool, keys, fn, *args):
+    async def main():
+        return await asyncio.gather(*(pool.run(key, fn, *args) for key in keys))
+
+    return asyncio.run(main())
+
+
+def test_calls_run_on_worker_threads(pool):
+    names = run_all(pool, ["a", None], Tracker().work)
+    assert all(name.startswith("growkit-mcp") for name in names)
+
+
+def test_same_garden_is_serialized(pool):
+    tracker = Tracker()
+    run_all(pool, ["a"] * 4, tracker.work)
+    assert tracker.most == 1
+
+
+def test_same_garden_keeps_arrival_order(pool):
+    order = []
+
+    def record(i):
+        time.sleep(0.01)
+        order.append(i)
+
+    async def main():
+        await asyncio.gather(*(pool.run("a", record, i) for i in range(8)))
+
+    asyncio.run(main())
+    assert order == list(range(8))
+
+
+def test_different_gardens_run_concurrently(pool):
+    # Each call waits for the other: only passes if they overlap.
+    barrier = threading.Barrier(2, timeout=5)
+    run_all(pool, ["a", "b"], barrier.wait)
+
+    tracker = Tracker()
+    run_all(pool, ["a", "b", None], tracker.work, 0.2)
+    assert tracker.most == 3
+
+
+def test_exceptions_propagate_and_release_the_garden(pool):
+    def fail():
+        raise ValueError("boom")
+
+    async def main():
+        with pytest.raises(ValueError, match="boom"):
+            await pool.run("a", fail)
+        return await pool.run("a", lambda: "next")
+
+    assert asyncio.run(main()) == "next"
+
+
+def test_worker_count_from_environment(monkeypatch):
+    monkeypatch.delenv(WORKERS_ENV, raising=False)
+    assert worker_count() is None
+    monkeypatch.setenv(WORKERS_ENV, "3")
+    assert worker_count() == 3
+    monkeypatch.setenv(WORKERS_ENV, "0")
+    with pytest.raises(ValueError, match=WORKERS_ENV):
+        worker_count()
+
+
+def test_one_worker_runs_one_call_at_a_time(monkeypatch):
+    monkeypatch.setenv(WORKERS_ENV, "1")
+    pool = WorkerPool(worker_count())
+    try:
+        tracker = Tracker()
+        run_all(pool, ["a", "b", None], tracker.work)
+        assert tracker.most == 1
+    finally:
+        pool.shutdown()
+
+
+def test_tools_are_keyed_by_garden():
+    garden = create_garden(CreateGardenParams(name="Plot"))
+    info = asyncio.run(server.mcp_open_garden_session(garden=garden))
+    try:
+        assert server._garden_key({"session_id": info.session_id}) == garden.id
+        assert server._garden_key({"garden": garden}) == garden.id
+        assert server._garden_key({"session_id": "missing"}) is None
+        assert server._garden_key({}) is None
+
+        async def add_beds():
+            await asyncio.gather(
+                *(
+                    server.mcp_add_bed(
+                        params=AddBedParams(name=f"Bed {i}", width=1, length=1),
+                        session_id=info.session_id,
+                    )
+                    for i in range(5)
+                )
+            )
+
+        asyncio.run(add_beds())
+        assert [bed.name for bed in garden.beds] == [f"Bed {i}" for i in range(5)]
+    finally:
+        asyncio.run(server.mcp_close_garden_session(session_id=info.session_id))
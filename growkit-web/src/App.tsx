@@ -11,47 +11,31 @@ import {
   NavigationMenuList,
   NavigationMenuItem,
 } from "@/components/ui/navigation-menu";
-import pako from "pako";
-
-function base64UrlToUint8Array(base64: string): Uint8Array {
-  base64 = base64.replace(/-/g, "+").replace(/_/g, "/");
-  while (base64.length % 4) base64 += "=";
-  const raw = atob(base64);
-  const arr = new Uint8Array(raw.length);
-  for (let i = 0; i < raw.length; ++i) arr[i] = raw.charCodeAt(i);
-  return arr;
-}
-
-function decodeGardenFromQuery(): Garden | null {
-  const params = new URLSearchParams(window.location.search);
-  const data = params.get("data");
-  if (!data) return null;
-  try {
-    const bytes = base64UrlToUint8Array(data);
-    const decompressed = pako.inflate(bytes, { to: "string" });
-    return JSON.parse(decompressed);
-  } catch (e) {
-    console.error("Failed to decode garden from URL:", e);
-    return null;
-  }
-}
+import { followLiveGarden, loadGardenFromQuery } from "@/lib/garden-data";
 
 export default function App() {
   const [view, setView] = useState<"garden" | "tasks">("garden");
   const [garden, setGarden] = useState<Garden | null>(null);
   const [error, setError] = useState<string | null>(null);
+  const [notice, setNotice] = useState<string | null>(null);
 
   useEffect(() => {
-    try {
-      const g = decodeGardenFromQuery();
-      if (g && typeof g === "object" && g.name) {
-        setGarden(g);
-      } else {
-        setError("No valid garden data found in URL.");
-      }
-    } catch {
-      setError("An error occurred while loading the garden.");
+    const live = new URLSearchParams(window.location.search).get("live");
+    if (live) {
+      return followLiveGarden(live, setGarden, setNotice);
     }
+    loadGardenFromQuery()
+      .then((g) => {
+        if (g && typeof g === "object" && g.name) {
+          setGarden(g);
+        } else {
+          setError("No valid garden data found in URL.");
+        }
+      })
+      .catch((e) => {
+        console.error("Failed to load garden from URL:", e);
+        setError("An error occurred while loading the garden.");
+      });
   }, []);
 
   if (error || !garden) {
@@ -61,7 +45,7 @@ export default function App() {
         <h1 className="text-2xl font-bold mb-2">Gardener-AI Viewer</h1>
         <div className="bg-white rounded-lg px-6 py-4 shadow text-center max-w-lg">
           <p className="text-lg font-medium text-red-600 mb-2">
-            {error ? error : "No garden data found."}
+            {error ?? notice ?? "No garden data found."}
           </p>
           <p className="text-gray-700 mb-4">
             This page expects a compressed garden definition in the{" "}
@@ -113,6 +97,11 @@ export default function App() {
           </NavigationMenuList>
         </NavigationMenu>
       </header>
+      {notice && (
+        <div className="bg-amber-100 text-amber-900 text-sm text-center px-8 py-2">
+          {notice}
+        </div>
+      )}
 
       <main className="flex-1 flex flex-col items-center gap-6 p-6">
         <div className="w-full max-w-4xl flex flex-col gap-3">
@@ -0,0 +1,144 @@
+import pako from "pako";
+import { type Garden } from "@/types/growkit";
+
+// Compact form written by growkit-mcp's viewer.compact_garden: fields that
+// are null, empty or at their default are omitted, and planting species are
+// indexes into `species`.
+type CompactGarden = {
+  compact: number;
+  species: string[];
+  garden: Record<string, any>;
+};
+
+function base64UrlToUint8Array(base64: string): Uint8Array {
+  base64 = base64.replace(/-/g, "+").replace(/_/g, "/");
+  while (base64.length % 4) base64 += "=";
+  const raw = atob(base64);
+  const arr = new Uint8Array(raw.length);
+  for (let i = 0; i < raw.length; ++i) arr[i] = raw.charCodeAt(i);
+  return arr;
+}
+
+function expandGarden({ species, garden }: CompactGarden): Garden {
+  garden.metadata ??= {};
+  garden.beds ??= [];
+  garden.tasks ??= [];
+  for (const bed of garden.beds) {
+    bed.metadata ??= {};
+    bed.plantings ??= [];
+    bed.dimensions.unit ??= "m";
+    for (const planting of bed.plantings) {
+      planting.species = species[planting.species];
+      planting.metadata ??= {};
+    }
+  }
+  for (const task of garden.tasks) {
+    task.status ??= "pending";
+  }
+  return garden as Garden;
+}
+
+// Inflates zlib-compressed garden JSON, in either the compact or the plain
+// form.
+export function decodeGarden(bytes: Uint8Array): Garden {
+  const doc = JSON.parse(pako.inflate(bytes, { to: "string" }));
+  return "compact" in doc ? expandGarden(doc) : doc;
+}
+
+// RFC 6902 operations as produced by growkit-core's diff_gardens.
+export type PatchOperation = {
+  op: "add" | "remove" | "replace";
+  path: string;
+  value?: unknown;
+};
+
+// Returns a copy of `garden` with `patch` applied.
+export function applyPatch(garden: Garden, patch: PatchOperation[]): Garden {
+  const doc = structuredClone(garden) as Record<string, any>;
+  for (const { op, path, value } of patch) {
+    const tokens = path
+      .split("/")
+      .slice(1)
+      .map((t) => t.replace(/~1/g, "/").replace(/~0/g, "~"));
+    const key = tokens.pop()!;
+    const parent = tokens.reduce((node, token) => node[token], doc);
+    if (Array.isArray(parent)) {
+      const index = key === "-" ? parent.length : Number(key);
+      if (op === "add") parent.splice(index, 0, value);
+      else if (op === "remove") parent.splice(index, 1);
+      else parent[index] = value;
+    } else if (op === "remove") {
+      delete parent[key];
+    } else {
+      parent[key] = value;
+    }
+  }
+  return doc as Garden;
+}
+
+// Follows a growkit-mcp live viewer stream (?live=): `onGarden` gets the
+// whole garden on connect, and again after every change. If growkit-mcp asks
+// for a resync, the stream reconnects and starts over from the whole garden.
+// `onClosed` gets a
+// message once the stream ends, whether the session was closed or the
+// stream failed (an unknown token, or growkit-mcp went away); the garden
+// last passed to `onGarden` is then final. Returns a function that stops
+// following.
+export function followLiveGarden(
+  url: string,
+  onGarden: (garden: Garden) => void,
+  onClosed: (message: string) => void,
+): () => void {
+  let source: EventSource;
+  let garden: Garden | null = null;
+  const connect = () => {
+    source = new EventSource(url);
+    source.addEventListener("garden", (e) => {
+      garden = decodeGarden(base64UrlToUint8Array((e as MessageEvent).data));
+      onGarden(garden);
+    });
+    source.addEventListener("patch", (e) => {
+      if (!garden) return;
+      garden = applyPatch(garden, JSON.parse((e as MessageEvent).data));
+      onGarden(garden);
+    });
+    // Sent when this viewer fell too far behind and missed changes: start
+    // over from the full garden on a new stream.
+    source.addEventListener("resync", () => {
+      source.close();
+      connect();
+    });
+    source.addEventListener("closed", () => {
+      source.close();
+      onClosed("The garden session was closed. This is its final state.");
+    });
+    // The stream's tokens die with the growkit-mcp process, so reconnecting
+    // after an error cannot help: stop instead of retrying on stale data.
+    source.onerror = () => {
+      source.close();
+      onClosed(
+        garden
+          ? "Lost the connection to the live garden. This is its last known state."
+          : "The live garden is not available. Its session may have been closed.",
+      );
+    };
+  };
+  connect();
+  return () => source.close();
+}
+
+// Loads the garden named by the page URL: inline in ?data=, or, for gardens
+// too large for a URL, fetched from the ?src= address growkit-mcp serves it
+// on.
+export async function loadGardenFromQuery(): Promise<Garden | null> {
+  const params = new URLSearchParams(window.location.search);
+  const data = params.get("data");
+  if (data) return decodeGarden(base64UrlToUint8Array(data));
+  const src = params.get("src");
+  if (!src) return null;
+  const response = await fetch(src);
+  if (!response.ok) {
+    throw new Error(`Fetching the garden failed: ${response.status}`);
+  }
+  return decodeGarden(new Uint8Array(await response.arrayBuffer()));
+}